@@ -0,0 +1,215 @@
+"""Compare the transport backends against a local HTTP/2-capable server.
+
+Runs the same workload through the default sync transport (``requests``),
+the default async transport (``aiohttp``) and the HTTP/2 transport
+(``httpx``, sync and async) against a local Hypercorn server that speaks
+both HTTP/1.1 and h2 (prior knowledge, no TLS). Besides throughput and
+latency percentiles it reports how many TCP connections the server saw for
+each run, which is where h2 multiplexing shows up.
+
+Needs ``pip install httpx[http2] hypercorn``::
+
+    python benchmarks/bench_transports.py --requests 2000 --concurrency 100 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jm_networking  # noqa: E402
+from jm_networking import AsyncNetworking, Http2Transport, JmNetwork, NetworkError  # noqa: E402
+from run import summarize  # noqa: E402
+
+
+class _App:
+    """ASGI app returning ``payload_size`` bytes after ``latency`` seconds."""
+
+    def __init__(self, latency, payload_size):
+        self.latency = latency
+        self.body = b"x" * payload_size
+        self.clients = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        self.clients.add(tuple(scope.get("client") or ()))
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", str(len(self.body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class H2Server:
+
+    def __init__(self, latency=0.0, payload_size=1024, port=0):
+        self.app = _App(latency, payload_size)
+        self.port = port or _free_port()
+        self._loop = None
+        self._stop = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        config = Config()
+        config.bind = [f"127.0.0.1:{self.port}"]
+        config.loglevel = "WARNING"
+        config.accesslog = None
+        config.h2_max_concurrent_streams = 1000
+        # Hypercorn sends GOAWAY after 1000 requests on a connection by
+        # default, which would fail the streams still in flight on it.
+        config.keep_alive_max_requests = 1_000_000
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._stop = asyncio.Event()
+            self._loop.call_soon(ready.set)
+            self._loop.run_until_complete(serve(self.app, config, shutdown_trigger=self._stop.wait))
+
+        self._thread = threading.Thread(target=run, name="h2-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        _wait_for_port(self.port)
+        return self
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=5)
+
+    def take_connection_count(self):
+        count = len(self.app.clients)
+        self.app.clients.clear()
+        return count
+
+
+def _free_port():
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, timeout=10):
+    import socket
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+def run_sync(url, requests_count, concurrency):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(_):
+        nonlocal errors
+        t0 = time.perf_counter()
+        try:
+            JmNetwork.get(url)
+        except NetworkError:
+            with lock:
+                errors += 1
+        latencies.append(time.perf_counter() - t0)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(concurrency)))
+        latencies.clear()
+        errors = 0
+        started = time.perf_counter()
+        list(pool.map(one, range(requests_count)))
+        duration = time.perf_counter() - started
+    return latencies, duration, errors
+
+
+async def run_async(url, requests_count, concurrency, transport):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncNetworking(transport=transport) as client:
+        async def one():
+            nonlocal errors
+            async with semaphore:
+                t0 = time.perf_counter()
+                try:
+                    await client.get(url)
+                except NetworkError:
+                    errors += 1
+                latencies.append(time.perf_counter() - t0)
+
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+        latencies.clear()
+        errors = 0
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests_count)))
+        duration = time.perf_counter() - started
+    return latencies, duration, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare jm-networking transports against a local h2 server.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    parser.add_argument("--output", help="Write JSON results to this path instead of stdout.")
+    args = parser.parse_args(argv)
+
+    server = H2Server(latency=args.latency, payload_size=args.payload_size).start()
+    url = f"{server.base_url}/bytes"
+    params = {"concurrency": args.concurrency, "latency": args.latency, "payload_size": args.payload_size}
+    results = []
+    try:
+        runs = [
+            ("sync_requests", "requests", lambda: run_sync(url, args.requests, args.concurrency)),
+            ("sync_http2", Http2Transport(http1=False), lambda: run_sync(url, args.requests, args.concurrency)),
+            ("async_aiohttp", None, lambda: asyncio.run(run_async(url, args.requests, args.concurrency, "aiohttp"))),
+            ("async_http2", None, lambda: asyncio.run(run_async(url, args.requests, args.concurrency, Http2Transport(http1=False)))),
+        ]
+        for name, sync_transport, run in runs:
+            if sync_transport is not None:
+                jm_networking.set_transport(sync_transport)
+            server.take_connection_count()
+            latencies, duration, errors = run()
+            result = summarize(name, params, latencies, duration, errors)
+            result["connections"] = server.take_connection_count()
+            results.append(result)
+    finally:
+        jm_networking.set_transport("requests")
+        server.stop()
+
+    report = json.dumps({"results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Benchmark suite for jm-networking.
+
+Starts a local stand-in server and measures throughput and latency
+percentiles for the sync, async, object and rate limiting paths. Results
+are written as JSON so runs from different releases can be compared::
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --only async_get --latency 0.005
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from marshmallow_dataclass import dataclass  # noqa: E402
+
+from jm_networking import (  # noqa: E402
+    AsyncNetworking,
+    JmNetwork,
+    NetworkError,
+    ObjectNetworking,
+    RateLimitedNetworking,
+    _TokenBucket,
+)
+from jm_networking.base_schema import BaseSchema  # noqa: E402
+from server import StandInServer  # noqa: E402
+
+
+@dataclass(base_schema=BaseSchema)
+class BenchTodo:
+    id: Optional[int] = None
+    userId: Optional[int] = None
+    title: Optional[str] = None
+    completed: Optional[bool] = None
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def summarize(name, params, latencies, duration, errors=0):
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "name": name,
+        "params": params,
+        "requests": count,
+        "errors": errors,
+        "duration": duration,
+        "throughput": count / duration if duration > 0 else None,
+        "latency": {
+            "mean": sum(latencies) / count if count else None,
+            "p50": percentile(latencies, 0.50),
+            "p90": percentile(latencies, 0.90),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+def bench_jmnetwork_get(base_url, config):
+    url = f"{base_url}/bytes?size={config.payload_size}"
+    for _ in range(config.warmup):
+        JmNetwork.get(url)
+
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(config.requests):
+        t0 = time.perf_counter()
+        try:
+            JmNetwork.get(url)
+        except NetworkError:
+            errors += 1
+        latencies.append(time.perf_counter() - t0)
+    duration = time.perf_counter() - started
+    return [summarize("jmnetwork_get", {"payload_size": config.payload_size}, latencies, duration, errors)]
+
+
+async def _async_get_run(url, requests_count, concurrency):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncNetworking() as client:
+        async def one():
+            nonlocal errors
+            async with semaphore:
+                t0 = time.perf_counter()
+                try:
+                    await client.get(url)
+                except NetworkError:
+                    errors += 1
+                latencies.append(time.perf_counter() - t0)
+
+        await asyncio.gather(*(one() for _ in range(min(concurrency, requests_count))))
+        latencies.clear()
+        errors = 0
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests_count)))
+        duration = time.perf_counter() - started
+    return latencies, duration, errors
+
+
+def bench_async_get(base_url, config):
+    url = f"{base_url}/bytes?size={config.payload_size}"
+    results = []
+    for concurrency in config.concurrency:
+        latencies, duration, errors = asyncio.run(_async_get_run(url, config.requests, concurrency))
+        params = {"payload_size": config.payload_size, "concurrency": concurrency}
+        results.append(summarize("async_get", params, latencies, duration, errors))
+    return results
+
+
+def bench_object_get(base_url, config):
+    results = []
+    for count in config.list_sizes:
+        url = f"{base_url}/items?count={count}&latency=0"
+        ObjectNetworking.get(url, BenchTodo)
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(config.object_repeats):
+            t0 = time.perf_counter()
+            _, objects = ObjectNetworking.get(url, BenchTodo)
+            latencies.append(time.perf_counter() - t0)
+            if len(objects) != count:
+                raise RuntimeError(f"Expected {count} objects, got {len(objects)}")
+        duration = time.perf_counter() - started
+        result = summarize("object_get", {"list_size": count}, latencies, duration)
+        result["objects_per_second"] = count * len(latencies) / duration if duration > 0 else None
+        results.append(result)
+    return results
+
+
+def bench_object_get_processes(base_url, config):
+    # Each worker process fetches and deserializes whole lists, so objects per
+    # second should grow with the process count until the cores run out.
+    import multiprocessing
+
+    from jm_networking import ProcessFetcher
+
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    count = config.list_sizes[0]
+    urls = [f"{base_url}/items?count={count}&latency=0"] * (config.object_repeats * 8)
+    results = []
+    for processes in config.processes:
+        with ProcessFetcher(processes=processes, batch_size=1, start_method=start_method) as fetcher:
+            list(fetcher.fetch(urls[:processes], BenchTodo))
+            started = time.perf_counter()
+            fetched = list(fetcher.fetch(urls, BenchTodo, ordered=False))
+            duration = time.perf_counter() - started
+        errors = sum(1 for result in fetched if not result.ok)
+        result = summarize("object_get_processes", {"list_size": count, "processes": processes}, [], duration, errors)
+        # Per-request latency isn't observable across processes; report throughput only.
+        result["requests"] = len(fetched)
+        result["throughput"] = len(fetched) / duration if duration > 0 else None
+        result["objects_per_second"] = count * (len(fetched) - errors) / duration if duration > 0 else None
+        results.append(result)
+    return results
+
+
+def bench_rate_limited_get(base_url, config):
+    url = f"{base_url}/bytes?size={config.payload_size}"
+    client = RateLimitedNetworking(max_retries=5, max_requests_per_second=0, timeout=0)
+
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(config.requests):
+        t0 = time.perf_counter()
+        try:
+            client.get(url)
+        except NetworkError:
+            errors += 1
+        latencies.append(time.perf_counter() - t0)
+    duration = time.perf_counter() - started
+    params = {"payload_size": config.payload_size, "inject_429_every": config.inject_429_every}
+    return [summarize("rate_limited_get", params, latencies, duration, errors)]
+
+
+def bench_token_bucket(base_url, config):
+    results = []
+    per_thread = config.bucket_acquires
+    for threads in config.threads:
+        bucket = _TokenBucket(rate=1e12, capacity=1e12)
+        barrier = threading.Barrier(threads + 1)
+        thread_latencies = [[] for _ in range(threads)]
+
+        def worker(samples):
+            barrier.wait()
+            for _ in range(per_thread):
+                t0 = time.perf_counter()
+                bucket.acquire()
+                samples.append(time.perf_counter() - t0)
+
+        workers = [threading.Thread(target=worker, args=(samples,)) for samples in thread_latencies]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        duration = time.perf_counter() - started
+
+        latencies = [value for samples in thread_latencies for value in samples]
+        results.append(summarize("token_bucket", {"threads": threads}, latencies, duration))
+    return results
+
+
+BENCHMARKS = {
+    "jmnetwork_get": bench_jmnetwork_get,
+    "async_get": bench_async_get,
+    "object_get": bench_object_get,
+    "object_get_processes": bench_object_get_processes,
+    "rate_limited_get": bench_rate_limited_get,
+    "token_bucket": bench_token_bucket,
+}
+
+
+def _int_list(value):
+    return [int(item) for item in value.split(",") if item]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the jm-networking benchmark suite.")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--output", help="Write JSON results to this path instead of stdout.")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per sync/async run.")
+    parser.add_argument("--warmup", type=int, default=20, help="Warmup requests before measuring.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server-side latency in seconds.")
+    parser.add_argument("--payload-size", type=int, default=1024, help="Response size in bytes for /bytes.")
+    parser.add_argument("--inject-429-every", type=int, default=10, help="Answer every Nth request with 429 (rate_limited_get only).")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 10, 50, 100], help="Comma separated async concurrency levels.")
+    parser.add_argument("--list-sizes", type=_int_list, default=[1000, 100000], help="Comma separated list sizes for object_get.")
+    parser.add_argument("--object-repeats", type=int, default=3, help="Repetitions per list size.")
+    parser.add_argument("--processes", type=_int_list, default=[1, 2, 4], help="Comma separated process counts for object_get_processes.")
+    parser.add_argument("--threads", type=_int_list, default=[1, 2, 4, 8, 16], help="Comma separated thread counts for token_bucket.")
+    parser.add_argument("--bucket-acquires", type=int, default=20000, help="Token acquires per thread.")
+    return parser.parse_args(argv)
+
+
+def run(config):
+    results = []
+    for name in config.only or list(BENCHMARKS):
+        inject = config.inject_429_every if name == "rate_limited_get" else 0
+        with StandInServer(latency=config.latency, payload_size=config.payload_size, inject_429_every=inject) as server:
+            results.extend(BENCHMARKS[name](server.base_url, config))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "jm_networking": _package_version(),
+            "config": {key: value for key, value in vars(config).items() if key != "output"},
+        },
+        "results": results,
+    }
+
+
+def _package_version():
+    try:
+        from importlib.metadata import version
+        return version("jm-networking")
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    config = parse_args(argv)
+    report = json.dumps(run(config), indent=2)
+    if config.output:
+        with open(config.output, "w") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
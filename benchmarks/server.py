@@ -0,0 +1,115 @@
+"""Local stand-in HTTP server used by the benchmark suite.
+
+Endpoints:
+
+- ``/bytes?size=N``  -- ``N`` bytes of ``text/plain``
+- ``/items?count=N`` -- a JSON array of ``N`` todo objects
+
+Every endpoint accepts ``latency=<seconds>`` to override the server-wide
+latency. Every ``inject_429_every``-th request (counted server-wide) is
+answered with ``429 Too Many Requests`` and ``Retry-After: 0``.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def make_items(count):
+    return [
+        {"id": i, "userId": i % 10, "title": f"todo item {i}", "completed": i % 2 == 0}
+        for i in range(count)
+    ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        latency = float(query.get("latency", server.latency))
+        if latency > 0:
+            time.sleep(latency)
+
+        if server.should_inject_429():
+            self._send(429, b"rate limited", "text/plain", {"Retry-After": "0"})
+            return
+
+        if parts.path == "/bytes":
+            size = int(query.get("size", server.payload_size))
+            self._send(200, b"x" * size, "text/plain")
+        elif parts.path == "/items":
+            count = int(query.get("count", 1))
+            self._send(200, server.items_body(count), "application/json")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, payload_size=1024, inject_429_every=0):
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.payload_size = payload_size
+        self.inject_429_every = inject_429_every
+        self._counter = 0
+        self._counter_lock = threading.Lock()
+        self._items_cache = {}
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def should_inject_429(self):
+        if not self.inject_429_every:
+            return False
+        with self._counter_lock:
+            self._counter += 1
+            return self._counter % self.inject_429_every == 0
+
+    def items_body(self, count):
+        body = self._items_cache.get(count)
+        if body is None:
+            body = json.dumps(make_items(count)).encode("utf-8")
+            self._items_cache[count] = body
+        return body
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
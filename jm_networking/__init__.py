@@ -1,26 +1,61 @@
+import gzip
+import hashlib
+import importlib
 import json
 
-import asyncio
 import inspect
 import random
 import requests
+import urllib3
 import logging
+import os
 import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
 from functools import lru_cache
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from urllib.parse import urlsplit
 
-from marshmallow_dataclass import class_schema
-
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
+from jm_networking.columnar import to_columns
+from jm_networking.compact import compact_class, compact_schema
+from jm_networking.connectors import SHARED_CONNECTORS, ConnectorRegistry
+from jm_networking.dns import RESOLVER_STATS, DnsCache, DnsCachingAdapter
+from jm_networking.negative_cache import NegativeCache
+from jm_networking.object_cache import ObjectCache
+from jm_networking.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    Page,
+    aiterate_pages,
+    iterate_pages,
+    resolve_strategy,
+)
+from jm_networking.profiling import PipelineProfiler
+from jm_networking.projection import Projection, project
+from jm_networking.retry_budget import RetryBudget
+from jm_networking.timeouts import Timeout, TimeoutPolicy, resolve_timeout_policy
+from jm_networking.transport import (
+    AiohttpTransport,
+    Http2Transport,
+    RequestsTransport,
+    UnixSocketAdapter,
+    _unix_socket_key,
+    resolve_transport,
+)
+from jm_networking.upload import DEFAULT_CHUNK_SIZE, UploadBody
+from jm_networking.warmup import KeepAliveRefresher, normalize_host, warm_pool
 
 _SESSION = None
 _SESSION_LOCK = threading.Lock()
+_TRANSPORT = RequestsTransport()
+_DNS_CACHE = None
+_HAPPY_EYEBALLS_DELAY = 0.25
+_KEEPALIVE = None
+_TIMEOUT_POLICY = TimeoutPolicy()
 
 
 def _get_session():
@@ -28,13 +63,503 @@ def _get_session():
     if _SESSION is None:
         with _SESSION_LOCK:
             if _SESSION is None:
-                _SESSION = requests.Session()
+                _SESSION = _TRANSPORT.create_session(
+                    dns_cache=_DNS_CACHE,
+                    happy_eyeballs_delay=_HAPPY_EYEBALLS_DELAY,
+                    stats=_SYNC_STATS,
+                )
     return _SESSION
 
 
+def set_transport(transport):
+    """Switch the sync clients to ``transport`` ("requests", "http2" or a transport object)."""
+    global _SESSION, _TRANSPORT
+    with _SESSION_LOCK:
+        _TRANSPORT = resolve_transport(transport, RequestsTransport())
+        session, _SESSION = _SESSION, None
+    if session is not None and hasattr(session, "close"):
+        session.close()
+
+
+def set_dns_cache(dns_cache, happy_eyeballs_delay=0.25):
+    """Resolve through ``dns_cache`` in the sync clients and new ``AsyncNetworking`` clients.
+
+    Pass ``None`` to go back to resolving on every new connection.
+    """
+    global _SESSION, _DNS_CACHE, _HAPPY_EYEBALLS_DELAY
+    with _SESSION_LOCK:
+        _DNS_CACHE = dns_cache
+        _HAPPY_EYEBALLS_DELAY = happy_eyeballs_delay
+        session, _SESSION = _SESSION, None
+    if session is not None and hasattr(session, "close"):
+        session.close()
+
+
+def set_timeout_policy(policy):
+    """Set the default timeouts for the sync clients and new ``AsyncNetworking`` clients.
+
+    Takes a ``TimeoutPolicy``, a ``Timeout``/dict of phases, a number (total
+    seconds) or ``None`` to go back to the built-in defaults.
+    """
+    global _TIMEOUT_POLICY
+    _TIMEOUT_POLICY = resolve_timeout_policy(policy, TimeoutPolicy())
+    return _TIMEOUT_POLICY
+
+
+def _apply_timeout(kwargs, url, policy, transport):
+    timeout = kwargs.get("timeout")
+    if timeout is None:
+        timeout = policy.for_url(url)
+    if isinstance(timeout, Timeout):
+        convert = getattr(transport, "request_timeout", None)
+        if convert is None:
+            kwargs.pop("timeout", None)
+        else:
+            kwargs["timeout"] = convert(timeout)
+
+
+def mount_unix_socket(host, socket_path):
+    """Send sync requests for ``http://host/...`` over the Unix socket at ``socket_path``."""
+    global _SESSION
+    with _SESSION_LOCK:
+        unix_sockets = getattr(_TRANSPORT, "unix_sockets", None)
+        if unix_sockets is None:
+            raise ValueError(f"The {_TRANSPORT.name} transport does not support Unix sockets")
+        unix_sockets[_unix_socket_key(host)] = socket_path
+        session, _SESSION = _SESSION, None
+    if session is not None and hasattr(session, "close"):
+        session.close()
+
+
+def _reset_after_fork():
+    # A forked child must not share the parent's pooled sockets or a lock that
+    # may have been held mid-fork; it builds its own session on first use.
+    global _SESSION, _SESSION_LOCK, _KEEPALIVE
+    _SESSION = None
+    _SESSION_LOCK = threading.Lock()
+    _KEEPALIVE = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# aiohttp and marshmallow_dataclass are only needed by AsyncNetworking and
+# ObjectNetworking, so they are imported on first use rather than with the
+# package. Both stay reachable as module attributes (``jm_networking.aiohttp``,
+# ``jm_networking.class_schema``) through ``__getattr__``.
+_SUBMODULE_ATTRS = {
+    "AsyncEngine": "jm_networking.engine",
+    "EndpointGroup": "jm_networking.balancer",
+    "FetchResult": "jm_networking.processes",
+    "ProcessFetcher": "jm_networking.processes",
+    "PriorityClass": "jm_networking.scheduler",
+    "RequestScheduler": "jm_networking.scheduler",
+}
+
+
+def __getattr__(name):
+    if name == "aiohttp":
+        try:
+            import aiohttp as module
+        except ImportError:
+            module = None
+        globals()["aiohttp"] = module
+        return module
+    if name == "class_schema":
+        from marshmallow_dataclass import class_schema as module
+        globals()["class_schema"] = module
+        return module
+    if name in _SUBMODULE_ATTRS:
+        # These submodules build on the classes below, so they can't be imported up front.
+        import importlib
+
+        module = getattr(importlib.import_module(_SUBMODULE_ATTRS[name]), name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _class_schema():
+    try:
+        return class_schema
+    except NameError:
+        return __getattr__("class_schema")
+
+
 @lru_cache(maxsize=256)
-def _schema_class_for(cls):
-    return class_schema(cls)
+def _schema_class_for(cls, compact=None):
+    schema_cls = _class_schema()(cls)
+    if compact is None:
+        return schema_cls
+    return compact_schema(schema_cls, compact_class(cls, compact))
+
+
+def _resolve_compact(value, default):
+    if value is False:
+        return None
+    return default if value is None else value
+
+
+def _projection(cls, only, exclude):
+    if only is None and exclude is None:
+        return None
+
+    def key(value):
+        if value is None or isinstance(value, (type, str)):
+            return value
+        return tuple(value)
+
+    return project(cls, key(only), key(exclude))
+
+
+def _load_schema(cls, many, compact=None, projection=None):
+    if projection is None:
+        return _schema_class_for(cls, compact)(many=many)
+    return _schema_class_for(projection.target, compact)(many=many, unknown="exclude")
+
+
+def _projected_params(params, projection):
+    name = ObjectNetworking.projection_param
+    if projection is None or name is None:
+        return params
+    params = dict(params or {})
+    params.setdefault(name, projection.query_value)
+    return params
+
+
+def _request_url(url, params):
+    prepared = requests.models.PreparedRequest()
+    prepared.prepare_url(url, params)
+    return prepared.url
+
+
+_CREDENTIAL_HEADERS = ("authorization", "proxy-authorization", "cookie")
+
+
+def _credentials_key(headers, auth, vary):
+    """Digest of the per-call credentials (and ``cache_vary``), so cached objects aren't shared across callers."""
+    values = sorted(
+        (name.lower(), value) for name, value in (headers or {}).items() if name.lower() in _CREDENTIAL_HEADERS
+    )
+    if auth is not None:
+        values.append(("auth", tuple(auth)))
+    if vary is not None:
+        values.append(("vary", vary))
+    if not values:
+        return None
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()
+
+
+def _cacheable_auth(auth):
+    # An auth object can't be told apart from another caller's.
+    return auth is None or isinstance(auth, tuple)
+
+
+def _negative_cache_key(url, params, credentials):
+    return _request_url(url, params), credentials
+
+
+def _object_cache_key(url, params, class_object, compact, projection, credentials):
+    target = projection.target if projection is not None else None
+    return _request_url(url, params), class_object, compact, target, credentials
+
+
+def _source_class(obj):
+    cls = obj.__class__
+    return getattr(cls, "__jm_source__", cls)
+
+
+_NO_STAGE = nullcontext()
+
+
+def _stage(call, name):
+    if call is None:
+        return _NO_STAGE
+    return call.stage(name)
+
+
+def _payload_size(response):
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return None
+
+
+class ClientStats:
+    """Thread-safe counters reported by a client.
+
+    ``snapshot()`` returns the raw counters plus derived compression ratios.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, value=1):
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+
+    def get(self, name, default=0):
+        with self._lock:
+            return self._values.get(name, default)
+
+    def snapshot(self):
+        with self._lock:
+            values = dict(self._values)
+        if values.get("request_bytes_compressed"):
+            values["request_compression_ratio"] = values["request_bytes_raw"] / values["request_bytes_compressed"]
+        if values.get("response_bytes_wire"):
+            values["response_compression_ratio"] = values["response_bytes_decoded"] / values["response_bytes_wire"]
+        return values
+
+    def reset(self):
+        with self._lock:
+            self._values = {}
+
+
+_SYNC_STATS = ClientStats()
+
+
+def _zstd_compressor():
+    try:
+        import zstandard
+    except ImportError:
+        pass
+    else:
+        return lambda body, level: zstandard.ZstdCompressor(level=level if level is not None else 3).compress(body)
+    try:
+        from compression import zstd
+    except ImportError:
+        return None
+    return lambda body, level: zstd.compress(body, level=level)
+
+
+class RequestCompression:
+    """Opt-in compression of request bodies.
+
+    Bodies smaller than ``min_size`` bytes are sent as-is. ``encoding`` is
+    ``"gzip"`` or ``"zstd"`` (the latter needs ``zstandard`` or Python 3.14+).
+    """
+
+    ENCODINGS = ("gzip", "zstd")
+
+    def __init__(self, encoding="gzip", min_size=1024, level=None):
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unsupported request encoding: {encoding}")
+        if encoding == "zstd":
+            self._zstd = _zstd_compressor()
+            if self._zstd is None:
+                raise RuntimeError("zstandard is required for zstd request compression. Install zstandard to use it.")
+        self.encoding = encoding
+        self.min_size = min_size
+        self.level = level
+
+    def compress(self, body):
+        if self.encoding == "gzip":
+            return gzip.compress(body, compresslevel=self.level if self.level is not None else 6)
+        return self._zstd(body, self.level)
+
+
+def _resolve_compression(value, default):
+    if value is None:
+        return default
+    if value is False:
+        return None
+    if value is True:
+        return RequestCompression()
+    if isinstance(value, str):
+        return RequestCompression(encoding=value)
+    return value
+
+
+def _compress_body(kwargs, compression, stats):
+    """Compress a ``json=`` or bytes/str ``data=`` body in ``kwargs`` in place."""
+    if compression is None:
+        return
+    content_type = None
+    if kwargs.get("json") is not None:
+        body = json.dumps(kwargs["json"]).encode("utf-8")
+        content_type = "application/json"
+    elif isinstance(kwargs.get("data"), (bytes, bytearray)):
+        body = bytes(kwargs["data"])
+    elif isinstance(kwargs.get("data"), str):
+        body = kwargs["data"].encode("utf-8")
+    else:
+        return
+    if len(body) < compression.min_size:
+        return
+
+    cpu_start = time.thread_time()
+    compressed = compression.compress(body)
+    stats.add("request_compress_cpu", time.thread_time() - cpu_start)
+    stats.add("requests_compressed")
+    stats.add("request_bytes_raw", len(body))
+    stats.add("request_bytes_compressed", len(compressed))
+
+    headers = dict(kwargs.get("headers") or {})
+    headers["Content-Encoding"] = compression.encoding
+    if content_type is not None:
+        headers.setdefault("Content-Type", content_type)
+    kwargs.pop("json", None)
+    kwargs["data"] = compressed
+    kwargs["headers"] = headers
+
+
+def _inflate(body):
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        # Some servers send raw deflate streams without the zlib header.
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+def _brotli_decoder():
+    for module in ("brotli", "brotlicffi"):
+        try:
+            return importlib.import_module(module).decompress
+        except ImportError:
+            pass
+    return None
+
+
+def _zstd_decoder():
+    try:
+        import zstandard
+    except ImportError:
+        pass
+    else:
+        return lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    for module in ("compression.zstd", "backports.zstd"):
+        try:
+            return importlib.import_module(module).decompress
+        except ImportError:
+            pass
+    return None
+
+
+def _response_decoder(encoding):
+    """Return a ``bytes -> bytes`` decoder for a ``Content-Encoding`` value, or None if one isn't available."""
+    steps = []
+    for coding in reversed([part.strip().lower() for part in encoding.split(",")]):
+        if coding in ("", "identity"):
+            continue
+        if coding in ("gzip", "x-gzip"):
+            steps.append(gzip.decompress)
+        elif coding == "deflate":
+            steps.append(_inflate)
+        elif coding == "br":
+            steps.append(_brotli_decoder())
+        elif coding == "zstd":
+            steps.append(_zstd_decoder())
+        else:
+            return None
+    if not steps or None in steps:
+        return None
+
+    def decode(body):
+        for step in steps:
+            body = step(body)
+        return body
+
+    return decode
+
+
+def _decode_response_body(stats, encoding, decoder, body):
+    cpu_start = time.thread_time()
+    decoded = decoder(body)
+    stats.add("response_decompress_cpu", time.thread_time() - cpu_start)
+    _record_response_encoding(stats, encoding, len(body), len(decoded))
+    return decoded
+
+
+def _read_body(response, url):
+    """Load a ``stream=True`` requests response, decompressing it here so the decode is timed."""
+    encoding = response.headers.get("Content-Encoding")
+    decoder = _response_decoder(encoding) if encoding else None
+    if decoder is None:
+        try:
+            content = response.content
+        except requests.exceptions.RequestException as ex:
+            # requests reports a read timeout in the body as a ConnectionError
+            # wrapping urllib3's ReadTimeoutError.
+            if isinstance(ex, requests.exceptions.Timeout) or (
+                ex.args and isinstance(ex.args[0], urllib3.exceptions.ReadTimeoutError)
+            ):
+                raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
+            raise TransportError("Network error", url=url, original=ex) from ex
+        if encoding:
+            _record_response_encoding(_SYNC_STATS, encoding, _wire_bytes(response), len(content))
+        return
+    try:
+        body = response.raw.read(decode_content=False)
+    except urllib3.exceptions.TimeoutError as ex:
+        raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
+    except (urllib3.exceptions.HTTPError, OSError) as ex:
+        raise TransportError("Network error", url=url, original=ex) from ex
+    if not body:
+        # HEAD, 204 and 304 responses carry the header without a body.
+        response._content = body
+    else:
+        try:
+            response._content = _decode_response_body(_SYNC_STATS, encoding, decoder, body)
+        except Exception as ex:
+            raise TransportError(f"Failed to decode {encoding} response body", url=url, original=ex) from ex
+    response._content_consumed = True
+
+
+def _record_response_encoding(stats, encoding, wire_bytes, decoded_bytes):
+    if not encoding or encoding == "identity" or wire_bytes is None or decoded_bytes is None:
+        return
+    stats.add("responses_compressed")
+    stats.add("response_bytes_wire", wire_bytes)
+    stats.add("response_bytes_decoded", decoded_bytes)
+
+
+def _wire_bytes(response):
+    raw = getattr(response, "raw", None)
+    if raw is not None and hasattr(raw, "tell"):
+        try:
+            return raw.tell()
+        except Exception:
+            pass
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def _send(method, url, compression=None, **kwargs):
+    _compress_body(kwargs, compression, _SYNC_STATS)
+    transport = _TRANSPORT
+    _apply_timeout(kwargs, url, _TIMEOUT_POLICY, transport)
+    stream = kwargs.get("stream", False)
+    # requests would decompress inside the call; stream instead and decode in
+    # _read_body so the decompression CPU time can be measured.
+    read_here = not stream and isinstance(transport, RequestsTransport)
+    if read_here:
+        kwargs["stream"] = True
+    try:
+        session = _get_session()
+        response = getattr(session, method)(url, **kwargs)
+    except transport.timeout_errors as ex:
+        raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
+    except transport.errors as ex:
+        raise TransportError("Network error", url=url, original=ex) from ex
+
+    if read_here and isinstance(response, requests.Response):
+        _read_body(response, url)
+        return response
+    if stream:
+        # The body hasn't been read yet; sizing it here would buffer it.
+        return response
+    headers = getattr(response, "headers", None)
+    if headers is not None and headers.get("Content-Encoding"):
+        _record_response_encoding(
+            _SYNC_STATS,
+            headers.get("Content-Encoding"),
+            _wire_bytes(response),
+            _payload_size(response),
+        )
+    return response
 
 
 class NetworkError(Exception):
@@ -64,6 +589,10 @@ class HttpError(NetworkError):
         self.response = response
         super().__init__(f"HTTP {status_code} for {url}")
 
+    def __reduce__(self):
+        # The default reduce calls cls(message), which doesn't fit __init__.
+        return self.__class__, (self.status_code, self.url), self.__dict__
+
 
 class HttpRedirectError(HttpError):
     """3xx responses (only if redirects are disabled)."""
@@ -125,6 +654,23 @@ class GatewayTimeoutError(HttpServerError):
     """504 Gateway Timeout."""
 
 
+class DownloadError(NetworkError):
+    """A download came back incomplete, corrupted, or the resource changed mid-way."""
+
+    def __init__(self, message, url=None):
+        self.url = url
+        super().__init__(message)
+
+
+class LoadShedError(NetworkError):
+    """A request was rejected by the scheduler: its queue was full or it waited past its deadline."""
+
+    def __init__(self, message, priority=None, reason=None):
+        self.priority = priority
+        self.reason = reason
+        super().__init__(message)
+
+
 def _is_success(status_code):
     return 200 <= status_code < 300
 
@@ -172,47 +718,46 @@ def _raise_for_status(status_code, url, body=None, response=None):
 class JmNetwork:
 
     logger = logging.getLogger()
+    stats = _SYNC_STATS
+    compression = None
+    negative_cache = None
 
     @staticmethod
     def get(url, is_json=False, params=None, **kwargs):
-        try:
-            session = _get_session()
-            request = session.get(url, params=params, **kwargs)
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+        negative_cache = JmNetwork.negative_cache
+        if not _cacheable_auth(kwargs.get("auth")):
+            negative_cache = None
+        if negative_cache is not None:
+            credentials = _credentials_key(kwargs.get("headers"), kwargs.get("auth"), None)
+            negative_key = _negative_cache_key(url, params, credentials)
+            negative_cache.check(negative_key)
+        request = _send("get", url, params=params, **kwargs)
         status_code = request.status_code
         text = request.text
-        _raise_for_status(status_code, url, text, response=request)
+        try:
+            _raise_for_status(status_code, url, text, response=request)
+        except HttpError as ex:
+            if negative_cache is not None:
+                negative_cache.record(negative_key, ex)
+            raise
         if is_json is False:
             return status_code, text
         payload = json.loads(text)
         return status_code, payload
 
     @staticmethod
-    def post(url, data=None, json=None, **kwargs):
-        try:
-            session = _get_session()
-            request = session.post(url, data=data, json=json, **kwargs)
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+    def post(url, data=None, json=None, compress=None, **kwargs):
+        compression = _resolve_compression(compress, JmNetwork.compression)
+        request = _send("post", url, compression=compression, data=data, json=json, **kwargs)
         status_code = request.status_code
         text = request.text
         _raise_for_status(status_code, url, text, response=request)
         return status_code, text
 
     @staticmethod
-    def put(url, data=None, **kwargs):
-        try:
-            session = _get_session()
-            request = session.put(url, data=data, **kwargs)
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+    def put(url, data=None, compress=None, **kwargs):
+        compression = _resolve_compression(compress, JmNetwork.compression)
+        request = _send("put", url, compression=compression, data=data, **kwargs)
         status_code = request.status_code
         text = request.text
         _raise_for_status(status_code, url, text, response=request)
@@ -220,43 +765,274 @@ class JmNetwork:
 
     @staticmethod
     def delete(url, **kwargs):
-        try:
-            session = _get_session()
-            request = session.delete(url, **kwargs)
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+        request = _send("delete", url, **kwargs)
         status_code = request.status_code
         text = request.text
         _raise_for_status(status_code, url, text, response=request)
         return status_code, text
 
+    @staticmethod
+    def upload(url, source, method="post", chunk_size=DEFAULT_CHUNK_SIZE, progress=None, **kwargs):
+        """Stream ``source`` as the request body without buffering it.
+
+        ``source`` is a file path, a binary file, a bytes-like buffer
+        (``memoryview``, ``mmap``, ...), an iterator of chunks or an
+        ``UploadBody``. ``progress(sent_bytes, total_bytes)`` is called after
+        every chunk; ``total_bytes`` is None for iterators, which are sent with
+        chunked transfer encoding.
+        """
+        method = method.lower()
+        if method not in ("post", "put"):
+            raise ValueError(f"Unsupported method: {method}")
+        body = source if isinstance(source, UploadBody) else UploadBody(source, chunk_size=chunk_size, progress=progress)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(body.headers)
+        headers.setdefault("Content-Type", "application/octet-stream")
+        request = _send(method, url, data=body, headers=headers, **kwargs)
+        status_code = request.status_code
+        text = request.text
+        _raise_for_status(status_code, url, text, response=request)
+        return status_code, text
+
+    @staticmethod
+    def submit(method, url, **kwargs):
+        """Send ``method url`` on the shared background event loop.
+
+        Returns a ``concurrent.futures.Future`` of ``(status, payload)``,
+        like ``AsyncNetworking``'s methods return. Many requests can be in
+        flight at once without a thread per request. See ``AsyncEngine``.
+        """
+        from jm_networking.engine import default_engine
+
+        return default_engine().submit(method, url, **kwargs)
+
+    @staticmethod
+    def shutdown_engine():
+        """Close the shared engine behind ``submit``; it restarts on the next call."""
+        from jm_networking.engine import shutdown_default_engine
+
+        shutdown_default_engine()
+
+    @staticmethod
+    def download(url, path, segments=4, checksum=None, chunk_size=1024 * 1024, progress=None, **kwargs):
+        """Download ``url`` to ``path`` without buffering the body in memory.
+
+        When the server supports ranges, ``segments`` byte ranges are fetched
+        in parallel into a preallocated file, and an interrupted download
+        resumes from ``<path>.jmdownload``. Otherwise a single streamed request
+        is used. ``checksum`` (``"sha256:<hex>"``) and the length are verified;
+        mismatches raise ``DownloadError``. Returns a ``DownloadResult``.
+        """
+        from jm_networking.download import download
+
+        return download(url, path, segments=segments, checksum=checksum, chunk_size=chunk_size, progress=progress, **kwargs)
+
+    @staticmethod
+    def warmup(hosts, connections=1, keepalive_interval=None, keepalive_path="/"):
+        """Open ``connections`` keep-alive connections per host and park them in the pool.
+
+        Returns ``{host_url: connections_ready}``. Failures are logged rather
+        than raised, so a missing host doesn't block startup. With
+        ``keepalive_interval`` set, the background refresher is started too.
+        """
+        session = _get_session()
+        warmed = {}
+        for host in hosts:
+            url = normalize_host(host)
+            warmed[url] = warm_pool(session, url, connections)
+        if keepalive_interval is not None:
+            JmNetwork.start_keepalive(hosts, interval=keepalive_interval, path=keepalive_path)
+        return warmed
+
+    @staticmethod
+    def start_keepalive(hosts, interval=30.0, path="/"):
+        """Send a ``HEAD path`` over each idle pooled connection every ``interval`` seconds."""
+        global _KEEPALIVE
+        JmNetwork.stop_keepalive()
+        _KEEPALIVE = KeepAliveRefresher(lambda: _get_session(), hosts, interval=interval, path=path).start()
+        return _KEEPALIVE
+
+    @staticmethod
+    def stop_keepalive():
+        global _KEEPALIVE
+        refresher, _KEEPALIVE = _KEEPALIVE, None
+        if refresher is not None:
+            refresher.stop()
+
+
+class WriteOutcome:
+    """Result of writing one object with ``ObjectNetworking.post_many``/``put_many``.
+
+    ``response`` is the response of the request that carried the object (shared
+    by the whole batch when batching); ``error`` is the ``NetworkError`` raised
+    for it, if any.
+    """
+
+    def __init__(self, obj, response=None, error=None):
+        self.obj = obj
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = self.response.status_code if self.response is not None else None
+        return f"WriteOutcome(ok={self.ok}, status={status}, error={self.error!r})"
+
 
 class ObjectNetworking:
 
+    profiler = None
+    stats = _SYNC_STATS
+    compression = None
+    compact = None
+    projection_param = None
+    object_cache = None
+
     @staticmethod
-    def get(url, class_object, params=None, **kwargs):
-        try:
-            session = _get_session()
-            request = session.get(url, params=params, **kwargs)
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+    def enable_profiling(slow_threshold=None, on_slow=None):
+        ObjectNetworking.profiler = PipelineProfiler(slow_threshold=slow_threshold, on_slow=on_slow)
+        return ObjectNetworking.profiler
+
+    @staticmethod
+    def disable_profiling():
+        ObjectNetworking.profiler = None
+
+    @staticmethod
+    def get(url, class_object, params=None, compact=None, only=None, exclude=None, **kwargs):
+        """GET ``url`` and load the JSON body into ``class_object`` instances.
+
+        ``compact`` (``"slots"`` or ``"tuple"``, default ``ObjectNetworking.compact``)
+        loads into a ``__dict__``-free variant of ``class_object`` instead; see
+        ``jm_networking.compact``. ``False`` turns it off for one call.
+
+        ``only``/``exclude`` (field names, or a lighter dataclass for ``only``)
+        load just those fields into a projected class and ignore the other
+        keys; see ``jm_networking.projection``. With
+        ``ObjectNetworking.projection_param`` set, the field list is also sent
+        as that query parameter.
+
+        With ``ObjectNetworking.object_cache`` set to an ``ObjectCache``, fresh
+        cached results are returned without a request and stale ones are
+        revalidated by ETag; a ``304`` returns the cached objects without
+        parsing or loading anything. Entries are kept apart per
+        ``Authorization``/``Cookie`` header, ``auth`` and ``cache_vary``
+        value; a non-tuple ``auth`` object bypasses the cache.
+        """
+        compact = _resolve_compact(compact, ObjectNetworking.compact)
+        projection = _projection(class_object, only, exclude)
+        params = _projected_params(params, projection)
+        cache = ObjectNetworking.object_cache
+        negative_cache = JmNetwork.negative_cache
+        vary = kwargs.pop("cache_vary", None)
+        auth = kwargs.get("auth")
+        credentials = None
+        if not _cacheable_auth(auth):
+            cache = negative_cache = None
+        elif cache is not None or negative_cache is not None:
+            credentials = _credentials_key(kwargs.get("headers"), auth, vary)
+        entry = None
+        if cache is not None:
+            cache_key = _object_cache_key(url, params, class_object, compact, projection, credentials)
+            entry = cache.lookup(cache_key)
+            if entry is not None:
+                if entry.fresh:
+                    return entry.status_code, cache.read(entry)
+                kwargs["headers"] = {**entry.conditional_headers(), **(kwargs.get("headers") or {})}
+        if negative_cache is not None:
+            negative_key = _negative_cache_key(url, params, credentials)
+            negative_cache.check(negative_key)
+
+        profiler = ObjectNetworking.profiler
+        call = profiler.call(class_object, url) if profiler is not None else None
+        with _stage(call, "network"):
+            request = _send("get", url, params=params, **kwargs)
+            text = request.text
         status_code = request.status_code
-        _raise_for_status(status_code, url, request.text, response=request)
-        data = request.json()
+        if status_code == 304 and entry is not None:
+            cache.renew(entry, request.headers)
+            if call is not None:
+                call.finish(payload_bytes=0, objects=0)
+            return entry.status_code, cache.read(entry, revalidated=True)
+        try:
+            _raise_for_status(status_code, url, text, response=request)
+        except HttpError as ex:
+            if negative_cache is not None:
+                negative_cache.record(negative_key, ex)
+            raise
+        with _stage(call, "parse"):
+            data = request.json()
 
         try:
             is_list = isinstance(data, list)
-            my_class_schema = _schema_class_for(class_object)(many=is_list)
-            deserialized = my_class_schema.load(data)
-            return status_code, deserialized
+            with _stage(call, "schema"):
+                my_class_schema = _load_schema(class_object, is_list, compact, projection)
+            with _stage(call, "load"):
+                deserialized = my_class_schema.load(data)
         except Exception as ex:
             logging.error("Error deserializing object  %s", url)
             raise ex
 
+        payload_bytes = _payload_size(request)
+        if cache is not None:
+            cache.store(cache_key, status_code, deserialized, request.headers, payload_bytes or len(text))
+        if call is not None:
+            call.finish(payload_bytes=payload_bytes, objects=len(data) if is_list else 1)
+        return status_code, deserialized
+
+    @staticmethod
+    def get_columns(url, class_object, params=None, layout="dict", string_dtype=None, **kwargs):
+        """Fetch a JSON array and return ``(status_code, columns)`` of NumPy arrays.
+
+        Columns are built straight from the parsed rows using the dataclass
+        field types, without creating an instance per row. ``layout`` is
+        ``"dict"`` or ``"structured"``; see ``jm_networking.columnar.to_columns``.
+        Needs numpy.
+        """
+        profiler = ObjectNetworking.profiler
+        call = profiler.call(class_object, url) if profiler is not None else None
+        with _stage(call, "network"):
+            request = _send("get", url, params=params, **kwargs)
+            text = request.text
+        status_code = request.status_code
+        _raise_for_status(status_code, url, text, response=request)
+        with _stage(call, "parse"):
+            rows = request.json()
+        with _stage(call, "load"):
+            columns = to_columns(rows, class_object, layout=layout, string_dtype=string_dtype)
+        if call is not None:
+            call.finish(payload_bytes=_payload_size(request), objects=len(rows) if isinstance(rows, list) else 1)
+        return status_code, columns
+
+    @staticmethod
+    def paginate(
+        url, class_object, strategy=None, params=None, prefetch=1, max_pages=None, compact=None, only=None,
+        exclude=None, **kwargs
+    ):
+        """Yield deserialized objects from every page of a list endpoint.
+
+        ``strategy`` is ``"link"`` (default), ``"cursor"``, ``"offset"`` or a
+        configured ``LinkHeaderPagination``/``CursorPagination``/
+        ``OffsetPagination``. A background thread fetches and deserializes up
+        to ``prefetch`` pages ahead of the consumer. ``compact``, ``only`` and
+        ``exclude`` are as for ``get``.
+        """
+        strategy = resolve_strategy(strategy)
+        projection = _projection(class_object, only, exclude)
+        params = _projected_params(params, projection)
+        schema = _load_schema(class_object, True, _resolve_compact(compact, ObjectNetworking.compact), projection)
+
+        def fetch(request):
+            response = _send("get", request.url, params=request.params or None, **kwargs)
+            _raise_for_status(response.status_code, request.url, response.text, response=response)
+            payload = response.json()
+            return Page(request, response.headers, payload, schema.load(strategy.items(payload)))
+
+        for page in iterate_pages(fetch, strategy, url, params, prefetch=prefetch, max_pages=max_pages):
+            yield from page.items
+
     @staticmethod
     def post(class_object, url, params, **kwargs):
         return ObjectNetworking._req(class_object=class_object, url=url, params=params, method="POST", **kwargs)
@@ -270,30 +1046,71 @@ class ObjectNetworking:
         return ObjectNetworking._req(class_object=class_object, url=url, params=params, method="DELETE", **kwargs)
 
     @staticmethod
-    def _req(class_object, url, params, method, **kwargs):
+    def post_many(objects, url, params=None, batch_size=None, concurrency=1, **kwargs):
+        """POST many objects, serialized with a single ``many=True`` schema pass.
+
+        With ``batch_size`` set, objects are sent as JSON arrays of up to that
+        many items; otherwise each object is its own request. Up to
+        ``concurrency`` requests run at once. Returns one ``WriteOutcome`` per
+        object, in input order; ``NetworkError``s are captured, not raised.
+        """
+        return ObjectNetworking._req_many(objects, url, params, "post", batch_size, concurrency, **kwargs)
+
+    @staticmethod
+    def put_many(objects, url, params=None, batch_size=None, concurrency=1, **kwargs):
+        """PUT many objects; see ``post_many``."""
+        return ObjectNetworking._req_many(objects, url, params, "put", batch_size, concurrency, **kwargs)
+
+    @staticmethod
+    def _req_many(objects, url, params, method, batch_size, concurrency, compress=None, **kwargs):
+        objects = list(objects)
+        if not objects:
+            return []
+        cls = _source_class(objects[0])
+        if any(_source_class(obj) is not cls for obj in objects):
+            raise ValueError("All objects must be instances of the same dataclass")
+        payloads = _schema_class_for(cls)(many=True).dump(objects)
+        compression = _resolve_compression(compress, ObjectNetworking.compression)
+
+        if batch_size:
+            groups = [range(start, min(start + batch_size, len(objects))) for start in range(0, len(objects), batch_size)]
+        else:
+            groups = [range(index, index + 1) for index in range(len(objects))]
+
+        def send(group):
+            body = [payloads[index] for index in group] if batch_size else payloads[group[0]]
+            try:
+                resp = _send(method, url, compression=compression, json=body, params=params, **kwargs)
+                _raise_for_status(resp.status_code, url, resp.text, response=resp)
+            except NetworkError as ex:
+                return [WriteOutcome(objects[index], response=getattr(ex, "response", None), error=ex) for index in group]
+            return [WriteOutcome(objects[index], response=resp) for index in group]
+
+        if concurrency <= 1 or len(groups) == 1:
+            results = list(map(send, groups))
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(groups))) as pool:
+                results = list(pool.map(send, groups))
+        return [outcome for outcomes in results for outcome in outcomes]
+
+    @staticmethod
+    def _req(class_object, url, params, method, compress=None, **kwargs):
         method = method.lower()
-        cls = class_object.__class__
+        cls = _source_class(class_object)
 
         schema_cls = _schema_class_for(cls)
         schema = schema_cls()
         payload = schema.dump(class_object)
 
-        try:
-            if method == "post":
-                session = _get_session()
-                resp = session.post(url, json=payload, params=params)
-            elif method == "put":
-                session = _get_session()
-                resp = session.put(url, json=payload, params=params)
-            elif method == "delete":
-                session = _get_session()
-                resp = session.delete(url, params=params)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-        except requests.exceptions.Timeout as ex:
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-        except requests.exceptions.RequestException as ex:
-            raise TransportError("Network error", url=url, original=ex) from ex
+        compression = _resolve_compression(compress, ObjectNetworking.compression)
+        if method == "post":
+            resp = _send("post", url, compression=compression, json=payload, params=params, **kwargs)
+        elif method == "put":
+            resp = _send("put", url, compression=compression, json=payload, params=params, **kwargs)
+        elif method == "delete":
+            resp = _send("delete", url, params=params, **kwargs)
+        else:
+            raise ValueError(f"Unsupported method: {method}")
         _raise_for_status(resp.status_code, url, resp.text, response=resp)
         return resp
 
@@ -301,15 +1118,44 @@ class AsyncNetworking:
 
     logger = logging.getLogger()
 
-    def __init__(self, session=None, headers=None, timeout=None, raise_on_non_2xx=True):
+    def __init__(
+        self,
+        session=None,
+        headers=None,
+        timeout=None,
+        raise_on_non_2xx=True,
+        compression=None,
+        transport=None,
+        unix_sockets=None,
+        dns_cache=None,
+        happy_eyeballs_delay=None,
+        share_connector=True,
+        negative_cache=None,
+        scheduler=None,
+    ):
         self.on_success_callback = None
         self.on_failure_callback = None
         self.on_exception_callback = None
         self.headers = headers or {}
         self.timeout = timeout
+        self.timeout_policy = resolve_timeout_policy(timeout, _TIMEOUT_POLICY)
         self.raise_on_non_2xx = raise_on_non_2xx
+        self.compression = _resolve_compression(compression, None)
+        self.transport = resolve_transport(transport, AiohttpTransport())
+        self.unix_sockets = {_unix_socket_key(host): path for host, path in (unix_sockets or {}).items()}
+        self.dns_cache = dns_cache if dns_cache is not None else _DNS_CACHE
+        self.happy_eyeballs_delay = happy_eyeballs_delay if happy_eyeballs_delay is not None else _HAPPY_EYEBALLS_DELAY
+        self.stats = ClientStats()
         self._session = session
         self._owns_session = False
+        self._unix_sessions = {}
+        self._keepalive_task = None
+        self.share_connector = share_connector
+        self._connectors = []
+        self._in_flight = 0
+        self._idle = None
+        self.negative_cache = negative_cache
+        self.scheduler = scheduler
 
     def set_headers(self, headers):
         self.headers = headers
@@ -338,11 +1184,119 @@ class AsyncNetworking:
     async def delete(self, url, **kwargs):
         return await self._request("DELETE", url, **kwargs)
 
-    async def close(self):
+    async def paginate(
+        self, url, class_object, strategy=None, params=None, prefetch=1, max_pages=None, compact=None, only=None,
+        exclude=None, **kwargs
+    ):
+        """Async counterpart of ``ObjectNetworking.paginate``; pages are fetched by a background task."""
+        strategy = resolve_strategy(strategy)
+        projection = _projection(class_object, only, exclude)
+        params = _projected_params(params, projection)
+        schema = _load_schema(class_object, True, _resolve_compact(compact, ObjectNetworking.compact), projection)
+
+        async def fetch(request):
+            _, payload, headers = await self._request(
+                "GET", request.url, is_json=True, params=request.params or None, with_headers=True, **kwargs
+            )
+            return Page(request, headers, payload, schema.load(strategy.items(payload)))
+
+        async for page in aiterate_pages(fetch, strategy, url, params, prefetch=prefetch, max_pages=max_pages):
+            for item in page.items:
+                yield item
+
+    async def upload(self, url, source, method="POST", chunk_size=DEFAULT_CHUNK_SIZE, progress=None, **kwargs):
+        """Stream ``source`` as the request body; see ``JmNetwork.upload``.
+
+        Async iterators are accepted too. File reads run in the default executor.
+        """
+        body = source if isinstance(source, UploadBody) else UploadBody(source, chunk_size=chunk_size, progress=progress)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(body.headers)
+        headers.setdefault("Content-Type", "application/octet-stream")
+        return await self._request(method.upper(), url, data=body.aiter(), headers=headers, compress=False, **kwargs)
+
+    async def download(self, url, path, segments=4, checksum=None, chunk_size=1024 * 1024, progress=None, **kwargs):
+        """Download ``url`` to ``path``; see ``JmNetwork.download``."""
+        from jm_networking.download import download_async
+
+        return await download_async(
+            self, url, path, segments=segments, checksum=checksum, chunk_size=chunk_size, progress=progress, **kwargs
+        )
+
+    async def warmup(self, hosts, connections=1, keepalive_interval=None, keepalive_path="/"):
+        """Open ``connections`` keep-alive connections per host with concurrent ``HEAD`` requests.
+
+        Returns ``{host_url: connections_ready}``. With ``keepalive_interval``
+        set, a background task repeats the pings every interval until
+        ``close()``.
+        """
+        import asyncio
+
+        urls = [normalize_host(host) for host in hosts]
+        warmed = {}
+        for url in urls:
+            results = await asyncio.gather(*(self._ping(url) for _ in range(connections)))
+            warmed[url] = sum(results)
+        if keepalive_interval is not None:
+            self.stop_keepalive()
+            self._keepalive_task = asyncio.ensure_future(
+                self._keepalive(urls, connections, keepalive_interval, keepalive_path)
+            )
+        return warmed
+
+    def stop_keepalive(self):
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+
+    async def _keepalive(self, urls, connections, interval, path):
+        import asyncio
+
+        while True:
+            await asyncio.sleep(interval)
+            for url in urls:
+                await asyncio.gather(*(self._ping(url.rstrip("/") + path) for _ in range(connections)))
+
+    async def _ping(self, url):
+        token = RESOLVER_STATS.set(self.stats)
+        try:
+            async with self._session_for(url).request("HEAD", url) as resp:
+                await resp.read()
+        except Exception as ex:
+            self.log(f"Keep-alive ping to {url} failed: {ex}", error=True)
+            return False
+        finally:
+            RESOLVER_STATS.reset(token)
+        return True
+
+    async def close(self, drain_timeout=30.0):
+        """Wait up to ``drain_timeout`` seconds for in-flight requests, then close.
+
+        Shared connectors are closed once the last client using them closes.
+        """
+        self.stop_keepalive()
+        await self._drain(drain_timeout)
         if self._owns_session and self._session is not None:
             await self._session.close()
             self._session = None
             self._owns_session = False
+        unix_sessions, self._unix_sessions = self._unix_sessions, {}
+        for session in unix_sessions.values():
+            await session.close()
+        connectors, self._connectors = self._connectors, []
+        for key, connector in connectors:
+            await SHARED_CONNECTORS.release(key, connector)
+
+    async def _drain(self, timeout):
+        import asyncio
+
+        if not self._in_flight:
+            return
+        self._idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.log(f"Closing with {self._in_flight} request(s) still in flight", error=True)
 
     async def __aenter__(self):
         if self._session is None:
@@ -354,16 +1308,104 @@ class AsyncNetworking:
         await self.close()
         return False
 
-    def _create_session(self):
-        if aiohttp is None:
-            raise RuntimeError("aiohttp is required for AsyncNetworking. Install aiohttp to use async requests.")
-        timeout = aiohttp.ClientTimeout(total=self.timeout) if self.timeout is not None else None
-        return aiohttp.ClientSession(headers=self.headers or None, timeout=timeout)
+    def _create_session(self, unix_socket=None):
+        if unix_socket is not None:
+            options = {"unix_socket": unix_socket}
+        else:
+            options = {"dns_cache": self.dns_cache, "happy_eyeballs_delay": self.happy_eyeballs_delay, "stats": self.stats}
+        connector = None
+        if self.share_connector and hasattr(self.transport, "create_connector"):
+            key = (type(self.transport), unix_socket, self.dns_cache, self.happy_eyeballs_delay)
+            # The shared resolver records into RESOLVER_STATS, i.e. whichever
+            # client's request is resolving, not the client that created it.
+            shared = {name: value for name, value in options.items() if name != "stats"}
+            connector = SHARED_CONNECTORS.acquire(key, lambda: self.transport.create_connector(**shared))
+            self._connectors.append((key, connector))
+            options["connector"] = connector
+        return self.transport.create_async_session(headers=self.headers, timeout=self.timeout_policy.default, **options)
+
+    def _session_for(self, url):
+        if self.unix_sockets:
+            host = urlsplit(url).netloc.lower()
+            socket_path = self.unix_sockets.get(host)
+            if socket_path is not None:
+                session = self._unix_sessions.get(host)
+                if session is None:
+                    session = self._create_session(unix_socket=socket_path)
+                    self._unix_sessions[host] = session
+                return session
 
-    async def _request(self, method, url, is_json=False, params=None, data=None, json=None, **kwargs):
         if self._session is None:
             self._session = self._create_session()
             self._owns_session = True
+        return self._session
+
+    async def _request(self, method, url, priority=None, **kwargs):
+        negative_cache = self.negative_cache if method == "GET" else None
+        if not _cacheable_auth(kwargs.get("auth")):
+            negative_cache = None
+        if negative_cache is not None:
+            headers = {**self.headers, **(kwargs.get("headers") or {})}
+            credentials = _credentials_key(headers, kwargs.get("auth"), None)
+            negative_key = _negative_cache_key(url, kwargs.get("params"), credentials)
+            negative_cache.check(negative_key)
+        try:
+            async with self._tracked(priority):
+                return await self._perform(method, url, **kwargs)
+        except HttpError as ex:
+            if negative_cache is not None:
+                negative_cache.record(negative_key, ex)
+            raise
+
+    @asynccontextmanager
+    async def _tracked(self, priority=None):
+        """Count a request as in flight, so ``close()`` drains it, and hold a scheduler slot for it.
+
+        Also points ``RESOLVER_STATS`` at this client, so DNS lookups made by
+        a shared connector are counted in ``self.stats``.
+        """
+        self._in_flight += 1
+        token = RESOLVER_STATS.set(self.stats)
+        try:
+            if self.scheduler is None:
+                yield
+            else:
+                async with self.scheduler.slot(priority):
+                    yield
+        finally:
+            RESOLVER_STATS.reset(token)
+            self._in_flight -= 1
+            if not self._in_flight and self._idle is not None:
+                self._idle.set()
+
+    @asynccontextmanager
+    async def _stream(self, method, url, priority=None, **kwargs):
+        """Yield the response to ``method url`` with its body unread, for callers that stream it.
+
+        The request is tracked and scheduled like ``_request``, gets the
+        per-host timeout, and transport errors (also while the body is being
+        read) are raised as ``TransportError``/``NetworkTimeoutError``.
+        Callbacks are not invoked.
+        """
+        import asyncio
+
+        if self.timeout_policy.hosts or isinstance(kwargs.get("timeout"), Timeout):
+            _apply_timeout(kwargs, url, self.timeout_policy, self.transport)
+        async with self._tracked(priority):
+            try:
+                async with self._session_for(url).request(method, url, **kwargs) as resp:
+                    yield resp
+            except (asyncio.TimeoutError,) + tuple(self.transport.timeout_errors) as ex:
+                raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
+            except self.transport.errors as ex:
+                raise TransportError("Network error", url=url, original=ex) from ex
+
+    async def _perform(
+        self, method, url, is_json=False, params=None, data=None, json=None, compress=None, with_headers=False, **kwargs
+    ):
+        import asyncio
+
+        session = self._session_for(url)
 
         headers = {}
         if self.headers:
@@ -381,9 +1423,25 @@ class AsyncNetworking:
             kwargs["data"] = data
         if json is not None:
             kwargs["json"] = json
+        if self.timeout_policy.hosts or isinstance(kwargs.get("timeout"), Timeout):
+            _apply_timeout(kwargs, url, self.timeout_policy, self.transport)
+        _compress_body(kwargs, _resolve_compression(compress, self.compression), self.stats)
+        # On sessions this client created, decompress here instead of inside
+        # aiohttp so the decode can be timed; a caller's session is left alone.
+        decode_here = isinstance(self.transport, AiohttpTransport) and (
+            self._owns_session or session is not self._session
+        )
+        if decode_here:
+            kwargs["auto_decompress"] = False
 
         try:
-            async with self._session.request(method, url, **kwargs) as resp:
+            async with session.request(method, url, **kwargs) as resp:
+                encoding = resp.headers.get("Content-Encoding")
+                if encoding in ("", "identity"):
+                    encoding = None
+                if encoding and decode_here:
+                    await self._decode_body(resp, encoding, url)
+                    encoding = None
                 text = None
                 if not _is_success(resp.status):
                     text = await resp.text()
@@ -403,18 +1461,24 @@ class AsyncNetworking:
                     if text is None:
                         text = await resp.text()
                     payload = text
+                if encoding:
+                    # Already read (and cached) by text()/json() above.
+                    body = await resp.read()
+                    _record_response_encoding(self.stats, encoding, resp.content_length, len(body))
 
+                if with_headers:
+                    return resp.status, payload, resp.headers
                 if self.on_success_callback is not None:
                     return await self._maybe_await(self.on_success_callback(resp))
                 return resp.status, payload
         except HttpError:
             raise
-        except asyncio.TimeoutError as ex:
-            if self.on_exception_callback is not None:
-                return await self._maybe_await(self.on_exception_callback(ex))
-            raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
         except Exception as ex:
-            if aiohttp is not None and isinstance(ex, aiohttp.ClientError):
+            if isinstance(ex, (asyncio.TimeoutError,) + self.transport.timeout_errors):
+                if self.on_exception_callback is not None:
+                    return await self._maybe_await(self.on_exception_callback(ex))
+                raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
+            if isinstance(ex, self.transport.errors):
                 if self.on_exception_callback is not None:
                     return await self._maybe_await(self.on_exception_callback(ex))
                 raise TransportError("Network error", url=url, original=ex) from ex
@@ -422,6 +1486,16 @@ class AsyncNetworking:
                 return await self._maybe_await(self.on_exception_callback(ex))
             raise
 
+    async def _decode_body(self, resp, encoding, url):
+        body = await resp.read()
+        decoder = _response_decoder(encoding)
+        if decoder is None or not body:
+            return
+        try:
+            resp._body = _decode_response_body(self.stats, encoding, decoder, body)
+        except Exception as ex:
+            raise TransportError(f"Failed to decode {encoding} response body", url=url, original=ex) from ex
+
     async def _maybe_await(self, result):
         if inspect.isawaitable(result):
             return await result
@@ -444,24 +1518,37 @@ class _TokenBucket:
 
     def acquire(self):
         while True:
-            with self.lock:
-                now = time.monotonic()
-                elapsed = now - self.updated_at
-                if elapsed > 0:
-                    self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-                    self.updated_at = now
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        import asyncio
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
 
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    return
+    def try_acquire(self):
+        """Take a token if one is available; otherwise return seconds until one will be."""
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.updated_at
+            if elapsed > 0:
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.updated_at = now
 
-                if self.rate <= 0:
-                    return
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
 
-                wait = (1 - self.tokens) / self.rate
+            if self.rate <= 0:
+                return 0.0
 
-            if wait > 0:
-                time.sleep(wait)
+            return (1 - self.tokens) / self.rate
 
 
 def _retry_after_seconds(value):
@@ -493,6 +1580,8 @@ class RateLimitedNetworking:
         max_burst=None,
         respect_retry_after=True,
         raise_on_429=True,
+        retry_budget=None,
+        timeout_policy=None,
     ):
         self.max_tries = max_retries
         self.max_requests_per_second = max_requests_per_second if max_requests_per_second and max_requests_per_second > 0 else None
@@ -502,6 +1591,8 @@ class RateLimitedNetworking:
         self.max_burst = max_burst
         self.respect_retry_after = respect_retry_after
         self.raise_on_429 = raise_on_429
+        self.retry_budget = retry_budget
+        self.timeout_policy = timeout_policy
         self.retries = 0
         self._buckets = {}
         self._buckets_lock = threading.Lock()
@@ -510,15 +1601,18 @@ class RateLimitedNetworking:
         last_status = None
         last_payload = None
         last_response = None
+        host = urlsplit(url).netloc or ""
+        _apply_timeout(kwargs, url, resolve_timeout_policy(self.timeout_policy, _TIMEOUT_POLICY), _TRANSPORT)
 
         for attempt in range(self.max_tries + 1):
             self.pre_process(url)
+            transport = _TRANSPORT
             try:
                 session = _get_session()
                 response = session.get(url, params=params, **kwargs)
-            except requests.exceptions.Timeout as ex:
+            except transport.timeout_errors as ex:
                 raise NetworkTimeoutError("Request timed out", url=url, original=ex) from ex
-            except requests.exceptions.RequestException as ex:
+            except transport.errors as ex:
                 raise TransportError("Network error", url=url, original=ex) from ex
             last_response = response
             last_status = response.status_code
@@ -533,6 +1627,8 @@ class RateLimitedNetworking:
             if response.status_code != 429:
                 self.retries = 0
                 _raise_for_status(response.status_code, url, last_payload, response=response)
+                if self.retry_budget is not None:
+                    self.retry_budget.record_success(host)
                 return last_status, last_payload
 
             self.retries += 1
@@ -548,6 +1644,18 @@ class RateLimitedNetworking:
                     )
                 return last_status, last_payload
 
+            if self.retry_budget is not None and not self.retry_budget.try_retry(host):
+                logging.error("429 Rate limit. Retry budget for %s exhausted.", host)
+                if self.raise_on_429:
+                    raise TooManyRequestsError(
+                        response.status_code,
+                        url,
+                        body=last_payload,
+                        response=response,
+                        retries=attempt,
+                    )
+                return last_status, last_payload
+
             delay = self._compute_backoff_delay(attempt, response)
             logging.info("429 Rate limit. Retrying in %s seconds...", delay)
             if delay > 0:
@@ -555,6 +1663,12 @@ class RateLimitedNetworking:
 
         return last_status, last_payload
 
+    def metrics(self):
+        """Retry budget usage per host (empty without a ``retry_budget``)."""
+        if self.retry_budget is None:
+            return {}
+        return self.retry_budget.metrics()
+
     def process_response(self, status_code, payload):
         if status_code == 429:
             logging.error("429 Rate limit. Max retries (%s) reached.", self.max_tries)
@@ -0,0 +1,203 @@
+"""Client-side load balancing over a group of replica base URLs.
+
+``EndpointGroup`` picks a replica for each call and joins its base URL with
+the request path. There are two selection strategies:
+
+- ``"least_outstanding"`` sends the call to the replica with the fewest calls
+  in flight, breaking ties at random.
+- ``"p2c"`` draws two replicas at random and takes the one with the lower
+  cost, where cost is EWMA latency times (in-flight calls + 1). Slow replicas
+  get less traffic as soon as their latency rises. A failed call raises the
+  EWMA to at least ``failure_penalty`` seconds, so fast failures (refused
+  connections, quick 503s) don't make a replica look healthy. The EWMA
+  decays while a replica gets no calls, so a penalized one is probed again.
+
+A replica that fails ``max_failures`` times in a row with a
+``TransportError`` (including timeouts) or ``HttpServerError`` is ejected for
+``ejection_time`` seconds. The ejection time doubles each time it is ejected
+again, up to ``max_ejection_time``, and a success resets it. If every replica
+is ejected, all of them become eligible again rather than failing every call.
+
+    group = EndpointGroup(["http://10.0.0.1:8080", "http://10.0.0.2:8080"], strategy="p2c")
+    status, todo = group.call(ObjectNetworking.get, "/todos/1", Todo)
+    status, text = await group.acall(client.get, "/health")
+
+The URL is passed as the first positional argument, or as the keyword named
+by ``url_arg`` for functions that take it elsewhere:
+
+    group.call(ObjectNetworking.post, "/todos", todo, url_arg="url", params=None)
+"""
+
+import math
+import random
+import threading
+import time
+
+from jm_networking import HttpServerError, TransportError
+
+
+STRATEGIES = ("least_outstanding", "p2c")
+_FAILURES = (TransportError, HttpServerError)
+
+
+class Replica:
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.outstanding = 0
+        self.ewma = None
+        self.updated_at = None
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def url(self, path):
+        if not path:
+            return self.base_url
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def latency(self, now, decay):
+        """The EWMA latency, decayed for the time since the last call finished."""
+        if self.ewma is None:
+            return 0.0
+        if decay <= 0:
+            return self.ewma
+        return self.ewma * math.exp(-(now - self.updated_at) / decay)
+
+    def cost(self, now, decay):
+        return self.latency(now, decay) * (self.outstanding + 1)
+
+    def snapshot(self, now):
+        return {
+            "base_url": self.base_url,
+            "outstanding": self.outstanding,
+            "ewma": self.ewma,
+            "requests": self.requests,
+            "errors": self.errors,
+            "ejected": self.ejected_until > now,
+        }
+
+    def __repr__(self):
+        return f"Replica({self.base_url!r})"
+
+
+def _with_url(url, args, url_arg, kwargs):
+    if url_arg is None:
+        return (url,) + args, kwargs
+    return args, dict(kwargs, **{url_arg: url})
+
+
+class EndpointGroup:
+
+    def __init__(
+        self,
+        base_urls,
+        strategy="least_outstanding",
+        max_failures=3,
+        ejection_time=10.0,
+        max_ejection_time=300.0,
+        decay=10.0,
+        failure_penalty=5.0,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown balancing strategy: {strategy}")
+        self.replicas = [Replica(base_url) for base_url in base_urls]
+        if not self.replicas:
+            raise ValueError("EndpointGroup needs at least one base URL")
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self.decay = decay
+        self.failure_penalty = failure_penalty
+        self._lock = threading.Lock()
+
+    def call(self, func, path, *args, url_arg=None, **kwargs):
+        """Call ``func(url, *args, **kwargs)`` with ``path`` on the chosen replica.
+
+        With ``url_arg`` set, the URL is passed as that keyword argument
+        instead, e.g. ``url_arg="url"`` for ``ObjectNetworking.post``.
+        """
+        replica, started = self._begin()
+        args, kwargs = _with_url(replica.url(path), args, url_arg, kwargs)
+        try:
+            result = func(*args, **kwargs)
+        except _FAILURES:
+            self._finish(replica, started, failed=True)
+            raise
+        except BaseException:
+            self._finish(replica, started, failed=False)
+            raise
+        self._finish(replica, started, failed=False)
+        return result
+
+    async def acall(self, func, path, *args, url_arg=None, **kwargs):
+        """Async ``call``: await ``func(url, *args, **kwargs)``, e.g. an ``AsyncNetworking`` method."""
+        replica, started = self._begin()
+        args, kwargs = _with_url(replica.url(path), args, url_arg, kwargs)
+        try:
+            result = await func(*args, **kwargs)
+        except _FAILURES:
+            self._finish(replica, started, failed=True)
+            raise
+        except BaseException:
+            self._finish(replica, started, failed=False)
+            raise
+        self._finish(replica, started, failed=False)
+        return result
+
+    def pick(self):
+        """Choose a replica (without counting a call against it)."""
+        with self._lock:
+            return self._pick(time.monotonic())
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            return [replica.snapshot(now) for replica in self.replicas]
+
+    def _pick(self, now):
+        healthy = [replica for replica in self.replicas if replica.ejected_until <= now] or self.replicas
+        if len(healthy) == 1:
+            return healthy[0]
+        if self.strategy == "p2c":
+            first, second = random.sample(healthy, 2)
+            return first if first.cost(now, self.decay) <= second.cost(now, self.decay) else second
+        fewest = min(replica.outstanding for replica in healthy)
+        return random.choice([replica for replica in healthy if replica.outstanding == fewest])
+
+    def _begin(self):
+        with self._lock:
+            now = time.monotonic()
+            replica = self._pick(now)
+            replica.outstanding += 1
+            replica.requests += 1
+        return replica, now
+
+    def _finish(self, replica, started, failed):
+        with self._lock:
+            now = time.monotonic()
+            replica.outstanding -= 1
+            latency = now - started
+            if failed:
+                # Fast failures would otherwise pull the EWMA down.
+                replica.ewma = max(replica.ewma or 0.0, latency, self.failure_penalty)
+            elif replica.ewma is None:
+                replica.ewma = latency
+            else:
+                weight = math.exp(-(now - replica.updated_at) / self.decay) if self.decay > 0 else 0.0
+                replica.ewma = replica.ewma * weight + latency * (1 - weight)
+            replica.updated_at = now
+            if not failed:
+                replica.failures = 0
+                replica.ejections = 0
+                return
+            replica.errors += 1
+            replica.failures += 1
+            if replica.failures >= self.max_failures:
+                replica.failures = 0
+                replica.ejections += 1
+                duration = min(self.ejection_time * 2 ** (replica.ejections - 1), self.max_ejection_time)
+                replica.ejected_until = now + duration
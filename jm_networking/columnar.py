@@ -0,0 +1,154 @@
+"""Column-oriented results for large list endpoints.
+
+``to_columns`` turns the rows of a JSON array into one NumPy array per
+dataclass field instead of one dataclass instance per row, skipping schema
+loading and per-row object allocation. Column dtypes come from the field
+annotations: ``int`` -> ``int64``, ``float`` -> ``float64``, ``bool`` ->
+``bool``, ``str`` -> ``object`` (or fixed-width unicode), anything else ->
+``object`` holding the raw JSON value. ``Optional`` fields with missing or
+null values become masked arrays.
+
+NumPy is optional and only imported when a columnar result is requested.
+"""
+
+import dataclasses
+import types
+import typing
+from functools import lru_cache
+
+
+_DTYPES = {int: "i8", float: "f8", bool: "?"}
+_FILL = {"i8": 0, "f8": 0.0, "?": False}
+
+
+class ColumnSpec:
+
+    def __init__(self, name, key, kind, optional, default, is_factory=False):
+        self.name = name
+        self.key = key
+        self.kind = kind
+        self.optional = optional
+        self.default = default
+        self.is_factory = is_factory
+
+    def __repr__(self):
+        return f"ColumnSpec(name={self.name!r}, key={self.key!r}, kind={self.kind!r}, optional={self.optional})"
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("numpy is required for columnar results. Install numpy to use get_columns.") from None
+    return numpy
+
+
+def _unwrap_optional(annotation):
+    if typing.get_origin(annotation) in (typing.Union, getattr(types, "UnionType", None)):
+        args = typing.get_args(annotation)
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1:
+            return non_none[0], len(non_none) < len(args)
+        return object, type(None) in args
+    return annotation, False
+
+
+@lru_cache(maxsize=None)
+def column_specs(cls):
+    """Describe the columns of dataclass ``cls`` (cached per class)."""
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    hints = typing.get_type_hints(cls)
+    specs = []
+    for field in dataclasses.fields(cls):
+        annotation, optional = _unwrap_optional(hints.get(field.name, object))
+        if annotation is str:
+            kind = "str"
+        else:
+            kind = _DTYPES.get(annotation, "object")
+        default = field.default
+        if default is dataclasses.MISSING and field.default_factory is not dataclasses.MISSING:
+            default = field.default_factory
+            is_factory = True
+        else:
+            is_factory = False
+        key = field.metadata.get("data_key", field.name)
+        specs.append(ColumnSpec(field.name, key, kind, optional, default, is_factory))
+    return tuple(specs)
+
+
+def _column(numpy, spec, rows, string_dtype):
+    values = [row.get(spec.key) for row in rows]
+    mask = None
+    if any(value is None for value in values):
+        mask = numpy.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        if spec.optional or spec.default is None:
+            fill = _FILL.get(spec.kind, "" if spec.kind == "str" else None)
+        elif spec.is_factory:
+            fill, mask = None, None
+            values = [spec.default() if value is None else value for value in values]
+        elif spec.default is not dataclasses.MISSING:
+            fill, mask = spec.default, None
+        else:
+            row = int(mask.argmax())
+            raise ValueError(f"Row {row} is missing required field {spec.key!r}")
+        values = [fill if value is None else value for value in values]
+
+    if spec.kind == "str":
+        if string_dtype == "unicode":
+            width = max((len(value) for value in values), default=1) or 1
+            dtype = f"U{width}"
+        else:
+            dtype = object
+    elif spec.kind == "object":
+        dtype = object
+    else:
+        dtype = spec.kind
+    if dtype is object:
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+    else:
+        array = numpy.array(values, dtype=dtype)
+    return array, mask
+
+
+def to_columns(rows, cls, layout="dict", string_dtype=None):
+    """Build columns for ``cls`` from ``rows`` (a list of JSON objects).
+
+    ``layout="dict"`` returns ``{field: array}``, with ``numpy.ma.MaskedArray``
+    for columns that contain nulls. ``layout="structured"`` returns one
+    structured array (masked if any column has nulls). ``string_dtype`` is
+    ``"object"`` or ``"unicode"`` (fixed-width ``U`` columns); it defaults to
+    object for dicts and unicode for structured arrays.
+    """
+    if layout not in ("dict", "structured"):
+        raise ValueError(f"Unknown columnar layout: {layout}")
+    numpy = _numpy()
+    if isinstance(rows, dict):
+        rows = [rows]
+    if string_dtype is None:
+        string_dtype = "unicode" if layout == "structured" else "object"
+
+    columns = {}
+    masks = {}
+    for spec in column_specs(cls):
+        array, mask = _column(numpy, spec, rows, string_dtype)
+        columns[spec.name] = array
+        if mask is not None:
+            masks[spec.name] = mask
+
+    if layout == "dict":
+        for name, mask in masks.items():
+            columns[name] = numpy.ma.MaskedArray(columns[name], mask=mask)
+        return columns
+
+    dtype = numpy.dtype([(name, array.dtype) for name, array in columns.items()])
+    result = numpy.empty(len(rows), dtype=dtype)
+    for name, array in columns.items():
+        result[name] = array
+    if not masks:
+        return result
+    mask = numpy.zeros(len(rows), dtype=numpy.dtype([(name, bool) for name in columns]))
+    for name, column_mask in masks.items():
+        mask[name] = column_mask
+    return numpy.ma.MaskedArray(result, mask=mask)
@@ -0,0 +1,148 @@
+"""Memory-compact variants of user dataclasses.
+
+``compact_class(cls, "slots")`` derives a ``__slots__`` dataclass with the same
+fields, defaults and methods as ``cls``; ``compact_class(cls, "tuple")``
+derives an immutable, tuple-backed (``namedtuple``) variant. Neither carries
+a per-instance ``__dict__``. Fields are read as attributes as usual, and
+instances compare equal to each other and to instances of ``cls`` with the
+same field values. Both variants pickle by rebuilding from ``cls``.
+
+``compact_schema`` wraps a ``class_schema`` schema so ``load`` builds compact
+instances directly instead of going through ``cls``. Nested dataclass fields
+are loaded by their own schemas and keep their original classes.
+"""
+
+import dataclasses
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+
+KINDS = ("slots", "tuple")
+_SKIPPED_MEMBERS = {"Schema", "__dict__", "__weakref__", "__slots__"}
+
+
+def _copied_members(cls, field_names):
+    members = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, value in vars(klass).items():
+            if name in field_names or name in _SKIPPED_MEMBERS:
+                continue
+            if name.startswith("__") and name.endswith("__"):
+                continue
+            members[name] = value
+    return members
+
+
+def _field_values(obj, names):
+    return tuple(getattr(obj, name) for name in names)
+
+
+def _add_slots(cls, names):
+    # ``make_dataclass(slots=True)`` needs Python 3.10; earlier versions get
+    # the same class recreated with ``__slots__``, as 3.10 does internally.
+    namespace = dict(vars(cls))
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _rebuild(source, kind, values):
+    return compact_class(source, kind)(*values)
+
+
+@lru_cache(maxsize=None)
+def compact_class(cls, kind="slots"):
+    """Return the cached compact variant of dataclass ``cls``."""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown compact kind: {kind}")
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    fields = [field for field in dataclasses.fields(cls) if field.init]
+    names = tuple(field.name for field in fields)
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__ or other.__class__ is cls:
+            return _field_values(self, names) == _field_values(other, names)
+        return NotImplemented
+
+    def __reduce__(self):
+        return _rebuild, (cls, kind, _field_values(self, names))
+
+    namespace = _copied_members(cls, set(names))
+    namespace.update({"__eq__": __eq__, "__reduce__": __reduce__, "__jm_source__": cls})
+
+    if kind == "slots":
+        params = cls.__dataclass_params__
+        spec = []
+        for field in fields:
+            options = {}
+            if field.default is not dataclasses.MISSING:
+                options["default"] = field.default
+            if field.default_factory is not dataclasses.MISSING:
+                options["default_factory"] = field.default_factory
+            spec.append((field.name, field.type, dataclasses.field(repr=field.repr, compare=field.compare, metadata=field.metadata, **options)))
+        if sys.version_info >= (3, 10):
+            compact = dataclasses.make_dataclass(
+                cls.__name__,
+                spec,
+                namespace=namespace,
+                frozen=params.frozen,
+                order=params.order,
+                slots=True,
+            )
+        else:
+            compact = _add_slots(
+                dataclasses.make_dataclass(
+                    cls.__name__, spec, namespace=namespace, frozen=params.frozen, order=params.order
+                ),
+                names,
+            )
+    else:
+        def __new__(klass, *args, **kwargs):
+            if len(args) > len(names):
+                raise TypeError(f"{cls.__name__}() takes {len(names)} arguments but {len(args)} were given")
+            values = dict(zip(names, args))
+            for name, value in kwargs.items():
+                if name not in names:
+                    raise TypeError(f"{cls.__name__}() got an unexpected keyword argument {name!r}")
+                if name in values:
+                    raise TypeError(f"{cls.__name__}() got multiple values for argument {name!r}")
+                values[name] = value
+            for field in fields:
+                if field.name in values:
+                    continue
+                if field.default is not dataclasses.MISSING:
+                    values[field.name] = field.default
+                elif field.default_factory is not dataclasses.MISSING:
+                    values[field.name] = field.default_factory()
+                else:
+                    raise TypeError(f"{cls.__name__}() missing required argument {field.name!r}")
+            return tuple.__new__(klass, [values[name] for name in names])
+
+        base = namedtuple(cls.__name__, names)
+        namespace.update({"__slots__": (), "__new__": __new__, "__hash__": tuple.__hash__})
+        compact = type(cls.__name__, (base,), namespace)
+
+    compact.__module__ = cls.__module__
+    compact.__qualname__ = f"{cls.__qualname__}[{kind}]"
+    return compact
+
+
+@lru_cache(maxsize=None)
+def compact_schema(schema_cls, compact_cls):
+    """Subclass ``schema_cls`` so ``load`` returns ``compact_cls`` instances."""
+    import marshmallow
+
+    class CompactSchema(schema_cls):
+        def load(self, data, *, many=None, **kwargs):
+            # Skip class_schema's own load, which would build the original class first.
+            loaded = marshmallow.Schema.load(self, data, many=many, **kwargs)
+            many = self.many if many is None else bool(many)
+            if many:
+                return [compact_cls(**values) for values in loaded]
+            return compact_cls(**loaded)
+
+    CompactSchema.__name__ = f"{schema_cls.__name__}Compact"
+    return CompactSchema
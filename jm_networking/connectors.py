@@ -0,0 +1,70 @@
+"""Process-wide registry of shared aiohttp connectors.
+
+Every ``AsyncNetworking`` client used to own a ``ClientSession`` with its own
+connector, so building a client per handler or per header set threw away
+warm connections each time. Clients now take a connector from this registry
+instead and wrap it in a session of their own (``connector_owner=False``),
+so default headers and timeouts stay per client while the connection pool is
+shared.
+
+Connectors are bound to an event loop, so the registry keeps one set per loop
+(held weakly) and, within a loop, one connector per key (transport, DNS
+cache, Unix socket path, ...). Each ``acquire`` takes a reference; the last
+``release`` closes the connector.
+"""
+
+import threading
+import weakref
+
+
+class _Entry:
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.refs = 0
+
+
+class ConnectorRegistry:
+
+    def __init__(self):
+        self._loops = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def acquire(self, key, factory):
+        """Return the running loop's connector for ``key``, creating it with ``factory()``."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = self._loops.setdefault(loop, {})
+            entry = entries.get(key)
+            if entry is None or entry.connector.closed:
+                entry = entries[key] = _Entry(factory())
+            entry.refs += 1
+            return entry.connector
+
+    async def release(self, key, connector):
+        """Drop one reference; close the connector when it was the last one."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = self._loops.get(loop, {})
+            entry = entries.get(key)
+            if entry is not None and entry.connector is connector:
+                entry.refs -= 1
+                if entry.refs > 0:
+                    return
+                del entries[key]
+        await connector.close()
+
+    def refs(self, key):
+        """Reference count of ``key``'s connector on the running loop (0 if there is none)."""
+        import asyncio
+
+        with self._lock:
+            entry = self._loops.get(asyncio.get_running_loop(), {}).get(key)
+            return entry.refs if entry is not None else 0
+
+
+SHARED_CONNECTORS = ConnectorRegistry()
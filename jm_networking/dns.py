@@ -0,0 +1,263 @@
+"""In-process DNS cache shared by the sync and async transports.
+
+``DnsCache`` memoizes ``getaddrinfo`` results for ``ttl`` seconds and failed
+lookups for ``negative_ttl`` seconds. The resolver is pluggable: any callable
+with the ``socket.getaddrinfo(host, port, family, type)`` signature works.
+
+The sync side plugs in through ``DnsCachingAdapter``, whose connections
+resolve through the cache and connect with ``happy_eyeballs_connect``
+(RFC 8305 style: addresses interleaved by family, a new attempt started
+every ``happy_eyeballs_delay`` seconds, first successful socket wins). The
+async side plugs in as an aiohttp resolver (``aiohttp_resolver``) and uses
+aiohttp's own happy-eyeballs connection racing. A resolver created without
+``stats`` (one on a connector shared between clients) records into
+``RESOLVER_STATS``, which each ``AsyncNetworking`` request sets to its own
+client's stats.
+"""
+
+import contextvars
+import errno
+import selectors
+import socket
+import threading
+import time
+from collections import OrderedDict
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+RESOLVER_STATS = contextvars.ContextVar("jm_networking_resolver_stats", default=None)
+
+
+class DnsCache:
+
+    def __init__(self, ttl=60.0, negative_ttl=5.0, max_entries=1024, resolver=None):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.resolver = resolver or socket.getaddrinfo
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, host, port, family=socket.AF_UNSPEC, stats=None):
+        """Return cached addresses, raise a cached failure, or return None on a miss."""
+        key = (host, port, family)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, addresses, error = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        if error is not None:
+            if stats is not None:
+                stats.add("dns_negative_hits")
+            raise socket.gaierror(*error.args)
+        if stats is not None:
+            stats.add("dns_cache_hits")
+        return addresses
+
+    def resolve(self, host, port, family=socket.AF_UNSPEC, stats=None):
+        addresses = self.lookup(host, port, family, stats=stats)
+        if addresses is not None:
+            return addresses
+
+        started = time.perf_counter()
+        try:
+            addresses = list(self.resolver(host, port, family, socket.SOCK_STREAM))
+        except socket.gaierror as ex:
+            self._store((host, port, family), None, ex, self.negative_ttl)
+            if stats is not None:
+                stats.add("dns_failures")
+            raise
+        finally:
+            if stats is not None:
+                stats.add("dns_lookups")
+                stats.add("dns_resolution_time", time.perf_counter() - started)
+
+        self._store((host, port, family), addresses, None, self.ttl)
+        return addresses
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key, addresses, error, ttl):
+        if ttl is None or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, addresses, error)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def interleave_addresses(addresses):
+    """Order addresses so families alternate, keeping the first family first."""
+    by_family = OrderedDict()
+    for address in addresses:
+        by_family.setdefault(address[0], []).append(address)
+    queues = list(by_family.values())
+    ordered = []
+    while any(queues):
+        for queue in queues:
+            if queue:
+                ordered.append(queue.pop(0))
+    return ordered
+
+
+def happy_eyeballs_connect(addresses, timeout=None, delay=0.25, source_address=None, socket_options=None):
+    """Race connection attempts over ``addresses`` and return the first connected socket."""
+    addresses = interleave_addresses(addresses)
+    if not addresses:
+        raise OSError("getaddrinfo returns an empty list")
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    pending = set()
+    errors = []
+    winner = None
+    index = 0
+    next_attempt_at = time.monotonic()
+
+    try:
+        while winner is None:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise socket.timeout("timed out")
+
+            if index < len(addresses) and (now >= next_attempt_at or not pending):
+                family, sock_type, proto, _, sockaddr = addresses[index]
+                index += 1
+                sock = socket.socket(family, sock_type, proto)
+                try:
+                    for option in socket_options or ():
+                        sock.setsockopt(*option)
+                    if source_address is not None:
+                        sock.bind(source_address)
+                    sock.setblocking(False)
+                    err = sock.connect_ex(sockaddr)
+                except OSError as ex:
+                    sock.close()
+                    errors.append(ex)
+                    continue
+                if err == 0:
+                    winner = sock
+                    break
+                if err not in _IN_PROGRESS:
+                    sock.close()
+                    errors.append(OSError(err, f"Connect to {sockaddr!r} failed"))
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE)
+                pending.add(sock)
+                next_attempt_at = now + delay
+                continue
+
+            if not pending:
+                raise errors[-1]
+
+            wait = next_attempt_at - now if index < len(addresses) else None
+            if deadline is not None:
+                remaining = deadline - now
+                wait = remaining if wait is None else min(wait, remaining)
+
+            for key, _ in selector.select(wait):
+                sock = key.fileobj
+                selector.unregister(sock)
+                pending.discard(sock)
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if err == 0:
+                    winner = sock
+                    break
+                sock.close()
+                errors.append(OSError(err, f"Connect to {sock!r} failed"))
+                next_attempt_at = time.monotonic()
+    finally:
+        for sock in pending:
+            if sock is not winner:
+                sock.close()
+        selector.close()
+
+    winner.settimeout(timeout)
+    return winner
+
+
+class _CachedConnectionMixin:
+    dns_cache = None
+    happy_eyeballs_delay = 0.25
+    stats = None
+
+    def _new_conn(self):
+        timeout = self.timeout if isinstance(self.timeout, (int, float)) else None
+        try:
+            addresses = self.dns_cache.resolve(self._dns_host, self.port, stats=self.stats)
+            return happy_eyeballs_connect(
+                addresses,
+                timeout=timeout,
+                delay=self.happy_eyeballs_delay,
+                source_address=self.source_address,
+                socket_options=self.socket_options,
+            )
+        except socket.gaierror as ex:
+            raise NameResolutionError(self.host, self, ex) from ex
+        except socket.timeout as ex:
+            raise ConnectTimeoutError(self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from ex
+        except OSError as ex:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {ex}") from ex
+
+
+class DnsCachingAdapter(HTTPAdapter):
+    """``requests`` adapter whose connections resolve through a ``DnsCache``."""
+
+    def __init__(self, dns_cache, happy_eyeballs_delay=0.25, stats=None, **kwargs):
+        connection_attrs = {"dns_cache": dns_cache, "happy_eyeballs_delay": happy_eyeballs_delay, "stats": stats}
+        http_connection = type("CachedHTTPConnection", (_CachedConnectionMixin, HTTPConnection), connection_attrs)
+        https_connection = type("CachedHTTPSConnection", (_CachedConnectionMixin, HTTPSConnection), connection_attrs)
+        self._pool_classes = {
+            "http": type("CachedHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": http_connection}),
+            "https": type("CachedHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": https_connection}),
+        }
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+def aiohttp_resolver(dns_cache, stats=None):
+    """Return an aiohttp resolver backed by ``dns_cache``."""
+    import asyncio
+
+    from aiohttp.abc import AbstractResolver
+
+    class CachedResolver(AbstractResolver):
+
+        async def resolve(self, host, port=0, family=socket.AF_INET):
+            current = stats if stats is not None else RESOLVER_STATS.get()
+            addresses = dns_cache.lookup(host, port, family, stats=current)
+            if addresses is None:
+                loop = asyncio.get_running_loop()
+                addresses = await loop.run_in_executor(None, dns_cache.resolve, host, port, family, current)
+            return [
+                {
+                    "hostname": host,
+                    "host": sockaddr[0],
+                    "port": sockaddr[1],
+                    "family": address_family,
+                    "proto": proto,
+                    "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+                }
+                for address_family, _, proto, _, sockaddr in addresses
+            ]
+
+        async def close(self):
+            pass
+
+    return CachedResolver()
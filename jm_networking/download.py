@@ -0,0 +1,410 @@
+"""Segmented, resumable downloads straight to disk.
+
+``download`` probes the server with a one-byte ``Range`` request. When ranges
+are supported, the file is preallocated and ``segments`` byte ranges are
+fetched concurrently, each written in place with ``os.pwrite``. Progress is
+kept in a sidecar state file (``<path>.jmdownload``), so an interrupted
+download picks up where each segment stopped. Servers that ignore ranges get
+a single streamed request instead. Either way the body is never buffered in
+memory, and the final length (and optional checksum) is verified.
+
+``JmNetwork.download`` and ``AsyncNetworking.download`` are the entry points.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jm_networking import DownloadError, _raise_for_status, _send
+
+
+STATE_SUFFIX = ".jmdownload"
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+_SAVE_INTERVAL = 0.5
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadResult:
+
+    def __init__(self, path, length, segments, resumed, checksum=None):
+        self.path = path
+        self.length = length
+        self.segments = segments
+        self.resumed = resumed
+        self.checksum = checksum
+
+    def __repr__(self):
+        return f"DownloadResult(path={self.path!r}, length={self.length}, segments={self.segments}, resumed={self.resumed})"
+
+
+class _DownloadState:
+    """Per-segment progress, persisted next to the download as JSON."""
+
+    def __init__(self, state_path, url, length, validator, segments):
+        self.state_path = state_path
+        self.url = url
+        self.length = length
+        self.validator = validator
+        # Each segment is [start, end_inclusive, bytes_done].
+        self.segments = segments
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+
+    @classmethod
+    def plan(cls, state_path, url, length, validator, count):
+        count = max(1, min(count, length))
+        size, extra = divmod(length, count)
+        segments = []
+        start = 0
+        for index in range(count):
+            end = start + size + (1 if index < extra else 0) - 1
+            segments.append([start, end, 0])
+            start = end + 1
+        return cls(state_path, url, length, validator, segments)
+
+    @classmethod
+    def load(cls, state_path, url):
+        try:
+            with open(state_path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get("url") != url:
+            return None
+        return cls(state_path, url, data["length"], data.get("validator"), data["segments"])
+
+    @property
+    def done(self):
+        return sum(segment[2] for segment in self.segments)
+
+    def advance(self, index, count):
+        with self._lock:
+            self.segments[index][2] += count
+            if time.monotonic() - self._saved_at >= _SAVE_INTERVAL:
+                self._save_locked()
+
+    def save(self):
+        with self._lock:
+            self._save_locked()
+
+    def remove(self):
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
+
+    def _save_locked(self):
+        data = {"url": self.url, "length": self.length, "validator": self.validator, "segments": self.segments}
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, self.state_path)
+        self._saved_at = time.monotonic()
+
+
+def parse_checksum(checksum):
+    """Split ``"sha256:<hex>"`` into ``("sha256", "<hex>")``."""
+    if checksum is None:
+        return None, None
+    algorithm, _, expected = checksum.partition(":")
+    if not expected:
+        raise ValueError("checksum must look like 'sha256:<hexdigest>'")
+    hashlib.new(algorithm)
+    return algorithm, expected.lower()
+
+
+def file_digest(path, algorithm, chunk_size=DEFAULT_CHUNK_SIZE):
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb") as file:
+        while True:
+            count = file.readinto(buffer)
+            if not count:
+                return digest.hexdigest()
+            digest.update(view[:count])
+
+
+def range_probe(headers):
+    """Return ``(total_length, validator)`` from a 206 probe response's headers."""
+    match = _CONTENT_RANGE.match(headers.get("Content-Range", ""))
+    if match is None or match.group(3) == "*":
+        return None, None
+    return int(match.group(3)), headers.get("ETag") or headers.get("Last-Modified")
+
+
+def check_segment_response(url, status, headers, start):
+    if status != 206:
+        raise DownloadError(f"Expected 206 for a range request, got {status}; the resource may have changed", url=url)
+    match = _CONTENT_RANGE.match(headers.get("Content-Range", ""))
+    if match is None or int(match.group(1)) != start:
+        raise DownloadError(f"Server returned an unexpected Content-Range: {headers.get('Content-Range')}", url=url)
+
+
+def segment_headers(headers, state, start, end):
+    headers = dict(headers)
+    headers["Range"] = f"bytes={start}-{end}"
+    if state.validator:
+        headers["If-Range"] = state.validator
+    return headers
+
+
+def preallocate(path, length):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if os.fstat(fd).st_size != length:
+            os.ftruncate(fd, length)
+            if hasattr(os, "posix_fallocate") and length:
+                try:
+                    os.posix_fallocate(fd, 0, length)
+                except OSError:
+                    pass
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def verify(url, path, length, checksum):
+    size = os.path.getsize(path)
+    if length is not None and size != length:
+        raise DownloadError(f"Downloaded {size} bytes, expected {length}", url=url)
+    algorithm, expected = parse_checksum(checksum)
+    if algorithm is None:
+        return None
+    actual = file_digest(path, algorithm)
+    if actual != expected:
+        raise DownloadError(f"{algorithm} mismatch: expected {expected}, got {actual}", url=url)
+    return actual
+
+
+def base_headers(headers):
+    headers = dict(headers or {})
+    # Ranges address the encoded representation; ask for the raw bytes.
+    headers["Accept-Encoding"] = "identity"
+    return headers
+
+
+def _iter_body(response, chunk_size):
+    if hasattr(response, "iter_content"):
+        return response.iter_content(chunk_size)
+    return response.iter_bytes(chunk_size)
+
+
+def _pwrite_all(fd, data, offset):
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _write_empty(path):
+    # Only an empty resource can't satisfy the ``bytes=0-0`` probe.
+    with open(path, "wb"):
+        pass
+
+
+def _raise_for_error(response, url):
+    if response.status_code >= 300:
+        _raise_for_status(response.status_code, url, response.text, response=response)
+
+
+def download(url, path, segments=4, checksum=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, **kwargs):
+    """Download ``url`` to ``path``; see ``JmNetwork.download``."""
+    parse_checksum(checksum)
+    headers = base_headers(kwargs.pop("headers", None))
+    state_path = path + STATE_SUFFIX
+    state = _DownloadState.load(state_path, url) if os.path.exists(path) else None
+    resumed = state is not None
+
+    if state is None:
+        probe = _send("get", url, headers=dict(headers, Range="bytes=0-0"), stream=True, **kwargs)
+        try:
+            if probe.status_code == 416:
+                _write_empty(path)
+                return DownloadResult(path, 0, 1, False, verify(url, path, 0, checksum))
+            _raise_for_error(probe, url)
+            length, validator = range_probe(probe.headers) if probe.status_code == 206 else (None, None)
+            if length is None:
+                _stream_to_file(probe, url, path, chunk_size, progress)
+                return DownloadResult(path, os.path.getsize(path), 1, False, verify(url, path, _content_length(probe), checksum))
+        finally:
+            probe.close()
+        state = _DownloadState.plan(state_path, url, length, validator, segments)
+        state.save()
+
+    fd = preallocate(path, state.length)
+    lock = threading.Lock()
+
+    def fetch(index):
+        start, end, done = state.segments[index]
+        if start + done > end:
+            return
+        response = _send("get", url, headers=segment_headers(headers, state, start + done, end), stream=True, **kwargs)
+        try:
+            _raise_for_error(response, url)
+            check_segment_response(url, response.status_code, response.headers, start + done)
+            offset = start + done
+            for chunk in _iter_body(response, chunk_size):
+                chunk = chunk[:end + 1 - offset]
+                _pwrite_all(fd, chunk, offset)
+                offset += len(chunk)
+                state.advance(index, len(chunk))
+                if progress is not None:
+                    with lock:
+                        progress(state.done, state.length)
+        finally:
+            response.close()
+
+    changed = False
+    try:
+        pending = [index for index, segment in enumerate(state.segments) if segment[0] + segment[2] <= segment[1]]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                for future in [pool.submit(fetch, index) for index in pending]:
+                    future.result()
+    except DownloadError:
+        # The resource changed under us; the next attempt has to start over.
+        changed = True
+        raise
+    finally:
+        os.close(fd)
+        if changed:
+            state.remove()
+        else:
+            state.save()
+
+    if state.done != state.length:
+        raise DownloadError(f"Downloaded {state.done} bytes, expected {state.length}", url=url)
+    digest = verify(url, path, state.length, checksum)
+    state.remove()
+    return DownloadResult(path, state.length, len(state.segments), resumed, digest)
+
+
+def _content_length(response):
+    length = response.headers.get("Content-Length")
+    if response.headers.get("Content-Encoding") not in (None, "identity"):
+        return None
+    return int(length) if length and length.isdigit() else None
+
+
+def _stream_to_file(response, url, path, chunk_size, progress):
+    total = _content_length(response)
+    done = 0
+    with open(path, "wb") as file:
+        for chunk in _iter_body(response, chunk_size):
+            file.write(chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total)
+
+
+async def download_async(client, url, path, segments=4, checksum=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, **kwargs):
+    """Download ``url`` to ``path`` with ``client`` (an ``AsyncNetworking``).
+
+    Every request goes through the client, so it is counted as in flight,
+    scheduled (``priority=``) and timed out like any other.
+    """
+    import asyncio
+
+    parse_checksum(checksum)
+    loop = asyncio.get_running_loop()
+    headers = base_headers(client.headers)
+    headers.update(base_headers(kwargs.pop("headers", None)))
+    state_path = path + STATE_SUFFIX
+    state = _DownloadState.load(state_path, url) if os.path.exists(path) else None
+    resumed = state is not None
+
+    if state is None:
+        async with client._stream("GET", url, headers=dict(headers, Range="bytes=0-0"), **kwargs) as probe:
+            if probe.status == 416:
+                await loop.run_in_executor(None, _write_empty, path)
+                digest = await loop.run_in_executor(None, verify, url, path, 0, checksum)
+                return DownloadResult(path, 0, 1, False, digest)
+            await _raise_for_error_async(probe, url)
+            length, validator = range_probe(probe.headers) if probe.status == 206 else (None, None)
+            if length is None:
+                size = await _stream_to_file_async(probe, path, chunk_size, progress, loop)
+                total = _async_content_length(probe)
+                digest = await loop.run_in_executor(None, verify, url, path, total, checksum)
+                return DownloadResult(path, size, 1, False, digest)
+        state = _DownloadState.plan(state_path, url, length, validator, segments)
+        await loop.run_in_executor(None, state.save)
+
+    fd = await loop.run_in_executor(None, preallocate, path, state.length)
+
+    async def fetch(index):
+        start, end, done = state.segments[index]
+        offset = start + done
+        request_headers = segment_headers(headers, state, offset, end)
+        async with client._stream("GET", url, headers=request_headers, **kwargs) as response:
+            await _raise_for_error_async(response, url)
+            check_segment_response(url, response.status, response.headers, offset)
+            async for chunk in _aiter_body(response, chunk_size):
+                chunk = chunk[:end + 1 - offset]
+                await loop.run_in_executor(None, _write_segment, fd, chunk, offset, state, index)
+                offset += len(chunk)
+                if progress is not None:
+                    progress(state.done, state.length)
+
+    changed = False
+    try:
+        pending = [index for index, segment in enumerate(state.segments) if segment[0] + segment[2] <= segment[1]]
+        await asyncio.gather(*(fetch(index) for index in pending))
+    except DownloadError:
+        changed = True
+        raise
+    finally:
+        os.close(fd)
+        await loop.run_in_executor(None, state.remove if changed else state.save)
+
+    if state.done != state.length:
+        raise DownloadError(f"Downloaded {state.done} bytes, expected {state.length}", url=url)
+    digest = await loop.run_in_executor(None, verify, url, path, state.length, checksum)
+    await loop.run_in_executor(None, state.remove)
+    return DownloadResult(path, state.length, len(state.segments), resumed, digest)
+
+
+def _write_segment(fd, chunk, offset, state, index):
+    _pwrite_all(fd, chunk, offset)
+    state.advance(index, len(chunk))
+
+
+async def _raise_for_error_async(response, url):
+    if response.status >= 300:
+        _raise_for_status(response.status, url, await response.text(), response=response)
+
+
+def _async_content_length(response):
+    if response.headers.get("Content-Encoding") not in (None, "identity"):
+        return None
+    return response.content_length
+
+
+async def _aiter_body(response, chunk_size):
+    content = getattr(response, "content", None)
+    if content is not None and hasattr(content, "iter_chunked"):
+        async for chunk in content.iter_chunked(chunk_size):
+            yield chunk
+        return
+    yield await response.read()
+
+
+async def _stream_to_file_async(response, path, chunk_size, progress, loop):
+    total = _async_content_length(response)
+    done = 0
+    file = await loop.run_in_executor(None, open, path, "wb")
+    try:
+        async for chunk in _aiter_body(response, chunk_size):
+            await loop.run_in_executor(None, file.write, chunk)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total)
+    finally:
+        await loop.run_in_executor(None, file.close)
+    return done
@@ -0,0 +1,140 @@
+"""Run ``AsyncNetworking`` on a background event loop for synchronous callers.
+
+``AsyncEngine`` owns one daemon thread running an asyncio loop and one
+long-lived ``AsyncNetworking`` client on it. ``submit`` schedules a request
+on the loop and returns a ``concurrent.futures.Future`` right away, so sync
+code can keep thousands of requests in flight from a single thread:
+
+    with AsyncEngine(timeout=10) as engine:
+        futures = [engine.submit("GET", url, is_json=True) for url in urls]
+        results = [future.result() for future in futures]
+
+``JmNetwork.submit`` uses a process-wide default engine.
+"""
+
+import asyncio
+import atexit
+import threading
+
+from jm_networking import AsyncNetworking
+
+
+class AsyncEngine:
+
+    def __init__(self, max_concurrency=None, **client_kwargs):
+        self.max_concurrency = max_concurrency
+        self.client_kwargs = client_kwargs
+        self.client = None
+        self.loop = None
+        self._thread = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if self.running:
+                return self
+            ready = threading.Event()
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, args=(ready,), name="jm-networking-engine", daemon=True)
+            self._thread.start()
+            ready.wait()
+            asyncio.run_coroutine_threadsafe(self._open(), self.loop).result()
+        return self
+
+    def submit(self, method, url, **kwargs):
+        """Schedule ``method url`` and return a ``concurrent.futures.Future`` of ``(status, payload)``."""
+        return self.submit_call(lambda client: client._request(method.upper(), url, **kwargs))
+
+    def submit_call(self, func):
+        """Schedule ``func(client)``, a coroutine function taking the ``AsyncNetworking`` client."""
+        if not self.running:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(self._guarded(func), self.loop)
+
+    def request(self, method, url, **kwargs):
+        """Blocking form of ``submit``: wait for and return ``(status, payload)``."""
+        return self.submit(method, url, **kwargs).result()
+
+    def get(self, url, is_json=False, params=None, **kwargs):
+        return self.request("GET", url, is_json=is_json, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, json=None, **kwargs):
+        return self.request("PUT", url, data=data, json=json, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self, timeout=None):
+        with self._lock:
+            if not self.running:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self.client.close(), self.loop).result(timeout)
+            finally:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self._thread.join(timeout)
+                self._thread = None
+                self.client = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    async def _open(self):
+        self.client = AsyncNetworking(**self.client_kwargs)
+        if self.max_concurrency is not None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def _guarded(self, func):
+        if self._semaphore is None:
+            return await func(self.client)
+        async with self._semaphore:
+            return await func(self.client)
+
+    def _run(self, ready):
+        loop = self.loop
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+_DEFAULT_ENGINE = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_engine():
+    """Return the shared engine behind ``JmNetwork.submit``, starting it on first use."""
+    global _DEFAULT_ENGINE
+    with _DEFAULT_LOCK:
+        if _DEFAULT_ENGINE is None:
+            _DEFAULT_ENGINE = AsyncEngine().start()
+            atexit.register(_DEFAULT_ENGINE.close)
+        return _DEFAULT_ENGINE
+
+
+def shutdown_default_engine():
+    global _DEFAULT_ENGINE
+    with _DEFAULT_LOCK:
+        engine, _DEFAULT_ENGINE = _DEFAULT_ENGINE, None
+    if engine is not None:
+        atexit.unregister(engine.close)
+        engine.close()
@@ -0,0 +1,259 @@
+"""Load generator built on ``AsyncNetworking``.
+
+Open-loop mode (``--rps``) sends requests on a fixed schedule whether or not
+earlier requests have completed. Latency is measured from each request's
+*intended* start time, so a stalled target or an overloaded client shows up
+in the percentiles instead of silently slowing the schedule down
+(coordinated omission correction).
+
+Closed-loop mode (``--concurrency``) keeps a fixed number of requests in
+flight, optionally capped at ``--max-rps`` with the same token bucket used by
+``RateLimitedNetworking``.
+
+    python -m jm_networking.load https://service.local/health --rps 200 --duration 30
+    python -m jm_networking.load https://service.local/a https://service.local/b --concurrency 50 --json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from collections import Counter
+
+from jm_networking import AsyncNetworking, HttpError, _TokenBucket
+
+
+PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class LoadResult:
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.latencies = []
+        self.service_times = []
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.timeline = Counter()
+        self.started_at = None
+        self.duration = 0.0
+
+    def record(self, intended, sent, finished, status=None, error=None):
+        self.latencies.append(finished - intended)
+        self.service_times.append(finished - sent)
+        self.timeline[int(finished - self.started_at)] += 1
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+            if isinstance(error, HttpError):
+                self.statuses[error.status_code] += 1
+        elif status is not None:
+            self.statuses[status] += 1
+
+    @property
+    def requests(self):
+        return len(self.latencies)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        service_times = sorted(self.service_times)
+        seconds = range(int(self.duration) + 1) if self.requests else range(0)
+        return {
+            "mode": self.mode,
+            "requests": self.requests,
+            "errors": sum(self.errors.values()),
+            "duration": self.duration,
+            "throughput": self.requests / self.duration if self.duration > 0 else None,
+            "latency": {f"p{fraction * 100:g}": percentile(latencies, fraction) for fraction in PERCENTILES},
+            "service_time": {f"p{fraction * 100:g}": percentile(service_times, fraction) for fraction in PERCENTILES},
+            "max_latency": latencies[-1] if latencies else None,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "error_types": dict(self.errors.most_common()),
+            "throughput_over_time": [self.timeline.get(second, 0) for second in seconds],
+        }
+
+    def format_text(self):
+        summary = self.summary()
+        lines = [
+            f"mode:        {summary['mode']}",
+            f"requests:    {summary['requests']} ({summary['errors']} errors) in {summary['duration']:.2f}s",
+            f"throughput:  {_fmt(summary['throughput'], '.1f')} req/s",
+            "latency (corrected for coordinated omission):",
+        ]
+        for name, value in summary["latency"].items():
+            lines.append(f"  {name:<7} {_fmt_ms(value)}")
+        lines.append("service time:")
+        for name, value in summary["service_time"].items():
+            lines.append(f"  {name:<7} {_fmt_ms(value)}")
+        if summary["statuses"]:
+            lines.append("statuses:    " + ", ".join(f"{status}={count}" for status, count in summary["statuses"].items()))
+        if summary["error_types"]:
+            lines.append("errors:")
+            for name, count in summary["error_types"].items():
+                lines.append(f"  {name:<28} {count}")
+        lines.append("throughput over time (req/s): " + " ".join(str(count) for count in summary["throughput_over_time"]))
+        return "\n".join(lines)
+
+
+def _fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def _fmt_ms(value):
+    return "-" if value is None else f"{value * 1000:.2f} ms"
+
+
+async def _send(client, method, url, result, intended):
+    sent = time.monotonic()
+    try:
+        status, _ = await client._request(method, url)
+    except Exception as ex:
+        result.record(intended, sent, time.monotonic(), error=ex)
+    else:
+        result.record(intended, sent, time.monotonic(), status=status)
+
+
+async def run_open_loop(client, urls, rps, duration=None, requests=None, method="GET", max_in_flight=10000):
+    result = LoadResult("open-loop")
+    interval = 1.0 / rps
+    total = requests if requests is not None else int(rps * duration)
+    in_flight = asyncio.Semaphore(max_in_flight)
+    tasks = set()
+
+    async def one(url, intended):
+        try:
+            await _send(client, method, url, result, intended)
+        finally:
+            in_flight.release()
+
+    result.started_at = time.monotonic()
+    for index in range(total):
+        intended = result.started_at + index * interval
+        delay = intended - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await in_flight.acquire()
+        task = asyncio.ensure_future(one(urls[index % len(urls)], intended))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    result.duration = time.monotonic() - result.started_at
+    return result
+
+
+async def run_closed_loop(client, urls, concurrency, duration=None, requests=None, method="GET", max_rps=None):
+    result = LoadResult("closed-loop")
+    bucket = _TokenBucket(max_rps, 1) if max_rps else None
+    sequence = itertools.count()
+
+    result.started_at = time.monotonic()
+    deadline = result.started_at + duration if duration is not None else None
+
+    async def worker():
+        while True:
+            index = next(sequence)
+            if requests is not None and index >= requests:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            if bucket is not None:
+                await bucket.acquire_async()
+            await _send(client, method, urls[index % len(urls)], result, time.monotonic())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.duration = time.monotonic() - result.started_at
+    return result
+
+
+async def run_load(
+    urls,
+    rps=None,
+    concurrency=10,
+    duration=None,
+    requests=None,
+    method="GET",
+    headers=None,
+    timeout=None,
+    max_rps=None,
+    max_in_flight=10000,
+    session=None,
+):
+    if duration is None and requests is None:
+        raise ValueError("Either duration or requests is required.")
+    if not urls:
+        raise ValueError("At least one target URL is required.")
+
+    method = method.upper()
+    async with AsyncNetworking(session=session, headers=headers, timeout=timeout) as client:
+        if rps:
+            return await run_open_loop(client, urls, rps, duration=duration, requests=requests, method=method, max_in_flight=max_in_flight)
+        return await run_closed_loop(client, urls, concurrency, duration=duration, requests=requests, method=method, max_rps=max_rps)
+
+
+def _header(value):
+    name, sep, header_value = value.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected 'Name: value', got {value!r}")
+    return name.strip(), header_value.strip()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m jm_networking.load", description="Generate HTTP load with AsyncNetworking.")
+    parser.add_argument("urls", nargs="*", help="Target URLs, used round-robin.")
+    parser.add_argument("--url-file", help="File with one target URL per line.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rps", type=float, help="Open-loop: send at this fixed rate.")
+    mode.add_argument("--concurrency", type=int, default=10, help="Closed-loop: requests kept in flight (default 10).")
+    parser.add_argument("--max-rps", type=float, help="Closed-loop rate cap.")
+    parser.add_argument("--duration", type=float, help="Seconds to run (default 10 unless --requests is given).")
+    parser.add_argument("--requests", type=int, help="Total requests to send.")
+    parser.add_argument("--method", default="GET", help="HTTP method (default GET).")
+    parser.add_argument("--header", "-H", action="append", type=_header, default=[], help="Extra header, 'Name: value'.")
+    parser.add_argument("--timeout", type=float, help="Total per-request timeout in seconds.")
+    parser.add_argument("--max-in-flight", type=int, default=10000, help="Open-loop cap on concurrent requests.")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = parser.parse_args(argv)
+
+    if args.url_file:
+        with open(args.url_file) as handle:
+            args.urls.extend(line.strip() for line in handle if line.strip() and not line.startswith("#"))
+    if not args.urls:
+        parser.error("at least one URL is required")
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = asyncio.run(run_load(
+        args.urls,
+        rps=args.rps,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        requests=args.requests,
+        method=args.method,
+        headers=dict(args.header) or None,
+        timeout=args.timeout,
+        max_rps=args.max_rps,
+        max_in_flight=args.max_in_flight,
+    ))
+    if args.json:
+        json.dump(result.summary(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(result.format_text())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Short-lived cache of deterministic GET failures.
+
+Lookups for IDs that do not exist tend to be repeated, and each repeat costs a
+round trip that ends in the same ``NotFoundError``. ``NegativeCache``
+remembers ``404``, ``403`` and ``422`` responses per URL for ``ttl`` seconds.
+While an entry is live, the same request raises a new exception of the same
+class locally (with ``response=None``). The cache holds at most
+``max_entries`` entries and evicts the least recently used first. Error bodies
+are kept up to ``max_body`` characters.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+DEFAULT_STATUSES = (404, 403, 422)
+
+
+class _Failure:
+
+    __slots__ = ("error_class", "status_code", "url", "body", "expires")
+
+    def __init__(self, error, expires, max_body):
+        self.error_class = error.__class__
+        self.status_code = error.status_code
+        self.url = error.url
+        body = error.body
+        self.body = body[:max_body] if isinstance(body, str) else None
+        self.expires = expires
+
+    def error(self):
+        return self.error_class(self.status_code, self.url, body=self.body)
+
+
+class NegativeCache:
+
+    def __init__(self, ttl=30.0, max_entries=10000, statuses=DEFAULT_STATUSES, max_body=4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.statuses = frozenset(statuses)
+        self.max_body = max_body
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "stores": 0, "evictions": 0, "expirations": 0}
+
+    def check(self, key):
+        """Raise the cached error for ``key``, if there is a live one."""
+        with self._lock:
+            failure = self._entries.get(key)
+            if failure is None:
+                return
+            if failure.expires <= time.monotonic():
+                del self._entries[key]
+                self._counts["expirations"] += 1
+                return
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+        raise failure.error()
+
+    def record(self, key, error):
+        """Remember ``error`` for ``key`` if its status is one of ``statuses``."""
+        if getattr(error, "status_code", None) not in self.statuses:
+            return
+        failure = _Failure(error, time.monotonic() + self.ttl, self.max_body)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = failure
+            self._counts["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts, entries=len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,151 @@
+"""Cache of deserialized objects, revalidated with ETags.
+
+An HTTP cache still hands back a body, so every ``304 Not Modified`` costs a
+JSON parse and a schema load. ``ObjectCache`` keeps the already deserialized
+result of ``ObjectNetworking.get`` instead. The key is the request URL plus
+how the body was loaded. Each entry keeps the validators (``ETag``,
+``Last-Modified``) and the ``Cache-Control: max-age`` freshness lifetime of
+its response.
+
+- A fresh entry is returned without a request.
+- A stale entry is revalidated with ``If-None-Match``/``If-Modified-Since``. On
+  ``304`` the cached objects are returned and the entry's lifetime renewed.
+- Responses with ``no-store``, or with no validator and no max-age, are not
+  cached.
+
+The cache is an LRU bounded by ``max_bytes``, measured as the size of the
+response bodies the entries were loaded from. ``copy_on_read=True`` returns a
+deep copy on every read, for callers that mutate the objects they get back.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheEntry:
+
+    __slots__ = ("status_code", "objects", "etag", "last_modified", "expires", "size")
+
+    def __init__(self, status_code, objects, etag, last_modified, expires, size):
+        self.status_code = status_code
+        self.objects = objects
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+        self.size = size
+
+    @property
+    def fresh(self):
+        return self.expires is not None and time.monotonic() < self.expires
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _cache_control(headers):
+    directives = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _expires(headers):
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return None
+    try:
+        max_age = int(directives["max-age"])
+        age = int(headers.get("Age") or 0)
+    except (KeyError, ValueError):
+        return None
+    return time.monotonic() + max(max_age - age, 0)
+
+
+class ObjectCache:
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, copy_on_read=False):
+        self.max_bytes = max_bytes
+        self.copy_on_read = copy_on_read
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def lookup(self, key):
+        """Return the entry for ``key`` (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counts["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+            return entry
+
+    def read(self, entry, revalidated=False):
+        """Return ``entry``'s objects, counting a hit (or a ``304`` when ``revalidated``)."""
+        with self._lock:
+            self._counts["revalidated" if revalidated else "hits"] += 1
+        return copy.deepcopy(entry.objects) if self.copy_on_read else entry.objects
+
+    def store(self, key, status_code, objects, headers, size):
+        """Cache ``objects`` if ``headers`` allow it; returns the new entry or None."""
+        if "no-store" in _cache_control(headers):
+            self.discard(key)
+            return None
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        expires = _expires(headers)
+        if (etag is None and last_modified is None and expires is None) or size > self.max_bytes:
+            self.discard(key)
+            return None
+        if self.copy_on_read:
+            objects = copy.deepcopy(objects)
+        entry = CacheEntry(status_code, objects, etag, last_modified, expires, size)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.size
+            self._entries[key] = entry
+            self.current_bytes += size
+            self._counts["stores"] += 1
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self._counts["evictions"] += 1
+        return entry
+
+    def renew(self, entry, headers):
+        """Update ``entry`` from the headers of a ``304`` response."""
+        entry.expires = _expires(headers)
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+
+    def discard(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts, entries=len(self._entries), bytes=self.current_bytes)
+
+    def __len__(self):
+        return len(self._entries)
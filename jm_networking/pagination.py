@@ -0,0 +1,260 @@
+"""Pagination strategies and prefetching page iterators.
+
+A strategy knows how to build the first page request, find the next one from
+a page (``Link`` header, a cursor field in the body, or offset arithmetic)
+and pull the raw items out of a page's payload. ``iterate_pages`` and
+``aiterate_pages`` drive a strategy while a background worker fetches and
+deserializes up to ``prefetch`` pages ahead of the consumer. Offset
+pagination knows every page URL up front, so its pages are also fetched
+concurrently, ``prefetch`` at a time.
+
+``ObjectNetworking.paginate`` and ``AsyncNetworking.paginate`` are the entry
+points.
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from requests.utils import parse_header_links
+
+
+class PageRequest:
+
+    def __init__(self, url, params=None):
+        self.url = url
+        self.params = dict(params or {})
+
+    def __repr__(self):
+        return f"PageRequest(url={self.url!r}, params={self.params!r})"
+
+
+class Page:
+
+    def __init__(self, request, headers, payload, items):
+        self.request = request
+        self.headers = headers
+        self.payload = payload
+        self.items = items
+
+
+def _field(payload, path):
+    for part in path.split("."):
+        if not isinstance(payload, dict):
+            return None
+        payload = payload.get(part)
+    return payload
+
+
+class _Strategy:
+    items_field = None
+    # True when the next request can be built without seeing the current page.
+    predictable = False
+
+    def first_request(self, url, params):
+        return PageRequest(url, params)
+
+    def items(self, payload):
+        if self.items_field is None:
+            return payload if isinstance(payload, list) else [payload]
+        return _field(payload, self.items_field) or []
+
+
+class LinkHeaderPagination(_Strategy):
+    """Follows the ``Link: <...>; rel="next"`` response header (RFC 8288)."""
+
+    def __init__(self, rel="next", items_field=None):
+        self.rel = rel
+        self.items_field = items_field
+
+    def next_request(self, request, page):
+        for link in parse_header_links(page.headers.get("Link", "")):
+            if link.get("rel") == self.rel and link.get("url"):
+                return PageRequest(urljoin(request.url, link["url"]))
+        return None
+
+
+class CursorPagination(_Strategy):
+    """Sends the cursor found at ``cursor_field`` (a dotted path) back as ``cursor_param``."""
+
+    def __init__(self, cursor_param="cursor", cursor_field="next_cursor", items_field="items"):
+        self.cursor_param = cursor_param
+        self.cursor_field = cursor_field
+        self.items_field = items_field
+
+    def next_request(self, request, page):
+        cursor = _field(page.payload, self.cursor_field)
+        if cursor in (None, ""):
+            return None
+        return PageRequest(request.url, dict(request.params, **{self.cursor_param: cursor}))
+
+
+class OffsetPagination(_Strategy):
+    """``offset``/``limit`` query parameters; stops at the first short page."""
+
+    predictable = True
+
+    def __init__(self, limit=100, offset_param="offset", limit_param="limit", items_field=None, start=0):
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.items_field = items_field
+        self.start = start
+
+    def first_request(self, url, params):
+        params = dict(params or {})
+        params.setdefault(self.offset_param, self.start)
+        params[self.limit_param] = self.limit
+        return PageRequest(url, params)
+
+    def next_request(self, request, page=None):
+        if page is not None and len(page.items) < self.limit:
+            return None
+        return PageRequest(request.url, dict(request.params, **{self.offset_param: request.params[self.offset_param] + self.limit}))
+
+    def is_last(self, page):
+        return len(page.items) < self.limit
+
+
+STRATEGIES = {"link": LinkHeaderPagination, "cursor": CursorPagination, "offset": OffsetPagination}
+
+
+def resolve_strategy(strategy):
+    if strategy is None:
+        return LinkHeaderPagination()
+    if isinstance(strategy, str):
+        try:
+            return STRATEGIES[strategy]()
+        except KeyError:
+            raise ValueError(f"Unknown pagination strategy: {strategy}") from None
+    return strategy
+
+
+_DONE = object()
+
+
+def iterate_pages(fetch, strategy, url, params=None, prefetch=1, max_pages=None):
+    """Yield ``Page`` objects, fetched by ``fetch(request)`` in a background thread.
+
+    ``fetch`` returns a ``Page``. At most ``prefetch`` pages are buffered ahead
+    of the consumer; closing the generator stops the worker.
+    """
+    prefetch = max(1, prefetch)
+    pages = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for page in _fetch_pages(fetch, strategy, url, params, prefetch, max_pages, stop):
+                if not put(page):
+                    return
+            put(_DONE)
+        except BaseException as ex:
+            put(ex)
+
+    worker = threading.Thread(target=produce, name="jm-networking-paginate", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def _fetch_pages(fetch, strategy, url, params, prefetch, max_pages, stop):
+    request = strategy.first_request(url, params)
+    count = 0
+    if strategy.predictable and prefetch > 1:
+        with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="jm-networking-page") as pool:
+            window = deque()
+            try:
+                while not stop.is_set():
+                    while request is not None and len(window) < prefetch and (max_pages is None or count + len(window) < max_pages):
+                        window.append(pool.submit(fetch, request))
+                        request = strategy.next_request(request)
+                    if not window:
+                        return
+                    page = window.popleft().result()
+                    count += 1
+                    yield page
+                    if strategy.is_last(page):
+                        return
+            finally:
+                for future in window:
+                    future.cancel()
+        return
+
+    while request is not None and not stop.is_set() and (max_pages is None or count < max_pages):
+        page = fetch(request)
+        count += 1
+        yield page
+        request = strategy.next_request(request, page)
+
+
+async def aiterate_pages(fetch, strategy, url, params=None, prefetch=1, max_pages=None):
+    """Async counterpart of ``iterate_pages``; ``fetch`` is a coroutine function."""
+    import asyncio
+
+    prefetch = max(1, prefetch)
+    pages = asyncio.Queue(maxsize=prefetch)
+
+    async def produce():
+        try:
+            request = strategy.first_request(url, params)
+            count = 0
+            if strategy.predictable and prefetch > 1:
+                window = deque()
+                try:
+                    while True:
+                        while request is not None and len(window) < prefetch and (max_pages is None or count + len(window) < max_pages):
+                            window.append(asyncio.ensure_future(fetch(request)))
+                            request = strategy.next_request(request)
+                        if not window:
+                            break
+                        page = await window.popleft()
+                        count += 1
+                        await pages.put(page)
+                        if strategy.is_last(page):
+                            break
+                finally:
+                    for task in window:
+                        task.cancel()
+            else:
+                while request is not None and (max_pages is None or count < max_pages):
+                    page = await fetch(request)
+                    count += 1
+                    await pages.put(page)
+                    request = strategy.next_request(request, page)
+            await pages.put(_DONE)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as ex:
+            await pages.put(ex)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
@@ -0,0 +1,116 @@
+"""Fetch and deserialize across worker processes.
+
+``ObjectNetworking.get`` spends most of its time in ``schema.load`` once the
+network is fast, and that is bound to one core by the GIL. ``ProcessFetcher``
+shards a URL list into batches and runs ``ObjectNetworking.get`` for each
+batch in a pool of worker processes. Each worker has its own session (the
+shared one is dropped after a fork) and its own ``_schema_class_for`` cache,
+which stays warm for the life of the pool. Each batch comes back as a single
+pickle, and results are yielded as batches complete, either in input order
+(``ordered=True``) or as soon as they arrive.
+
+    with ProcessFetcher(processes=8) as fetcher:
+        for result in fetcher.fetch(urls, Todo, ordered=False):
+            ...
+"""
+
+import multiprocessing
+import os
+import pickle
+
+from jm_networking import NetworkError, ObjectNetworking
+
+
+class FetchResult:
+    """Outcome of one URL: ``status_code`` and ``data`` on success, else ``error``.
+
+    ``error`` is the ``NetworkError`` raised for the request, or whatever
+    deserializing the payload raised (e.g. a marshmallow ``ValidationError``).
+    """
+
+    __slots__ = ("index", "url", "status_code", "data", "error")
+
+    def __init__(self, index, url, status_code=None, data=None, error=None):
+        self.index = index
+        self.url = url
+        self.status_code = status_code
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"FetchResult(url={self.url!r}, status_code={self.status_code}, ok={self.ok})"
+
+
+def _portable(error):
+    # Responses and wrapped transport exceptions hold sockets and locks; the
+    # message, status, url and body are what cross the process boundary.
+    if hasattr(error, "response"):
+        error.response = None
+    if hasattr(error, "original"):
+        error.original = None
+    if isinstance(error, NetworkError):
+        return error
+    try:
+        pickle.dumps(error)
+    except Exception:
+        # Keep the type and message of errors that can't cross as they are.
+        return RuntimeError(f"{error.__class__.__name__}: {error}")
+    return error
+
+
+def _fetch_batch(task):
+    batch, class_object, kwargs = task
+    results = []
+    for index, url in batch:
+        try:
+            status_code, data = ObjectNetworking.get(url, class_object, **kwargs)
+        except Exception as ex:
+            # One bad payload fails its own URL, not the rest of the batch.
+            results.append(FetchResult(index, url, error=_portable(ex)))
+        else:
+            results.append(FetchResult(index, url, status_code=status_code, data=data))
+    return results
+
+
+class ProcessFetcher:
+
+    def __init__(self, processes=None, batch_size=16, start_method=None):
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.start_method = start_method
+        self._pool = None
+
+    def start(self):
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._pool = context.Pool(self.processes)
+        return self
+
+    def fetch(self, urls, class_object, ordered=True, **kwargs):
+        """Yield a ``FetchResult`` per URL; ``kwargs`` go to ``ObjectNetworking.get``."""
+        self.start()
+        indexed = list(enumerate(urls))
+        tasks = [
+            (indexed[start:start + self.batch_size], class_object, kwargs)
+            for start in range(0, len(indexed), self.batch_size)
+        ]
+        imap = self._pool.imap if ordered else self._pool.imap_unordered
+        for batch in imap(_fetch_batch, tasks):
+            yield from batch
+
+    def close(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,154 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+
+STAGES = ("network", "parse", "schema", "load")
+
+
+class _StageTotals:
+    __slots__ = ("wall", "cpu", "max_wall")
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+
+    def add(self, wall, cpu):
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_wall:
+            self.max_wall = wall
+
+
+class _TypeTotals:
+
+    def __init__(self):
+        self.calls = 0
+        self.payload_bytes = 0
+        self.objects = 0
+        self.stages = {}
+
+    def as_dict(self):
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "payload_bytes": self.payload_bytes,
+            "objects": self.objects,
+            "stages": {
+                name: {
+                    "wall": totals.wall,
+                    "cpu": totals.cpu,
+                    "avg_wall": totals.wall / calls,
+                    "avg_cpu": totals.cpu / calls,
+                    "max_wall": totals.max_wall,
+                }
+                for name, totals in self.stages.items()
+            },
+        }
+
+
+class ProfiledCall:
+    """Timings for a single ``ObjectNetworking`` call, one entry per stage."""
+
+    def __init__(self, profiler, class_object, url):
+        self.profiler = profiler
+        self.class_object = class_object
+        self.url = url
+        self.stages = {}
+        self.payload_bytes = None
+        self.objects = None
+
+    @contextmanager
+    def stage(self, name):
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            self.stages[name] = (wall, cpu)
+
+    @property
+    def wall(self):
+        return sum(wall for wall, _ in self.stages.values())
+
+    @property
+    def cpu(self):
+        return sum(cpu for _, cpu in self.stages.values())
+
+    def finish(self, payload_bytes=None, objects=None):
+        self.payload_bytes = payload_bytes
+        self.objects = objects
+        self.profiler._record(self)
+
+    def as_dict(self):
+        return {
+            "type": _type_name(self.class_object),
+            "url": self.url,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "payload_bytes": self.payload_bytes,
+            "objects": self.objects,
+            "stages": {name: {"wall": wall, "cpu": cpu} for name, (wall, cpu) in self.stages.items()},
+        }
+
+
+class PipelineProfiler:
+    """Aggregates per-stage wall and CPU time for ``ObjectNetworking`` calls.
+
+    Stages are ``network`` (request and body read), ``parse`` (JSON decode),
+    ``schema`` (schema lookup and construction) and ``load`` (``schema.load``).
+    Calls whose total wall time is at least ``slow_threshold`` seconds are
+    logged and passed to ``on_slow``.
+    """
+
+    def __init__(self, slow_threshold=None, on_slow=None, logger=None):
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+        self.logger = logger or logging.getLogger(__name__)
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def call(self, class_object, url):
+        return ProfiledCall(self, class_object, url)
+
+    def stats(self):
+        with self._lock:
+            return {name: totals.as_dict() for name, totals in self._totals.items()}
+
+    def reset(self):
+        with self._lock:
+            self._totals = {}
+
+    def _record(self, call):
+        name = _type_name(call.class_object)
+        with self._lock:
+            totals = self._totals.get(name)
+            if totals is None:
+                totals = _TypeTotals()
+                self._totals[name] = totals
+            totals.calls += 1
+            totals.payload_bytes += call.payload_bytes or 0
+            totals.objects += call.objects or 0
+            for stage, (wall, cpu) in call.stages.items():
+                stage_totals = totals.stages.get(stage)
+                if stage_totals is None:
+                    stage_totals = _StageTotals()
+                    totals.stages[stage] = stage_totals
+                stage_totals.add(wall, cpu)
+
+        if self.slow_threshold is not None and call.wall >= self.slow_threshold:
+            record = call.as_dict()
+            self.logger.warning(
+                "Slow ObjectNetworking call for %s (%s): %.3fs wall, %.3fs cpu, %s bytes, %s objects",
+                record["type"], call.url, record["wall"], record["cpu"], call.payload_bytes, call.objects,
+            )
+            if self.on_slow is not None:
+                self.on_slow(record)
+
+
+def _type_name(class_object):
+    return f"{class_object.__module__}.{class_object.__qualname__}"
@@ -0,0 +1,115 @@
+"""Field projection: load only the fields a caller reads.
+
+``project(cls, only=..., exclude=...)`` selects a subset of ``cls``'s fields
+and derives a dataclass holding just those fields, keeping their types,
+defaults, metadata and ``cls``'s methods. ``only`` may also be a lighter
+dataclass, which is then used as the target as-is. The schema for the target
+is built with ``unknown=EXCLUDE``, so keys outside the projection are dropped
+before any field is validated or built.
+
+``Projection.query_value`` is the comma-separated list of JSON keys, for APIs
+that accept a field-selection query parameter (``?fields=id,title``).
+"""
+
+import dataclasses
+import sys
+from functools import lru_cache
+
+from jm_networking.compact import _copied_members
+
+
+class Projection:
+
+    def __init__(self, source, target, fields, keys):
+        self.source = source
+        self.target = target
+        self.fields = fields
+        self.keys = keys
+
+    @property
+    def query_value(self):
+        return ",".join(self.keys)
+
+    def __repr__(self):
+        return f"Projection({self.source.__name__}, fields={self.fields!r})"
+
+
+def _data_keys(fields):
+    return tuple(field.metadata.get("data_key", field.name) for field in fields)
+
+
+def _names(value):
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def _rebuild(source, names, values):
+    return projected_class(source, names)(**dict(zip(names, values)))
+
+
+@lru_cache(maxsize=256)
+def projected_class(cls, names):
+    """Return the cached dataclass with only the fields ``names`` of ``cls``."""
+    fields = [field for field in dataclasses.fields(cls) if field.name in names]
+
+    def __reduce__(self):
+        return _rebuild, (cls, names, tuple(getattr(self, name) for name in names))
+
+    namespace = _copied_members(cls, {field.name for field in dataclasses.fields(cls)})
+    namespace["__reduce__"] = __reduce__
+    spec = []
+    for field in fields:
+        options = {}
+        if field.default is not dataclasses.MISSING:
+            options["default"] = field.default
+        if field.default_factory is not dataclasses.MISSING:
+            options["default_factory"] = field.default_factory
+        spec.append((field.name, field.type, dataclasses.field(repr=field.repr, compare=field.compare, metadata=field.metadata, **options)))
+    params = cls.__dataclass_params__
+    options = {"frozen": params.frozen, "order": params.order}
+    if sys.version_info >= (3, 10):
+        # A subset of a kw_only source can put a required field after a
+        # defaulted one. Before 3.10 sources can't be kw_only, and a subset
+        # keeps their field order valid.
+        options["kw_only"] = True
+    projected = dataclasses.make_dataclass(cls.__name__, spec, namespace=namespace, **options)
+    projected.__module__ = cls.__module__
+    projected.__qualname__ = f"{cls.__qualname__}[{','.join(names)}]"
+    return projected
+
+
+@lru_cache(maxsize=256)
+def project(cls, only=None, exclude=None):
+    """Build the ``Projection`` of ``cls`` for ``only``/``exclude`` (cached per argument set).
+
+    ``only`` and ``exclude`` are tuples of field names; ``only`` may instead be
+    a dataclass whose fields all exist on ``cls``.
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    available = {field.name: field for field in dataclasses.fields(cls)}
+
+    if isinstance(only, type):
+        target_fields = dataclasses.fields(only)
+        missing = [field.name for field in target_fields if field.name not in available]
+        if missing:
+            raise ValueError(f"{only.__name__} has fields not on {cls.__name__}: {', '.join(missing)}")
+        if exclude:
+            raise ValueError("exclude cannot be combined with a dataclass projection")
+        names = tuple(field.name for field in target_fields)
+        return Projection(cls, only, names, _data_keys(target_fields))
+
+    only = None if only is None else _names(only)
+    exclude = None if exclude is None else _names(exclude)
+    requested = set(only or ()) | set(exclude or ())
+    unknown = sorted(requested - set(available))
+    if unknown:
+        raise ValueError(f"Unknown fields for {cls.__name__}: {', '.join(unknown)}")
+    selected = [
+        field for name, field in available.items()
+        if (only is None or name in only) and (exclude is None or name not in exclude)
+    ]
+    names = tuple(field.name for field in selected)
+    target = cls if len(selected) == len(available) else projected_class(cls, names)
+    return Projection(cls, target, names, _data_keys(selected))
@@ -0,0 +1,99 @@
+"""Per-host retry budget shared by every client that holds it.
+
+Retrying each 429 up to ``max_retries`` times multiplies the load on an
+upstream that is already struggling. A ``RetryBudget`` caps retries per host
+at ``ratio`` of the successful (2xx) responses seen in the last
+``window`` seconds. ``min_retries_per_second`` adds a floor for low-traffic
+hosts. A retry withdraws one token from the budget; when none are left, the
+caller fails fast instead of retrying.
+
+Counts are kept in a sliding window of one-second slots, so old traffic ages
+out gradually instead of resetting all at once.
+"""
+
+import math
+import threading
+import time
+
+
+class _Window:
+
+    def __init__(self, window, slot_seconds=1.0):
+        self.slot_seconds = slot_seconds
+        slots = max(1, int(math.ceil(window / slot_seconds)))
+        self.counts = [0] * slots
+        self.epochs = [-1] * slots
+
+    def add(self, now, count=1):
+        epoch = int(now // self.slot_seconds)
+        index = epoch % len(self.counts)
+        if self.epochs[index] != epoch:
+            self.epochs[index] = epoch
+            self.counts[index] = 0
+        self.counts[index] += count
+
+    def total(self, now):
+        epoch = int(now // self.slot_seconds)
+        slots = len(self.counts)
+        return sum(count for count, slot in zip(self.counts, self.epochs) if epoch - slot < slots)
+
+
+class _HostBudget:
+
+    def __init__(self, window):
+        self.successes = _Window(window)
+        self.retries = _Window(window)
+        self.retried = 0
+        self.rejected = 0
+
+
+class RetryBudget:
+
+    def __init__(self, ratio=0.1, min_retries_per_second=1.0, window=10.0):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        budget = self._hosts.get(host)
+        if budget is None:
+            budget = self._hosts[host] = _HostBudget(self.window)
+        return budget
+
+    def _available(self, budget, now):
+        allowed = self.ratio * budget.successes.total(now) + self.min_retries_per_second * self.window
+        return allowed - budget.retries.total(now)
+
+    def record_success(self, host):
+        """Count a successful response from ``host`` towards its budget."""
+        with self._lock:
+            self._host(host).successes.add(time.monotonic())
+
+    def try_retry(self, host):
+        """Withdraw one retry for ``host``; False (and counted as rejected) if the budget is spent."""
+        with self._lock:
+            budget = self._host(host)
+            now = time.monotonic()
+            if self._available(budget, now) < 1:
+                budget.rejected += 1
+                return False
+            budget.retries.add(now)
+            budget.retried += 1
+            return True
+
+    def metrics(self):
+        """Per-host budget usage: window counts, remaining retries and lifetime totals."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                host: {
+                    "successes": budget.successes.total(now),
+                    "retries": budget.retries.total(now),
+                    "available": max(0, int(self._available(budget, now))),
+                    "retried": budget.retried,
+                    "rejected": budget.rejected,
+                }
+                for host, budget in self._hosts.items()
+            }
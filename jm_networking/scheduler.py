@@ -0,0 +1,203 @@
+"""Priority scheduling and admission control for ``AsyncNetworking``.
+
+A ``RequestScheduler`` hands out request slots by priority class. Each
+``PriorityClass`` has:
+
+- a concurrency cap,
+- a bounded wait queue, and
+- a queue-wait deadline.
+
+A global ``max_concurrency`` bounds all classes together. When a slot frees
+up, the waiter from the most urgent class that is below its cap gets it.
+Within a class, waiters are served in arrival order. A request is shed with
+``LoadShedError`` instead of waiting when its class queue is full, or when
+it has waited longer than the class's ``max_wait``.
+
+    scheduler = RequestScheduler(max_concurrency=64, classes=[
+        PriorityClass("user", priority=0, max_wait=0.5),
+        PriorityClass("bulk", priority=10, max_concurrency=16, max_queue=1000),
+    ], default="bulk")
+    client = AsyncNetworking(scheduler=scheduler)
+    await client.get(url, priority="user")
+"""
+
+import asyncio
+from collections import deque
+
+from jm_networking import LoadShedError
+
+
+class PriorityClass:
+    """A named class of requests; a lower ``priority`` is served first."""
+
+    def __init__(self, name, priority=0, max_concurrency=None, max_queue=None, max_wait=None):
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+    def __repr__(self):
+        return f"PriorityClass({self.name!r}, priority={self.priority})"
+
+
+DEFAULT_CLASSES = (
+    PriorityClass("high", priority=0),
+    PriorityClass("normal", priority=1),
+    PriorityClass("low", priority=2),
+)
+
+
+class _ClassState:
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.queue = deque()
+        self.active = 0
+        self.admitted = 0
+        self.shed = 0
+        self.expired = 0
+        self.peak_queued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, waited):
+        self.admitted += 1
+        self.wait_total += waited
+        if waited > self.wait_max:
+            self.wait_max = waited
+
+    def snapshot(self):
+        return {
+            "priority": self.spec.priority,
+            "active": self.active,
+            "queued": len(self.queue),
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "expired": self.expired,
+            "wait_avg": self.wait_total / self.admitted if self.admitted else 0.0,
+            "wait_max": self.wait_max,
+        }
+
+
+class _Waiter:
+
+    __slots__ = ("future", "enqueued")
+
+    def __init__(self, future, enqueued):
+        self.future = future
+        self.enqueued = enqueued
+
+
+class _Slot:
+
+    def __init__(self, scheduler, priority):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.state = None
+
+    async def __aenter__(self):
+        self.state = await self.scheduler.acquire(self.priority)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.scheduler.release(self.state)
+        return False
+
+
+class RequestScheduler:
+
+    def __init__(self, max_concurrency=None, classes=DEFAULT_CLASSES, default="normal"):
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self._states = {spec.name: _ClassState(spec) for spec in classes}
+        if default not in self._states:
+            raise ValueError(f"Unknown default priority class: {default}")
+        self.default = default
+        self._ordered = sorted(self._states.values(), key=lambda state: state.spec.priority)
+
+    def slot(self, priority=None):
+        """Async context manager holding one request slot of class ``priority``."""
+        return _Slot(self, priority)
+
+    async def acquire(self, priority=None):
+        """Wait for a slot of class ``priority``; raises ``LoadShedError`` if shed."""
+        state = self._state(priority)
+        spec = state.spec
+        if self._can_run(state):
+            self._grant(state, 0.0)
+            return state
+        if spec.max_queue is not None and len(state.queue) >= spec.max_queue:
+            state.shed += 1
+            raise LoadShedError(f"Queue for {spec.name!r} is full ({spec.max_queue})", priority=spec.name, reason="queue_full")
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(loop.create_future(), loop.time())
+        state.queue.append(waiter)
+        state.peak_queued = max(state.peak_queued, len(state.queue))
+        try:
+            await asyncio.wait((waiter.future,), timeout=spec.max_wait)
+        except BaseException:
+            self._abandon(state, waiter)
+            raise
+        if not waiter.future.done():
+            self._abandon(state, waiter)
+            state.expired += 1
+            raise LoadShedError(
+                f"Waited more than {spec.max_wait}s for a {spec.name!r} slot", priority=spec.name, reason="deadline"
+            )
+        return state
+
+    def release(self, state):
+        state.active -= 1
+        self.active -= 1
+        self._dispatch()
+
+    def stats(self):
+        """Per-class queue depth, concurrency, shed counts and queue-wait times (seconds)."""
+        return {
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "classes": {name: state.snapshot() for name, state in self._states.items()},
+        }
+
+    def _state(self, priority):
+        name = self.default if priority is None else priority
+        try:
+            return self._states[name]
+        except KeyError:
+            raise ValueError(f"Unknown priority class: {name}") from None
+
+    def _can_run(self, state):
+        if self.max_concurrency is not None and self.active >= self.max_concurrency:
+            return False
+        cap = state.spec.max_concurrency
+        return cap is None or state.active < cap
+
+    def _grant(self, state, waited):
+        state.active += 1
+        self.active += 1
+        state.record_wait(waited)
+
+    def _abandon(self, state, waiter):
+        if waiter.future.done() and not waiter.future.cancelled():
+            # The slot was granted while the caller was giving up; hand it on.
+            self.release(state)
+            return
+        waiter.future.cancel()
+        try:
+            state.queue.remove(waiter)
+        except ValueError:
+            pass
+
+    def _dispatch(self):
+        for state in self._ordered:
+            while state.queue and self._can_run(state):
+                waiter = state.queue.popleft()
+                if waiter.future.done():
+                    continue
+                self._grant(state, waiter.future.get_loop().time() - waiter.enqueued)
+                waiter.future.set_result(None)
+            if self.max_concurrency is not None and self.active >= self.max_concurrency:
+                return
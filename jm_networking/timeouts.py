@@ -0,0 +1,115 @@
+"""Connect, read and total timeouts, with per-host overrides.
+
+A ``Timeout`` has three phases, each in seconds (``None`` means unbounded):
+
+- ``connect``: establishing the connection (and TLS handshake).
+- ``read``: the longest wait for the next bytes from the server. This is an
+  idle timeout, so it resets whenever data arrives.
+- ``total``: the whole request. With aiohttp this covers everything up to the
+  end of the body. With requests, which has no overall timeout, it bounds
+  connecting plus waiting for the response headers (urllib3's ``total``).
+
+A ``TimeoutPolicy`` holds the default ``Timeout`` and a table of per-host
+overrides keyed by ``host`` or ``host:port``. Phases an override leaves as
+``None`` inherit the default. The process-wide policy (``set_timeout_policy``)
+applies to every ``JmNetwork``, ``ObjectNetworking`` and
+``RateLimitedNetworking`` request that doesn't pass ``timeout=`` itself, and
+is the default for ``AsyncNetworking`` clients. By default it bounds connect
+(10s) and read (60s) and leaves total open, so long downloads are not cut off
+while a stalled upstream is.
+"""
+
+from urllib.parse import urlsplit
+
+
+DEFAULT_CONNECT = 10.0
+DEFAULT_READ = 60.0
+
+
+class Timeout:
+
+    __slots__ = ("connect", "read", "total")
+
+    def __init__(self, connect=None, read=None, total=None):
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    def merged(self, default):
+        """Fill phases left as ``None`` from ``default``."""
+        return Timeout(
+            self.connect if self.connect is not None else default.connect,
+            self.read if self.read is not None else default.read,
+            self.total if self.total is not None else default.total,
+        )
+
+    def for_requests(self):
+        from urllib3.util import Timeout as Urllib3Timeout
+
+        return Urllib3Timeout(connect=self.connect, read=self.read, total=self.total)
+
+    def for_aiohttp(self):
+        import aiohttp
+
+        return aiohttp.ClientTimeout(total=self.total, sock_connect=self.connect, sock_read=self.read)
+
+    def for_httpx(self):
+        import httpx
+
+        # httpx has no overall deadline; the pool wait is bounded like a connect.
+        return httpx.Timeout(None, connect=self.connect, read=self.read, pool=self.connect)
+
+    def __eq__(self, other):
+        if not isinstance(other, Timeout):
+            return NotImplemented
+        return (self.connect, self.read, self.total) == (other.connect, other.read, other.total)
+
+    def __repr__(self):
+        return f"Timeout(connect={self.connect}, read={self.read}, total={self.total})"
+
+
+def _as_timeout(value):
+    if isinstance(value, Timeout):
+        return value
+    if isinstance(value, dict):
+        return Timeout(**value)
+    if isinstance(value, (int, float)):
+        return Timeout(total=value)
+    raise TypeError(f"Expected a Timeout, dict or number of seconds, got {value!r}")
+
+
+class TimeoutPolicy:
+
+    def __init__(self, connect=DEFAULT_CONNECT, read=DEFAULT_READ, total=None, hosts=None):
+        self.default = Timeout(connect, read, total)
+        self.hosts = {}
+        for host, value in (hosts or {}).items():
+            self.set_host(host, value)
+
+    def set_host(self, host, value):
+        """Override phases for ``host`` (``"api.example.com"`` or ``"api.example.com:8443"``)."""
+        self.hosts[host.lower()] = _as_timeout(value).merged(self.default)
+
+    def for_url(self, url):
+        """The ``Timeout`` for ``url``: a ``host:port`` override, then a ``host`` one, then the default."""
+        if not self.hosts:
+            return self.default
+        parts = urlsplit(url)
+        netloc = parts.netloc.rpartition("@")[2].lower()
+        return self.hosts.get(netloc) or self.hosts.get((parts.hostname or "").lower()) or self.default
+
+    def __repr__(self):
+        return f"TimeoutPolicy(default={self.default!r}, hosts={self.hosts!r})"
+
+
+def resolve_timeout_policy(value, default):
+    """Accept a ``TimeoutPolicy``, a ``Timeout``/dict, a number (total seconds) or None (``default``)."""
+    if value is None:
+        return default
+    if isinstance(value, TimeoutPolicy):
+        return value
+    timeout = _as_timeout(value).merged(default.default)
+    policy = TimeoutPolicy(timeout.connect, timeout.read, timeout.total)
+    for host, override in default.hosts.items():
+        policy.hosts[host] = override
+    return policy
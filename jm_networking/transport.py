@@ -0,0 +1,528 @@
+"""Transport backends used by the sync and async clients.
+
+A sync transport creates the session object behind ``JmNetwork``,
+``ObjectNetworking`` and ``RateLimitedNetworking``; the session only needs
+``requests.Session``-style ``get``/``post``/``put``/``delete`` methods. An
+async transport creates the session behind ``AsyncNetworking``; it needs an
+aiohttp-style ``request()`` async context manager and an async ``close()``.
+
+Each transport also names the exceptions its sessions raise for timeouts
+(``timeout_errors``) and other transport failures (``errors``) so the clients
+can map them onto ``NetworkTimeoutError`` and ``TransportError``, and
+converts a ``jm_networking.timeouts.Timeout`` into its session's own timeout
+type (``request_timeout``).
+"""
+
+import socket
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3.connection import HTTPConnection
+
+from jm_networking.timeouts import Timeout
+
+
+def _accept_encoding():
+    # urllib3 advertises br/zstd only when brotli/zstandard are importable,
+    # which is exactly when it can stream-decompress them.
+    try:
+        from urllib3.util.request import ACCEPT_ENCODING
+    except ImportError:
+        return "gzip, deflate"
+    return ", ".join(encoding.strip() for encoding in ACCEPT_ENCODING.split(","))
+
+
+class _UnixHTTPConnection(HTTPConnection):
+
+    def __init__(self, *args, socket_path=None, **kwargs):
+        self.socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """``requests`` adapter that sends every request over one Unix domain socket.
+
+    Mount it on the ``http://host/`` prefix of the upstream it stands in for,
+    e.g. a local sidecar proxy; the URL host is still sent in ``Host``.
+    """
+
+    def __init__(self, socket_path, **kwargs):
+        self.socket_path = socket_path
+        self._pools = {}
+        super().__init__(**kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool_for(request.url)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool_for(url)
+
+    def _pool_for(self, url):
+        host = urlsplit(url).netloc
+        pool = self._pools.get(host)
+        if pool is None:
+            pool = _UnixHTTPConnectionPool(
+                host,
+                maxsize=self._pool_maxsize,
+                block=self._pool_block,
+                socket_path=self.socket_path,
+            )
+            self._pools[host] = pool
+        return pool
+
+    def close(self):
+        super().close()
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.close()
+
+
+def _unix_socket_key(host):
+    return host.lower().rstrip("/")
+
+
+class RequestsTransport:
+    """Default sync transport: one pooled ``requests.Session``.
+
+    ``unix_sockets`` maps ``host[:port]`` to a Unix socket path; requests to
+    ``http://host[:port]/...`` are sent over that socket instead of TCP.
+    """
+
+    name = "requests"
+
+    def __init__(self, unix_sockets=None):
+        self.unix_sockets = {_unix_socket_key(host): path for host, path in (unix_sockets or {}).items()}
+
+    @property
+    def timeout_errors(self):
+        return (requests.exceptions.Timeout,)
+
+    @property
+    def errors(self):
+        return (requests.exceptions.RequestException,)
+
+    def request_timeout(self, timeout):
+        return timeout.for_requests()
+
+    def create_session(self, dns_cache=None, happy_eyeballs_delay=0.25, stats=None):
+        session = requests.Session()
+        if hasattr(session, "headers"):
+            session.headers["Accept-Encoding"] = _accept_encoding()
+        if dns_cache is not None:
+            from jm_networking.dns import DnsCachingAdapter
+
+            for prefix in ("http://", "https://"):
+                session.mount(prefix, DnsCachingAdapter(dns_cache, happy_eyeballs_delay=happy_eyeballs_delay, stats=stats))
+        for host, path in self.unix_sockets.items():
+            session.mount(f"http://{host}/", UnixSocketAdapter(path))
+        return session
+
+
+class AiohttpTransport:
+    """Default async transport: one ``aiohttp.ClientSession`` per client."""
+
+    name = "aiohttp"
+
+    @property
+    def timeout_errors(self):
+        import asyncio
+
+        return (asyncio.TimeoutError,)
+
+    @property
+    def errors(self):
+        aiohttp = _import_aiohttp()
+        return (aiohttp.ClientError,) if aiohttp is not None else ()
+
+    def request_timeout(self, timeout):
+        return timeout.for_aiohttp()
+
+    def create_connector(self, unix_socket=None, dns_cache=None, happy_eyeballs_delay=0.25, stats=None):
+        aiohttp = _require_aiohttp()
+        if unix_socket is not None:
+            return aiohttp.UnixConnector(path=unix_socket)
+        if dns_cache is not None:
+            from jm_networking.dns import aiohttp_resolver
+
+            return aiohttp.TCPConnector(
+                resolver=aiohttp_resolver(dns_cache, stats=stats),
+                use_dns_cache=False,
+                happy_eyeballs_delay=happy_eyeballs_delay,
+            )
+        return aiohttp.TCPConnector()
+
+    def create_async_session(
+        self,
+        headers=None,
+        timeout=None,
+        unix_socket=None,
+        dns_cache=None,
+        happy_eyeballs_delay=0.25,
+        stats=None,
+        connector=None,
+    ):
+        """Create a session; a ``connector`` passed in is shared and not closed with it."""
+        aiohttp = _require_aiohttp()
+        if isinstance(timeout, Timeout):
+            client_timeout = timeout.for_aiohttp()
+        else:
+            client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        owns_connector = connector is None
+        if owns_connector:
+            connector = self.create_connector(unix_socket, dns_cache, happy_eyeballs_delay, stats)
+        return aiohttp.ClientSession(
+            headers=headers or None,
+            timeout=client_timeout,
+            connector=connector,
+            connector_owner=owns_connector,
+        )
+
+
+class Http2Transport:
+    """HTTP/2 transport built on ``httpx``.
+
+    Concurrent requests to the same origin are multiplexed as streams over a
+    single connection instead of taking one pooled connection each. Plain
+    ``http://`` URLs use HTTP/1.1 unless ``http1=False``, in which case h2 is
+    spoken with prior knowledge. Needs ``pip install httpx[http2]``.
+    """
+
+    name = "http2"
+
+    def __init__(self, http1=True, max_connections=100, max_keepalive_connections=20, unix_sockets=None, **client_kwargs):
+        self.unix_sockets = {_unix_socket_key(host): path for host, path in (unix_sockets or {}).items()}
+        self.http1 = http1
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.client_kwargs = client_kwargs
+
+    @property
+    def timeout_errors(self):
+        return (_import_httpx().TimeoutException,)
+
+    @property
+    def errors(self):
+        return (_import_httpx().TransportError,)
+
+    def request_timeout(self, timeout):
+        return timeout.for_httpx()
+
+    def _client_kwargs(self, headers=None, timeout=None):
+        httpx = _import_httpx()
+        kwargs = {
+            "http1": self.http1,
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            "follow_redirects": True,
+        }
+        if headers:
+            kwargs["headers"] = headers
+        kwargs["timeout"] = timeout.for_httpx() if isinstance(timeout, Timeout) else timeout
+        kwargs.update(self.client_kwargs)
+        return kwargs
+
+    def create_session(self, headers=None, timeout=None, **options):
+        # httpx resolves through its own network backend, so dns_cache and
+        # happy_eyeballs_delay are not applied here.
+        httpx = _import_httpx()
+        kwargs = self._client_kwargs(headers, timeout)
+        if self.unix_sockets:
+            kwargs["mounts"] = {
+                f"http://{host}": httpx.AsyncHTTPTransport(uds=path, http1=self.http1, http2=True)
+                for host, path in self.unix_sockets.items()
+            }
+        headers = kwargs.pop("headers", None)
+        return _HttpxSession(lambda: httpx.AsyncClient(**kwargs), headers)
+
+    def create_async_session(self, headers=None, timeout=None, unix_socket=None, **options):
+        httpx = _import_httpx()
+        kwargs = self._client_kwargs(headers, timeout)
+        if unix_socket is not None:
+            kwargs["transport"] = httpx.AsyncHTTPTransport(uds=unix_socket, http1=self.http1, http2=True)
+        return _HttpxAsyncSession(httpx.AsyncClient(**kwargs))
+
+
+def _httpx_kwargs(kwargs):
+    """Translate requests/aiohttp style keyword arguments to httpx ones."""
+    kwargs = dict(kwargs)
+    data = kwargs.get("data")
+    if data is not None and not isinstance(data, dict):
+        kwargs["content"] = kwargs.pop("data")
+    if "allow_redirects" in kwargs:
+        kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        kwargs["timeout"] = _import_httpx().Timeout(None, connect=connect, read=read)
+    elif isinstance(timeout, Timeout):
+        kwargs["timeout"] = timeout.for_httpx()
+    kwargs.pop("stream", None)
+    return kwargs
+
+
+class _HttpxSession:
+    """``requests.Session`` lookalike over ``httpx.AsyncClient``.
+
+    A sync h2 connection can't be driven from several threads at once
+    (concurrent readers of one socket fail with ``ReadError`` or
+    ``RemoteProtocolError``), so every call runs on one ``httpx.AsyncClient``
+    owned by a background event loop thread. Requests from different threads
+    are then multiplexed over the same connection.
+
+    Buffered responses are returned as ``httpx.Response`` objects, which
+    already expose ``status_code``, ``text``, ``content``, ``headers`` and
+    ``json()``. With ``stream=True`` the body is left unread and the response
+    is wrapped in ``_HttpxSyncStream``.
+    """
+
+    def __init__(self, client_factory, headers=None):
+        self._client_factory = client_factory
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self.client = None
+        self.headers = _import_httpx().Headers(headers)
+
+    def _start(self):
+        import asyncio
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="jm-networking-http2", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self.client = self._run(self._create_client())
+            return self._loop
+
+    async def _create_client(self):
+        return self._client_factory()
+
+    def _run(self, coro):
+        import asyncio
+
+        loop = self._loop if self._loop is not None else self._start()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def request(self, method, url, **kwargs):
+        stream = kwargs.pop("stream", False)
+        kwargs = _httpx_kwargs(kwargs)
+        headers = self.headers.copy()
+        headers.update(kwargs.pop("headers", None) or {})
+        self._start()
+        response = self._run(self._send(method.upper(), url, headers, kwargs, stream))
+        return _HttpxSyncStream(response, self) if stream else response
+
+    async def _send(self, method, url, headers, kwargs, stream):
+        # build_request doesn't take the per-send options.
+        options = {name: kwargs.pop(name) for name in ("auth", "follow_redirects") if name in kwargs}
+        request = self.client.build_request(method, url, headers=headers, **kwargs)
+        return await self.client.send(request, stream=stream, **options)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self.client
+            self._loop = self._thread = self.client = None
+        if loop is None:
+            return
+        import asyncio
+
+        try:
+            if client is not None:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+class _HttpxSyncStream:
+    """Sync view of a streamed ``httpx.Response`` whose body is read on the session's loop."""
+
+    def __init__(self, response, session):
+        self._response = response
+        self._session = session
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def iter_bytes(self, chunk_size=None):
+        chunks = self._response.aiter_bytes(chunk_size)
+        try:
+            while True:
+                chunk = self._session._run(_next_chunk(chunks))
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self._session._run(chunks.aclose())
+
+    iter_content = iter_bytes
+
+    def read(self):
+        return self._session._run(self._response.aread())
+
+    @property
+    def content(self):
+        return self.read()
+
+    @property
+    def text(self):
+        self.read()
+        return self._response.text
+
+    def json(self, **kwargs):
+        self.read()
+        return self._response.json(**kwargs)
+
+    def close(self):
+        self._session._run(self._response.aclose())
+
+
+async def _next_chunk(chunks):
+    async for chunk in chunks:
+        return chunk
+    return None
+
+
+class _HttpxAsyncResponse:
+    """aiohttp ``ClientResponse`` lookalike over ``httpx.Response``."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+        self.content = _HttpxStreamReader(response)
+        self._body = None
+
+    @property
+    def content_length(self):
+        length = self.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+
+    async def read(self):
+        if self._body is None:
+            self._body = await self._response.aread()
+        return self._body
+
+    async def text(self):
+        await self.read()
+        return self._response.text
+
+    async def json(self):
+        await self.read()
+        return self._response.json()
+
+
+class _HttpxStreamReader:
+    """aiohttp ``StreamReader`` lookalike, so a body can be read in chunks."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def iter_chunked(self, n):
+        return self._response.aiter_bytes(n)
+
+
+class _HttpxStreamContext:
+
+    def __init__(self, client, method, url, kwargs):
+        self._stream = client.stream(method, url, **kwargs)
+
+    async def __aenter__(self):
+        return _HttpxAsyncResponse(await self._stream.__aenter__())
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._stream.__aexit__(exc_type, exc, tb)
+        return False
+
+
+class _HttpxAsyncSession:
+    """aiohttp ``ClientSession`` lookalike over ``httpx.AsyncClient``."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def request(self, method, url, **kwargs):
+        return _HttpxStreamContext(self.client, method.upper(), url, _httpx_kwargs(kwargs))
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
+
+
+def _require_aiohttp():
+    aiohttp = _import_aiohttp()
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for AsyncNetworking. Install aiohttp to use async requests.")
+    return aiohttp
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as ex:
+        raise RuntimeError("httpx is required for the HTTP/2 transport. Install httpx[http2] to use it.") from ex
+    return httpx
+
+
+def resolve_transport(transport, default):
+    if transport is None:
+        return default
+    if transport == "requests":
+        return RequestsTransport()
+    if transport == "aiohttp":
+        return AiohttpTransport()
+    if transport == "http2":
+        return Http2Transport()
+    if isinstance(transport, str):
+        raise ValueError(f"Unsupported transport: {transport}")
+    return transport
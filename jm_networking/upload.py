@@ -0,0 +1,143 @@
+"""Streaming request bodies for large uploads.
+
+``UploadBody`` wraps a file path, an open binary file, a bytes-like buffer
+(``bytes``, ``memoryview``, ``mmap``, ...) or a sync/async iterator of chunks
+and yields it piece by piece, so the body is never held in Python memory as
+a whole. Buffers are sliced with ``memoryview`` instead of copied, and files
+are read into one reused buffer. Bodies of known length are sent with
+``Content-Length``; iterators are sent with chunked transfer encoding.
+"""
+
+import mmap
+import os
+from collections.abc import AsyncIterable
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class UploadBody:
+
+    def __init__(self, source, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, length=None):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.sent = 0
+        self.length = length if length is not None else _source_length(source)
+        if self.length is not None:
+            # requests reads ``len`` to decide between Content-Length and chunked encoding.
+            self.len = self.length
+
+    @property
+    def headers(self):
+        if self.length is None:
+            return {}
+        return {"Content-Length": str(self.length)}
+
+    def __iter__(self):
+        self.sent = 0
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                yield from self._track(_read_file(file, self.chunk_size))
+        elif _is_buffer(source):
+            yield from self._track(_slice_buffer(source, self.chunk_size))
+        elif hasattr(source, "read"):
+            yield from self._track(_read_file(source, self.chunk_size))
+        elif isinstance(source, AsyncIterable):
+            raise TypeError("Async iterators can only be uploaded with AsyncNetworking")
+        else:
+            yield from self._track(iter(source))
+
+    async def aiter(self):
+        """Yield the body as an async iterator, for async clients."""
+        import asyncio
+
+        source = self.source
+        if isinstance(source, AsyncIterable):
+            self.sent = 0
+            async for chunk in source:
+                yield self._advance(chunk)
+            return
+        if isinstance(source, (str, os.PathLike)) or (hasattr(source, "read") and not _is_buffer(source)):
+            # File reads block, so they run in the default executor one chunk at a
+            # time. Each chunk is a fresh bytes object because async transports may
+            # still hold it in their write buffer when the next one is read.
+            loop = asyncio.get_running_loop()
+            self.sent = 0
+            is_path = isinstance(source, (str, os.PathLike))
+            file = await loop.run_in_executor(None, open, source, "rb") if is_path else source
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, file.read, self.chunk_size)
+                    if not chunk:
+                        return
+                    yield self._advance(chunk)
+            finally:
+                if is_path:
+                    file.close()
+        for chunk in self:
+            yield chunk
+
+    def _track(self, chunks):
+        for chunk in chunks:
+            yield self._advance(chunk)
+
+    def _advance(self, chunk):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        self.sent += len(chunk)
+        if self.progress is not None:
+            self.progress(self.sent, self.length)
+        return chunk
+
+
+def _source_length(source):
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if _is_buffer(source):
+        return memoryview(source).nbytes
+    if hasattr(source, "fileno") and hasattr(source, "tell"):
+        try:
+            return os.fstat(source.fileno()).st_size - source.tell()
+        except (OSError, ValueError):
+            return None
+    return None
+
+
+def _is_buffer(source):
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return True
+    if hasattr(source, "read"):
+        return False
+    try:
+        memoryview(source)
+    except TypeError:
+        return False
+    return True
+
+
+def _slice_buffer(source, chunk_size):
+    view = memoryview(source).cast("B")
+    for start in range(0, view.nbytes, chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def _read_file(file, chunk_size):
+    if not hasattr(file, "readinto"):
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    # One buffer is reused for every chunk; each slice is sent before the next read.
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        count = file.readinto(buffer)
+        if not count:
+            return
+        yield view[:count]
+
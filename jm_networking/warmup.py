@@ -0,0 +1,172 @@
+"""Connection pre-warming and keep-alive refresh for the sync clients.
+
+The sync side works directly on the urllib3 pools behind a ``requests``
+session: warming checks connections out of a host's pool, connects them
+(TCP and TLS handshakes included) and parks them back in the pool, so the
+next requests reuse them. The refresher periodically sends a lightweight
+request over every idle pooled connection so load balancers don't drop them
+for inactivity, and reconnects any that were dropped anyway.
+
+Sessions that don't expose urllib3 pools (e.g. the HTTP/2 transport) are
+warmed with a single ``HEAD`` request per host instead.
+"""
+
+import logging
+import threading
+from urllib.parse import urlsplit
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_host(host):
+    """Turn ``host``, ``host:port`` or a URL into ``scheme://netloc/``."""
+    if "://" not in host:
+        host = f"https://{host}"
+    parts = urlsplit(host)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+def connection_pool(session, url):
+    """Return the urllib3 pool ``session`` would use for ``url``, or None."""
+    if not hasattr(session, "get_adapter"):
+        return None
+    # Resolve verify/cert/proxies exactly like ``Session.request`` does, so the
+    # pool key matches the one real requests will use.
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    adapter = session.get_adapter(url)
+    if hasattr(adapter, "get_connection_with_tls_context"):
+        prepared = requests.Request("HEAD", url).prepare()
+        return adapter.get_connection_with_tls_context(
+            prepared, verify=settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+        )
+    return adapter.get_connection(url, settings["proxies"])
+
+
+def _checkout_idle(pool, limit):
+    connections = []
+    while len(connections) < limit:
+        try:
+            connection = pool.pool.get(block=False)
+        except Exception:
+            break
+        if connection is None:
+            # Empty slot placeholder; put it back at the bottom of the stack later.
+            connections.append(None)
+            continue
+        connections.append(connection)
+    return connections
+
+
+def _return_all(pool, connections):
+    for connection in connections:
+        if connection is None:
+            pool.pool.put(None, block=False)
+        else:
+            pool._put_conn(connection)
+
+
+def warm_pool(session, url, connections):
+    """Open up to ``connections`` keep-alive connections to ``url``'s host and park them in the pool."""
+    pool = connection_pool(session, url)
+    if pool is None:
+        try:
+            session.request("HEAD", url)
+        except Exception as ex:
+            logger.warning("Warming a connection to %s failed: %s", url, ex)
+            return 0
+        return 1
+
+    limit = min(connections, pool.pool.maxsize)
+    checked_out = _checkout_idle(pool, pool.pool.maxsize)
+    live = [connection for connection in checked_out if connection is not None]
+    placeholders = [connection for connection in checked_out if connection is None]
+
+    warmed = 0
+    try:
+        for connection in live:
+            if connection.is_connected:
+                warmed += 1
+        while len(live) < limit and placeholders:
+            placeholders.pop()
+            live.append(pool._new_conn())
+        for connection in live:
+            if connection.is_connected or warmed >= limit:
+                continue
+            try:
+                connection.close()
+                connection.connect()
+            except Exception as ex:
+                logger.warning("Warming a connection to %s failed: %s", url, ex)
+                continue
+            warmed += 1
+    finally:
+        _return_all(pool, placeholders)
+        _return_all(pool, live)
+    return warmed
+
+
+def refresh_pool(session, url, path="/"):
+    """Ping every idle pooled connection for ``url``'s host; reconnect dropped ones."""
+    pool = connection_pool(session, url)
+    if pool is None:
+        session.request("HEAD", url.rstrip("/") + path)
+        return 0
+
+    checked_out = _checkout_idle(pool, pool.pool.maxsize)
+    refreshed = 0
+    try:
+        for connection in checked_out:
+            if connection is None:
+                continue
+            try:
+                if not connection.is_connected:
+                    connection.close()
+                    connection.connect()
+                connection.request("HEAD", path)
+                response = connection.getresponse()
+                response.read()
+                if response.headers.get("Connection", "").lower() == "close":
+                    connection.close()
+                    connection.connect()
+                refreshed += 1
+            except Exception as ex:
+                logger.warning("Keep-alive refresh to %s failed: %s", url, ex)
+                connection.close()
+    finally:
+        _return_all(pool, checked_out)
+    return refreshed
+
+
+class KeepAliveRefresher:
+    """Background thread that calls ``refresh_pool`` for each host every ``interval`` seconds."""
+
+    def __init__(self, get_session, hosts, interval=30.0, path="/"):
+        self.get_session = get_session
+        self.hosts = [normalize_host(host) for host in hosts]
+        self.interval = interval
+        self.path = path
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="jm-networking-keepalive", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def refresh(self):
+        session = self.get_session()
+        return {host: refresh_pool(session, host, self.path) for host in self.hosts}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as ex:
+                logger.warning("Keep-alive refresh failed: %s", ex)
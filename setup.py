@@ -20,6 +20,11 @@ REQUIRED = [
      'aiohttp'
 ]
 
+EXTRAS = {
+    'http2': ['httpx[http2]'],
+    'numpy': ['numpy'],
+}
+
 
 current_directory = os.path.abspath('pypi/')
 
@@ -63,14 +68,21 @@ setup(
     author_email=EMAIL,
     url=URL,
     packages=find_packages(exclude=('tests',)),
+    python_requires='>=3.7',
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
     include_package_data=True,
     license='MIT',
     classifiers=[
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
     ],
     cmdclass={
         'upload': UploadCommand,
     },
+    entry_points={
+        'console_scripts': [
+            'jm-load=jm_networking.load:main',
+        ],
+    },
 )
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from jm_networking import EndpointGroup, InternalServerError, JmNetwork, NotFoundError, TransportError
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.hits += 1
+        body = self.server.name.encode("utf-8")
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeClock:
+    def __init__(self):
+        self.current = 100.0
+
+    def monotonic(self):
+        return self.current
+
+
+class TestEndpointGroupSelection(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("jm_networking.balancer.time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_joins_base_url_and_path(self):
+        group = EndpointGroup(["http://a/api/"])
+        self.assertEqual(group.call(lambda url, suffix: url + suffix, "/todos", "?x=1"), "http://a/api/todos?x=1")
+
+    def test_least_outstanding(self):
+        group = EndpointGroup(["http://a", "http://b", "http://c"])
+        chosen = []
+
+        def nested(url, depth):
+            chosen.append(url)
+            if depth:
+                group.call(nested, "/", depth - 1)
+
+        group.call(nested, "/", 2)
+
+        self.assertEqual(sorted(chosen), ["http://a/", "http://b/", "http://c/"])
+
+    def test_p2c_prefers_lower_latency(self):
+        group = EndpointGroup(["http://fast", "http://slow"], strategy="p2c")
+
+        def timed(url):
+            self.clock.current += 2.0 if "slow" in url else 0.01
+            return url
+
+        results = [group.call(timed, "") for _ in range(20)]
+
+        self.assertEqual(results[2:].count("http://slow"), 0)
+        self.assertGreater(group.replicas[1].ewma, group.replicas[0].ewma)
+
+    def test_url_keyword(self):
+        group = EndpointGroup(["http://a"])
+
+        def post(body, url, params):
+            return body, url, params
+
+        self.assertEqual(group.call(post, "/todos", "todo", url_arg="url", params=None), ("todo", "http://a/todos", None))
+
+    def test_fast_failures_are_penalized(self):
+        group = EndpointGroup(["http://a", "http://b"], strategy="p2c", failure_penalty=5.0, max_failures=10)
+
+        def refused(url):
+            self.clock.current += 0.001
+            raise TransportError("Network error", url=url)
+
+        group.call(lambda url: url, "")
+        with self.assertRaises(TransportError) as raised:
+            group.call(refused, "")
+
+        failed = next(replica for replica in group.replicas if replica.url("") == raised.exception.url)
+        self.assertEqual(failed.ewma, 5.0)
+
+    def test_idle_replica_latency_decays(self):
+        group = EndpointGroup(["http://a", "http://b"], strategy="p2c", decay=10.0)
+        replica = group.replicas[0]
+        replica.ewma, replica.updated_at = 5.0, self.clock.current
+
+        self.clock.current += 60
+
+        self.assertLess(replica.cost(self.clock.current, group.decay), 0.02)
+
+    def test_ejects_after_failures_and_recovers(self):
+        group = EndpointGroup(["http://bad", "http://good"], max_failures=2, ejection_time=5)
+
+        def flaky(url):
+            if "bad" in url:
+                raise TransportError("Network error", url=url)
+            return url
+
+        for _ in range(100):
+            try:
+                group.call(flaky, "")
+            except TransportError:
+                pass
+            if group.stats()[0]["ejected"]:
+                break
+        self.assertTrue(group.stats()[0]["ejected"])
+        self.assertEqual(group.stats()[0]["errors"], 2)
+        self.assertEqual({group.call(flaky, "") for _ in range(10)}, {"http://good"})
+
+        self.clock.current += 6
+        self.assertFalse(group.stats()[0]["ejected"])
+
+    def test_client_errors_do_not_eject(self):
+        group = EndpointGroup(["http://a", "http://b"], max_failures=1)
+
+        def missing(url):
+            raise NotFoundError(404, url)
+
+        for _ in range(4):
+            with self.assertRaises(NotFoundError):
+                group.call(missing, "")
+        self.assertFalse(any(replica["ejected"] for replica in group.stats()))
+
+    def test_all_ejected_falls_back_to_every_replica(self):
+        group = EndpointGroup(["http://a"], max_failures=1)
+
+        def down(url):
+            raise TransportError("Network error", url=url)
+
+        with self.assertRaises(TransportError):
+            group.call(down, "")
+
+        self.assertEqual(group.call(lambda url: url, ""), "http://a")
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            EndpointGroup(["http://a"], strategy="random")
+
+
+class TestEndpointGroupWithClients(unittest.TestCase):
+    def setUp(self):
+        self.servers = []
+        for name, status in (("good", 200), ("broken", 500)):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+            server.daemon_threads = True
+            server.name, server.status, server.hits = name, status, 0
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self.servers.append((server, thread))
+        self.base_urls = [f"http://127.0.0.1:{server.server_address[1]}" for server, _ in self.servers]
+
+    def tearDown(self):
+        for server, thread in self.servers:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_sync_traffic_moves_off_failing_replica(self):
+        group = EndpointGroup(self.base_urls, max_failures=1, ejection_time=60)
+        bodies = []
+        for _ in range(10):
+            try:
+                bodies.append(group.call(JmNetwork.get, "/status")[1])
+            except InternalServerError:
+                pass
+
+        self.assertLessEqual(self.servers[1][0].hits, 1)
+        self.assertGreaterEqual(bodies.count("good"), 9)
+
+    def test_async_client(self):
+        from jm_networking import AsyncNetworking
+
+        async def run():
+            group = EndpointGroup(self.base_urls, strategy="p2c", max_failures=1, ejection_time=60)
+            client = AsyncNetworking()
+            bodies = []
+            try:
+                for _ in range(6):
+                    try:
+                        bodies.append((await group.acall(client.get, "/status"))[1])
+                    except InternalServerError:
+                        pass
+            finally:
+                await client.close()
+            return bodies
+
+        bodies = asyncio.run(run())
+        self.assertGreaterEqual(bodies.count("good"), 5)
+        self.assertLessEqual(self.servers[1][0].hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import Optional
+from unittest.mock import patch
+
+from jm_networking import ObjectNetworking
+from jm_networking.columnar import column_specs, to_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass
+class Trade:
+    id: int
+    price: float
+    symbol: str
+    filled: bool
+    venue: Optional[str] = None
+    quantity: Optional[int] = None
+    tags: list = field(default_factory=list)
+
+
+ROWS = [
+    {"id": 1, "price": 10.5, "symbol": "ABC", "filled": True, "venue": "X", "quantity": 100, "tags": ["a"]},
+    {"id": 2, "price": 11.0, "symbol": "DEFG", "filled": False, "quantity": None},
+    {"id": 3, "price": 9.75, "symbol": "H", "filled": True, "venue": None, "quantity": 5},
+]
+
+
+class FakeResponse:
+    status_code = 200
+    text = "[]"
+    headers = {}
+
+    def json(self):
+        return ROWS
+
+
+class FakeSession:
+    def get(self, url, **kwargs):
+        return FakeResponse()
+
+
+class TestColumnSpecs(unittest.TestCase):
+    def test_dtypes_from_annotations(self):
+        specs = {spec.name: spec for spec in column_specs(Trade)}
+
+        self.assertEqual(specs["id"].kind, "i8")
+        self.assertEqual(specs["symbol"].kind, "str")
+        self.assertEqual(specs["tags"].kind, "object")
+        self.assertTrue(specs["quantity"].optional)
+        self.assertFalse(specs["price"].optional)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestToColumns(unittest.TestCase):
+    def test_dict_layout(self):
+        columns = to_columns(ROWS, Trade)
+
+        self.assertEqual(columns["id"].dtype, numpy.int64)
+        self.assertEqual(columns["price"].tolist(), [10.5, 11.0, 9.75])
+        self.assertEqual(columns["symbol"].dtype, object)
+        self.assertEqual(columns["filled"].dtype, bool)
+        self.assertEqual(columns["quantity"].mask.tolist(), [False, True, False])
+        self.assertEqual(columns["quantity"].sum(), 105)
+        self.assertEqual(columns["venue"].compressed().tolist(), ["X"])
+        self.assertEqual(columns["tags"].tolist(), [["a"], [], []])
+        self.assertNotIsInstance(columns["id"], numpy.ma.MaskedArray)
+
+    def test_structured_layout(self):
+        array = to_columns(ROWS, Trade, layout="structured")
+
+        self.assertEqual(array.dtype["symbol"], numpy.dtype("U4"))
+        self.assertEqual(array["id"].tolist(), [1, 2, 3])
+        self.assertEqual(array.mask["quantity"].tolist(), [False, True, False])
+
+    def test_missing_required_field(self):
+        with self.assertRaises(ValueError):
+            to_columns([{"id": 1, "price": 1.0, "filled": True}], Trade)
+
+    def test_get_columns(self):
+        with patch("jm_networking._get_session", return_value=FakeSession()):
+            status, columns = ObjectNetworking.get_columns("https://example.com/trades", Trade)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(columns["symbol"].tolist(), ["ABC", "DEFG", "H"])
+
+
+if __name__ == "__main__":
+    unittest.main()
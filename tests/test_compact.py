@@ -0,0 +1,157 @@
+import pickle
+import sys
+import unittest
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+from jm_networking import ObjectNetworking, _schema_class_for
+from jm_networking import compact as compact_module
+from jm_networking.compact import compact_class
+
+
+@dataclass
+class Todo:
+    id: int
+    title: str
+    completed: bool = False
+    note: Optional[str] = None
+    tags: list = field(default_factory=list)
+
+    @property
+    def label(self):
+        return f"{self.id}: {self.title}"
+
+    def is_open(self):
+        return not self.completed
+
+
+ROWS = [
+    {"id": 1, "title": "one", "completed": True, "tags": ["a"]},
+    {"id": 2, "title": "two"},
+]
+
+
+class FakeResponse:
+    status_code = 200
+    text = "[]"
+    headers = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.sent = []
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.payload)
+
+    def post(self, url, **kwargs):
+        self.sent.append(kwargs["json"])
+        return FakeResponse({})
+
+
+class TestCompactClass(unittest.TestCase):
+    def test_slots_variant(self):
+        compact = compact_class(Todo, "slots")
+        todo = compact(1, "one", tags=["a"])
+
+        self.assertFalse(hasattr(todo, "__dict__"))
+        self.assertEqual(todo.title, "one")
+        self.assertEqual(todo.label, "1: one")
+        self.assertTrue(todo.is_open())
+        self.assertEqual(todo, Todo(1, "one", tags=["a"]))
+        self.assertEqual(Todo(1, "one", tags=["a"]), todo)
+        self.assertNotEqual(todo, compact(2, "one"))
+        self.assertIs(compact_class(Todo, "slots"), compact)
+
+    def test_slots_variant_before_python_310(self):
+        @dataclass(frozen=True)
+        class Point:
+            x: int
+            y: int = 0
+
+        with patch.object(compact_module, "sys", SimpleNamespace(version_info=(3, 9))):
+            compact = compact_class(Point, "slots")
+        point = compact(1)
+
+        self.assertEqual(compact.__slots__, ("x", "y"))
+        self.assertFalse(hasattr(point, "__dict__"))
+        self.assertEqual((point.x, point.y), (1, 0))
+        self.assertEqual(point, Point(1))
+
+    def test_tuple_variant(self):
+        compact = compact_class(Todo, "tuple")
+        todo = compact(2, "two")
+
+        self.assertFalse(hasattr(todo, "__dict__"))
+        self.assertEqual(todo.title, "two")
+        self.assertEqual(todo.tags, [])
+        self.assertIsNot(todo.tags, compact(3, "three").tags)
+        self.assertTrue(todo.is_open())
+        self.assertEqual(todo, Todo(2, "two"))
+        with self.assertRaises(AttributeError):
+            todo.title = "changed"
+        with self.assertRaises(TypeError):
+            compact(title="missing id")
+
+    def test_smaller_than_original(self):
+        original = Todo(1, "one")
+        original_size = sys.getsizeof(original) + sys.getsizeof(original.__dict__)
+        for kind in ("slots", "tuple"):
+            self.assertLess(sys.getsizeof(compact_class(Todo, kind)(1, "one")), original_size)
+
+    def test_pickle_round_trip(self):
+        for kind in ("slots", "tuple"):
+            todo = compact_class(Todo, kind)(1, "one", tags=["a"])
+            copy = pickle.loads(pickle.dumps(todo))
+            self.assertIs(copy.__class__, todo.__class__)
+            self.assertEqual(copy, todo)
+
+    def test_rejects_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            compact_class(Todo, "packed")
+
+
+class TestCompactLoading(unittest.TestCase):
+    def test_schema_loads_compact_instances(self):
+        for kind in ("slots", "tuple"):
+            todos = _schema_class_for(Todo, kind)(many=True).load(ROWS)
+            self.assertIs(todos[0].__class__, compact_class(Todo, kind))
+            self.assertEqual(todos, [Todo(1, "one", True, tags=["a"]), Todo(2, "two")])
+
+    def test_get_with_compact(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS)):
+            _, todos = ObjectNetworking.get("http://example.com/todos", Todo, compact="slots")
+
+        self.assertIs(todos[1].__class__, compact_class(Todo, "slots"))
+        self.assertEqual(todos[1].title, "two")
+
+    def test_class_default_and_per_call_override(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS[0])), \
+                patch.object(ObjectNetworking, "compact", "tuple"):
+            _, compact = ObjectNetworking.get("http://example.com/todos/1", Todo)
+            _, plain = ObjectNetworking.get("http://example.com/todos/1", Todo, compact=False)
+
+        self.assertIs(compact.__class__, compact_class(Todo, "tuple"))
+        self.assertIs(plain.__class__, Todo)
+        self.assertEqual(compact, plain)
+
+    def test_compact_instances_serialize_like_originals(self):
+        session = FakeSession({})
+        with patch("jm_networking._get_session", return_value=session):
+            ObjectNetworking.post(compact_class(Todo, "tuple")(1, "one"), "http://example.com/todos", None)
+            ObjectNetworking.post(Todo(1, "one"), "http://example.com/todos", None)
+
+        self.assertEqual(session.sent[0], session.sent[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
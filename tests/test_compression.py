@@ -0,0 +1,242 @@
+import gzip
+import json
+import threading
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import jm_networking as jmn
+from jm_networking import AsyncNetworking, JmNetwork, ObjectNetworking, RequestCompression
+from tests.example_model import ExampleModel
+
+
+PAYLOAD = json.dumps({"items": ["repetitive value"] * 500}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.ports.add(self.client_address[1])
+        if self.path == "/deflate":
+            encoding, body = "deflate", zlib.compress(PAYLOAD)
+        else:
+            encoding, body = "gzip", gzip.compress(PAYLOAD)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="ok", headers=None, content=b"ok"):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.content = content
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+class FakeAsyncResponse:
+    def __init__(self, status, text, headers=None, content_length=None, body=b""):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+        self.content_length = content_length
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def text(self):
+        return self._text
+
+
+class FakeRequestContext:
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeAsyncSession:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return FakeRequestContext(self.response)
+
+
+class TestRequestCompression(unittest.TestCase):
+    def setUp(self):
+        JmNetwork.stats.reset()
+
+    @patch("jm_networking._get_session")
+    def test_post_json_is_gzipped_above_threshold(self, mock_get_session):
+        session = FakeSession(FakeResponse(201))
+        mock_get_session.return_value = session
+        body = {"items": ["repetitive value"] * 200}
+
+        JmNetwork.post("https://example.com", json=body, compress=RequestCompression(min_size=100))
+
+        sent = session.calls[0]
+        self.assertNotIn("json", sent)
+        self.assertEqual(sent["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(sent["headers"]["Content-Type"], "application/json")
+        self.assertEqual(json.loads(gzip.decompress(sent["data"])), body)
+
+        stats = JmNetwork.stats.snapshot()
+        self.assertEqual(stats["requests_compressed"], 1)
+        self.assertGreater(stats["request_compression_ratio"], 1)
+        self.assertIn("request_compress_cpu", stats)
+
+    @patch("jm_networking._get_session")
+    def test_small_bodies_are_sent_uncompressed(self, mock_get_session):
+        session = FakeSession(FakeResponse(201))
+        mock_get_session.return_value = session
+
+        JmNetwork.post("https://example.com", json={"a": 1}, compress=True)
+
+        sent = session.calls[0]
+        self.assertEqual(sent["json"], {"a": 1})
+        self.assertNotIn("headers", sent)
+
+    @patch("jm_networking._get_session")
+    def test_object_networking_post_uses_class_default(self, mock_get_session):
+        session = FakeSession(FakeResponse(201))
+        mock_get_session.return_value = session
+
+        with patch.object(ObjectNetworking, "compression", RequestCompression(min_size=0)):
+            ObjectNetworking.post(ExampleModel(id=1, title="t"), "https://example.com", params=None)
+
+        sent = session.calls[0]
+        self.assertEqual(sent["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(sent["data"]))["id"], 1)
+
+    @patch("jm_networking._get_session")
+    def test_compressed_response_is_recorded(self, mock_get_session):
+        response = FakeResponse(200, headers={"Content-Encoding": "gzip", "Content-Length": "100"}, content=b"x" * 400)
+        mock_get_session.return_value = FakeSession(response)
+
+        JmNetwork.get("https://example.com")
+
+        stats = JmNetwork.stats.snapshot()
+        self.assertEqual(stats["response_bytes_wire"], 100)
+        self.assertEqual(stats["response_bytes_decoded"], 400)
+        self.assertEqual(stats["response_compression_ratio"], 4.0)
+
+    def test_unknown_encoding_rejected(self):
+        with self.assertRaises(ValueError):
+            RequestCompression(encoding="br")
+
+    def test_session_advertises_supported_encodings(self):
+        jmn._SESSION = None
+        try:
+            session = jmn._get_session()
+            self.assertIn("gzip", session.headers["Accept-Encoding"])
+        finally:
+            jmn._SESSION = None
+
+
+class TestResponseDecompression(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.ports = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        jmn._SESSION = None
+        JmNetwork.stats.reset()
+
+    def tearDown(self):
+        jmn._SESSION = None
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync_decode_is_timed(self):
+        for path in ("/gzip", "/deflate", "/gzip"):
+            status, payload = JmNetwork.get(self.base + path, is_json=True)
+            self.assertEqual(payload["items"][0], "repetitive value")
+
+        stats = JmNetwork.stats.snapshot()
+        self.assertEqual(stats["responses_compressed"], 3)
+        self.assertEqual(stats["response_bytes_decoded"], 3 * len(PAYLOAD))
+        self.assertLess(stats["response_bytes_wire"], len(PAYLOAD))
+        self.assertIn("response_decompress_cpu", stats)
+        # The body was read to the end, so the connection went back to the pool.
+        self.assertEqual(len(self.server.ports), 1)
+
+    def test_streamed_response_is_not_buffered(self):
+        response = jmn._send("get", self.base + "/gzip", stream=True)
+        try:
+            self.assertFalse(response._content_consumed)
+            self.assertEqual(JmNetwork.stats.get("responses_compressed"), 0)
+            self.assertEqual(b"".join(response.iter_content(1024)), PAYLOAD)
+        finally:
+            response.close()
+
+    def test_async_decode_is_timed(self):
+        import asyncio
+
+        async def fetch():
+            async with AsyncNetworking() as client:
+                status, payload = await client.get(self.base + "/gzip", is_json=True)
+                return client.stats.snapshot(), payload
+
+        stats, payload = asyncio.run(fetch())
+
+        self.assertEqual(payload["items"][0], "repetitive value")
+        self.assertEqual(stats["response_bytes_decoded"], len(PAYLOAD))
+        self.assertEqual(stats["response_bytes_wire"], len(gzip.compress(PAYLOAD)))
+        self.assertIn("response_decompress_cpu", stats)
+
+
+class TestAsyncCompression(unittest.IsolatedAsyncioTestCase):
+    async def test_post_json_is_gzipped(self):
+        session = FakeAsyncSession(FakeAsyncResponse(201, "ok"))
+        client = AsyncNetworking(session=session, headers={"X-Test": "1"}, compression=RequestCompression(min_size=0))
+
+        await client.post("https://example.com", json={"a": "b"})
+
+        kwargs = session.requests[0][2]
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(kwargs["headers"]["X-Test"], "1")
+        self.assertEqual(json.loads(gzip.decompress(kwargs["data"])), {"a": "b"})
+        self.assertEqual(client.stats.get("requests_compressed"), 1)
+
+    async def test_compressed_response_is_recorded(self):
+        response = FakeAsyncResponse(200, "ok", headers={"Content-Encoding": "br"}, content_length=10, body=b"x" * 50)
+        client = AsyncNetworking(session=FakeAsyncSession(response))
+
+        await client.get("https://example.com")
+
+        self.assertEqual(client.stats.snapshot()["response_compression_ratio"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
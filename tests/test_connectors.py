@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jm_networking import AsyncNetworking, ConnectorRegistry
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.2)
+        body = json.dumps({"client": self.headers.get("X-Client")}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestSharedConnectors(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    async def test_clients_share_one_pool_with_own_headers(self):
+        first = AsyncNetworking(headers={"X-Client": "a"})
+        second = AsyncNetworking(headers={"X-Client": "b"})
+        try:
+            _, a = await first.get(self.base + "/", is_json=True)
+            _, b = await second.get(self.base + "/", is_json=True)
+            self.assertIs(first._session.connector, second._session.connector)
+        finally:
+            await first.close()
+            await second.close()
+
+        self.assertEqual((a, b), ({"client": "a"}, {"client": "b"}))
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_connector_closed_by_last_release(self):
+        first = AsyncNetworking()
+        second = AsyncNetworking()
+        await first.get(self.base + "/")
+        await second.get(self.base + "/")
+        connector = first._session.connector
+
+        await first.close()
+        self.assertFalse(connector.closed)
+        await second.get(self.base + "/")
+        await second.close()
+
+        self.assertTrue(connector.closed)
+
+    async def test_opt_out(self):
+        async with AsyncNetworking() as shared, AsyncNetworking(share_connector=False) as private:
+            self.assertIsNot(shared._session.connector, private._session.connector)
+
+    async def test_close_drains_in_flight_requests(self):
+        client = AsyncNetworking()
+        request = asyncio.ensure_future(client.get(self.base + "/slow", is_json=True))
+        await asyncio.sleep(0.05)
+
+        await client.close()
+
+        self.assertEqual(await request, (200, {"client": None}))
+
+
+class TestConnectorRegistry(unittest.IsolatedAsyncioTestCase):
+    async def test_ref_counting(self):
+        registry = ConnectorRegistry()
+        created = []
+
+        class FakeConnector:
+            closed = False
+
+            async def close(self):
+                self.closed = True
+
+        def factory():
+            created.append(FakeConnector())
+            return created[-1]
+
+        first = registry.acquire("key", factory)
+        second = registry.acquire("key", factory)
+        self.assertIs(first, second)
+        self.assertEqual(registry.refs("key"), 2)
+
+        await registry.release("key", first)
+        self.assertFalse(first.closed)
+        await registry.release("key", second)
+        self.assertTrue(first.closed)
+        self.assertEqual(registry.refs("key"), 0)
+        self.assertEqual(len(created), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
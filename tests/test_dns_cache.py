@@ -0,0 +1,180 @@
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import jm_networking as jmn
+from jm_networking import AsyncNetworking, DnsCache, JmNetwork, TransportError
+from jm_networking.dns import happy_eyeballs_connect, interleave_addresses
+
+
+class FakeClock:
+    def __init__(self):
+        self.current = 0.0
+
+    def monotonic(self):
+        return self.current
+
+
+class FakeResolver:
+    def __init__(self, hosts):
+        self.hosts = hosts
+        self.calls = []
+
+    def __call__(self, host, port, family=0, type=0):
+        self.calls.append(host)
+        if host not in self.hosts:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", (self.hosts[host], port))]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServerMixin:
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+
+class TestDnsCache(unittest.TestCase):
+    def test_positive_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        resolver = FakeResolver({"api.test": "127.0.0.1"})
+        cache = DnsCache(ttl=10, resolver=resolver)
+
+        with patch("jm_networking.dns.time.monotonic", clock.monotonic):
+            cache.resolve("api.test", 80)
+            cache.resolve("api.test", 80)
+            clock.current = 11
+            cache.resolve("api.test", 80)
+
+        self.assertEqual(resolver.calls, ["api.test", "api.test"])
+
+    def test_failures_are_cached_for_negative_ttl(self):
+        clock = FakeClock()
+        resolver = FakeResolver({})
+        cache = DnsCache(negative_ttl=5, resolver=resolver)
+        stats = jmn.ClientStats()
+
+        with patch("jm_networking.dns.time.monotonic", clock.monotonic):
+            for _ in range(3):
+                with self.assertRaises(socket.gaierror):
+                    cache.resolve("missing.test", 80, stats=stats)
+            clock.current = 6
+            with self.assertRaises(socket.gaierror):
+                cache.resolve("missing.test", 80, stats=stats)
+
+        self.assertEqual(len(resolver.calls), 2)
+        self.assertEqual(stats.get("dns_negative_hits"), 2)
+        self.assertEqual(stats.get("dns_failures"), 2)
+
+    def test_bounded_entries(self):
+        cache = DnsCache(max_entries=2, resolver=FakeResolver({"a": "127.0.0.1", "b": "127.0.0.1", "c": "127.0.0.1"}))
+
+        for host in ("a", "b", "c"):
+            cache.resolve(host, 80)
+
+        self.assertIsNone(cache.lookup("a", 80))
+        self.assertIsNotNone(cache.lookup("c", 80))
+
+
+class TestHappyEyeballs(LocalServerMixin, unittest.TestCase):
+    def test_interleaves_families(self):
+        v6 = [(socket.AF_INET6, 1, 6, "", ("::1", 80, 0, 0)), (socket.AF_INET6, 1, 6, "", ("::2", 80, 0, 0))]
+        v4 = [(socket.AF_INET, 1, 6, "", ("10.0.0.1", 80)), (socket.AF_INET, 1, 6, "", ("10.0.0.2", 80))]
+
+        ordered = interleave_addresses(v6 + v4)
+
+        self.assertEqual([address[4][0] for address in ordered], ["::1", "10.0.0.1", "::2", "10.0.0.2"])
+
+    def test_falls_through_to_next_address(self):
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            refused_port = closed.getsockname()[1]
+        addresses = [
+            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("127.0.0.1", refused_port)),
+            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("127.0.0.1", self.port)),
+        ]
+
+        sock = happy_eyeballs_connect(addresses, timeout=5, delay=1.0)
+        try:
+            self.assertEqual(sock.getpeername()[1], self.port)
+        finally:
+            sock.close()
+
+
+class TestSyncDnsCache(LocalServerMixin, unittest.TestCase):
+    def setUp(self):
+        JmNetwork.stats.reset()
+
+    def tearDown(self):
+        jmn.set_dns_cache(None)
+
+    def test_requests_resolve_through_cache(self):
+        resolver = FakeResolver({"api.test": "127.0.0.1"})
+        jmn.set_dns_cache(DnsCache(resolver=resolver))
+
+        status, text = JmNetwork.get(f"http://api.test:{self.port}/")
+
+        self.assertEqual((status, text), (200, "ok"))
+        self.assertEqual(resolver.calls, ["api.test"])
+        stats = JmNetwork.stats.snapshot()
+        self.assertEqual(stats["dns_lookups"], 1)
+        self.assertIn("dns_resolution_time", stats)
+
+    def test_resolution_failure_is_transport_error(self):
+        jmn.set_dns_cache(DnsCache(resolver=FakeResolver({})))
+
+        with self.assertRaises(TransportError):
+            JmNetwork.get(f"http://missing.test:{self.port}/")
+
+
+class TestAsyncDnsCache(LocalServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_aiohttp_resolves_through_cache(self):
+        resolver = FakeResolver({"api.test": "127.0.0.1"})
+        cache = DnsCache(resolver=resolver)
+
+        async with AsyncNetworking(dns_cache=cache) as client:
+            status, text = await client.get(f"http://api.test:{self.port}/")
+
+        self.assertEqual((status, text), (200, "ok"))
+        self.assertEqual(resolver.calls, ["api.test"])
+        self.assertEqual(client.stats.get("dns_lookups"), 1)
+
+    async def test_shared_connector_counts_lookups_per_client(self):
+        resolver = FakeResolver({"a.test": "127.0.0.1", "b.test": "127.0.0.1"})
+        cache = DnsCache(resolver=resolver)
+
+        async with AsyncNetworking(dns_cache=cache) as a, AsyncNetworking(dns_cache=cache) as b:
+            await a.get(f"http://a.test:{self.port}/")
+            await b.get(f"http://b.test:{self.port}/")
+
+        self.assertEqual(resolver.calls, ["a.test", "b.test"])
+        self.assertEqual(a.stats.get("dns_lookups"), 1)
+        self.assertEqual(b.stats.get("dns_lookups"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jm_networking import AsyncNetworking, DownloadError, InternalServerError, JmNetwork, RequestScheduler, TransportError
+
+
+DATA = os.urandom(250_000)
+CHECKSUM = "sha256:" + hashlib.sha256(DATA).hexdigest()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        range_header = self.headers.get("Range")
+        with server.lock:
+            server.ranges.append(range_header)
+        if self.path == "/empty":
+            if range_header is None:
+                self._send(200, b"", {})
+            else:
+                self._send(416, b"", {"Content-Range": "bytes */0"})
+            return
+        if self.path == "/plain" or range_header is None:
+            self._send(200, DATA, {})
+            return
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", range_header).groups())
+        if start > 0 and server.fail_after_first:
+            self._send(500, b"boom", {})
+            return
+        if self.headers.get("If-Range") not in (None, server.etag):
+            self._send(200, DATA, {})
+            return
+        headers = {"Content-Range": f"bytes {start}-{end}/{len(DATA)}", "ETag": server.etag}
+        self._send(206, DATA[start:end + 1], headers)
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServerMixin:
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.lock = threading.Lock()
+        self.server.ranges = []
+        self.server.fail_after_first = False
+        self.server.etag = '"v1"'
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "artifact.bin")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmpdir.cleanup()
+
+    def read(self):
+        with open(self.path, "rb") as file:
+            return file.read()
+
+
+class TestSyncDownload(LocalServerMixin, unittest.TestCase):
+    def test_segmented_download_verifies_checksum(self):
+        result = JmNetwork.download(self.base + "/file", self.path, segments=4, checksum=CHECKSUM, chunk_size=8192)
+
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual((result.length, result.segments, result.resumed), (len(DATA), 4, False))
+        self.assertEqual(len(self.server.ranges), 5)  # probe + 4 segments
+        self.assertFalse(os.path.exists(self.path + ".jmdownload"))
+
+    def test_falls_back_to_single_stream(self):
+        progress = []
+
+        result = JmNetwork.download(self.base + "/plain", self.path, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.segments, 1)
+        self.assertEqual(progress[-1], (len(DATA), len(DATA)))
+
+    def test_resumes_from_state_file(self):
+        self.server.fail_after_first = True
+        with self.assertRaises(InternalServerError):
+            JmNetwork.download(self.base + "/file", self.path, segments=2)
+        with open(self.path + ".jmdownload") as file:
+            state = json.load(file)
+        self.assertEqual(state["segments"][0][2], state["segments"][0][1] + 1)
+
+        self.server.fail_after_first = False
+        self.server.ranges.clear()
+        result = JmNetwork.download(self.base + "/file", self.path, segments=2, checksum=CHECKSUM)
+
+        self.assertTrue(result.resumed)
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(self.server.ranges, [f"bytes={len(DATA) // 2}-{len(DATA) - 1}"])
+
+    def test_changed_resource_discards_state(self):
+        self.server.fail_after_first = True
+        with self.assertRaises(InternalServerError):
+            JmNetwork.download(self.base + "/file", self.path, segments=2)
+
+        self.server.fail_after_first = False
+        self.server.etag = '"v2"'
+        with self.assertRaises(DownloadError):
+            JmNetwork.download(self.base + "/file", self.path, segments=2)
+        self.assertFalse(os.path.exists(self.path + ".jmdownload"))
+
+    def test_empty_resource(self):
+        result = JmNetwork.download(self.base + "/empty", self.path, checksum="sha256:" + hashlib.sha256().hexdigest())
+
+        self.assertEqual(self.read(), b"")
+        self.assertEqual(result.length, 0)
+
+    def test_checksum_mismatch(self):
+        with self.assertRaises(DownloadError):
+            JmNetwork.download(self.base + "/file", self.path, checksum="sha256:" + "0" * 64)
+
+
+class TestAsyncDownload(LocalServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_segmented_download(self):
+        async with AsyncNetworking() as client:
+            result = await client.download(self.base + "/file", self.path, segments=3, checksum=CHECKSUM, chunk_size=8192)
+
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.segments, 3)
+
+    async def test_falls_back_to_single_stream(self):
+        async with AsyncNetworking() as client:
+            result = await client.download(self.base + "/plain", self.path, checksum=CHECKSUM)
+
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.segments, 1)
+
+    async def test_empty_resource(self):
+        async with AsyncNetworking() as client:
+            result = await client.download(self.base + "/empty", self.path)
+
+        self.assertEqual(self.read(), b"")
+        self.assertEqual(result.length, 0)
+
+    async def test_requests_are_scheduled(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        async with AsyncNetworking(scheduler=scheduler) as client:
+            await client.download(self.base + "/file", self.path, segments=3, checksum=CHECKSUM, priority="high")
+
+        self.assertEqual(scheduler.stats()["classes"]["high"]["admitted"], 4)  # probe + 3 segments
+        self.assertEqual(client._in_flight, 0)
+
+    async def test_connection_errors_are_mapped(self):
+        port = self.server.server_address[1]
+        self.server.shutdown()
+        self.server.server_close()
+        async with AsyncNetworking() as client:
+            with self.assertRaises(TransportError):
+                await client.download(f"http://127.0.0.1:{port}/file", self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
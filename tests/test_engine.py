@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jm_networking import AsyncEngine, JmNetwork, NotFoundError
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.peak = max(self.server.peak, self.server.in_flight)
+        try:
+            if self.path == "/missing":
+                self._send(404, b"missing")
+                return
+            time.sleep(0.05)
+            self._send(200, b'{"path": "%s"}' % self.path.encode())
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServerMixin:
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.in_flight = 0
+        self.server.peak = 0
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class TestAsyncEngine(LocalServerMixin, unittest.TestCase):
+    def test_submit_runs_requests_concurrently_from_one_thread(self):
+        with AsyncEngine() as engine:
+            futures = [engine.submit("GET", f"{self.base}/{index}", is_json=True) for index in range(20)]
+            engine_threads = [thread for thread in threading.enumerate() if thread.name == "jm-networking-engine"]
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(len(engine_threads), 1)
+
+        self.assertTrue(all(isinstance(future, Future) for future in futures))
+        self.assertEqual(results[3], (200, {"path": "/3"}))
+        self.assertGreater(self.server.peak, 1)
+
+    def test_max_concurrency(self):
+        with AsyncEngine(max_concurrency=2) as engine:
+            futures = [engine.submit("GET", f"{self.base}/{index}") for index in range(8)]
+            for future in futures:
+                future.result(timeout=5)
+
+        self.assertLessEqual(self.server.peak, 2)
+
+    def test_blocking_calls_and_errors(self):
+        engine = AsyncEngine()
+        try:
+            self.assertEqual(engine.get(self.base + "/a", is_json=True), (200, {"path": "/a"}))
+            with self.assertRaises(NotFoundError):
+                engine.get(self.base + "/missing")
+        finally:
+            engine.close()
+        self.assertFalse(engine.running)
+
+    def test_submit_call(self):
+        with AsyncEngine() as engine:
+            future = engine.submit_call(lambda client: client.get(self.base + "/b", is_json=True))
+            self.assertEqual(future.result(timeout=5), (200, {"path": "/b"}))
+
+
+class TestJmNetworkSubmit(LocalServerMixin, unittest.TestCase):
+    def tearDown(self):
+        JmNetwork.shutdown_engine()
+        super().tearDown()
+
+    def test_submit_uses_default_engine(self):
+        futures = [JmNetwork.submit("GET", f"{self.base}/{index}") for index in range(5)]
+
+        self.assertEqual([future.result(timeout=5)[0] for future in futures], [200] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ("aiohttp", "marshmallow", "marshmallow_dataclass", "asyncio")
+
+
+def _imported_modules(code):
+    """Run ``code`` under ``-X importtime`` and return the top-level packages it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        if name == "imported package":
+            continue
+        modules.add(name.split(".")[0])
+    return modules
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_does_not_load_heavy_dependencies(self):
+        modules = _imported_modules("import jm_networking")
+
+        self.assertIn("jm_networking", modules)
+        self.assertIn("requests", modules)
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_public_names_do_not_load_heavy_dependencies(self):
+        modules = _imported_modules(
+            "from jm_networking import JmNetwork, ObjectNetworking, AsyncNetworking, "
+            "RateLimitedNetworking, NetworkError, NotFoundError, TooManyRequestsError"
+        )
+
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_object_networking_loads_marshmallow_on_first_use(self):
+        modules = _imported_modules(
+            "import jm_networking\n"
+            "from tests.example_model import ExampleModel\n"
+            "jm_networking._schema_class_for(ExampleModel)"
+        )
+
+        self.assertIn("marshmallow_dataclass", modules)
+        self.assertNotIn("aiohttp", modules)
+
+    def test_lazy_attributes_resolve(self):
+        import jm_networking
+
+        self.assertTrue(callable(jm_networking.class_schema))
+        self.assertIsNotNone(jm_networking.aiohttp)
+        with self.assertRaises(AttributeError):
+            jm_networking.not_a_real_attribute
+
+
+if __name__ == "__main__":
+    unittest.main()
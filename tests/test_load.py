@@ -0,0 +1,88 @@
+import unittest
+
+from jm_networking.load import LoadResult, percentile, run_load
+
+
+class FakeResponse:
+    def __init__(self, status, text="ok"):
+        self.status = status
+        self._text = text
+        self.headers = {}
+
+    async def text(self):
+        return self._text
+
+    async def json(self):
+        return None
+
+
+class FakeRequestContext:
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        status = self.statuses[len(self.requests) % len(self.statuses)]
+        self.requests.append((method, url))
+        return FakeRequestContext(FakeResponse(status))
+
+    async def close(self):
+        pass
+
+
+class TestLoadGenerator(unittest.IsolatedAsyncioTestCase):
+    async def test_closed_loop_counts_errors_by_type(self):
+        session = FakeSession([200, 200, 404, 503])
+
+        result = await run_load(["https://a.example.com", "https://b.example.com"], concurrency=4, requests=8, session=session)
+
+        summary = result.summary()
+        self.assertEqual(summary["mode"], "closed-loop")
+        self.assertEqual(summary["requests"], 8)
+        self.assertEqual(summary["errors"], 4)
+        self.assertEqual(summary["error_types"], {"NotFoundError": 2, "ServiceUnavailableError": 2})
+        self.assertEqual(summary["statuses"], {"200": 4, "404": 2, "503": 2})
+        self.assertEqual({url for _, url in session.requests}, {"https://a.example.com", "https://b.example.com"})
+
+    async def test_open_loop_sends_on_schedule(self):
+        session = FakeSession([200])
+
+        result = await run_load(["https://example.com"], rps=500, requests=10, session=session)
+
+        summary = result.summary()
+        self.assertEqual(summary["mode"], "open-loop")
+        self.assertEqual(summary["requests"], 10)
+        self.assertGreaterEqual(summary["duration"], 9 / 500)
+        self.assertEqual(sum(summary["throughput_over_time"]), 10)
+
+
+class TestLoadResult(unittest.TestCase):
+    def test_latency_measured_from_intended_start(self):
+        result = LoadResult("open-loop")
+        result.started_at = 0.0
+        result.record(intended=0.0, sent=1.0, finished=1.5, status=200)
+
+        self.assertEqual(result.latencies, [1.5])
+        self.assertEqual(result.service_times, [0.5])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 0.5), 51)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertIsNone(percentile([], 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
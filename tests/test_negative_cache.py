@@ -0,0 +1,195 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from jm_networking import (
+    AsyncNetworking,
+    ForbiddenError,
+    InternalServerError,
+    JmNetwork,
+    NegativeCache,
+    NotFoundError,
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+        status = 404 if self.path.startswith("/missing") else 500 if self.path == "/broken" else 200
+        if self.path == "/private" and self.headers.get("Authorization") != "Bearer good":
+            status = 403
+        body = b"nope" if status != 200 else b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="missing"):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.status_code)
+
+
+class AuthSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls += 1
+        if (headers or {}).get("Authorization") == "Bearer good":
+            return FakeResponse(200, "secret")
+        return FakeResponse(403, "forbidden")
+
+
+class TestNegativeCache(unittest.TestCase):
+    def test_expires_after_ttl(self):
+        cache = NegativeCache(ttl=0.05)
+        cache.record("u", NotFoundError(404, "u", body="missing"))
+        with self.assertRaises(NotFoundError):
+            cache.check("u")
+        time.sleep(0.06)
+        cache.check("u")
+        self.assertEqual(len(cache), 0)
+
+    def test_only_configured_statuses(self):
+        cache = NegativeCache()
+        cache.record("u", InternalServerError(500, "u"))
+        cache.check("u")
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_bound(self):
+        cache = NegativeCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.record(key, NotFoundError(404, key))
+        with self.assertRaises(NotFoundError):
+            cache.check("a")
+        cache.record("c", NotFoundError(404, "c"))
+
+        cache.check("b")
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_raises_fresh_exception_each_time(self):
+        cache = NegativeCache()
+        cache.record("u", ForbiddenError(403, "u", body="x" * 10000, response=object()))
+        errors = []
+        for _ in range(2):
+            try:
+                cache.check("u")
+            except ForbiddenError as ex:
+                errors.append(ex)
+
+        self.assertIsNot(errors[0], errors[1])
+        self.assertIsNone(errors[0].response)
+        self.assertEqual(len(errors[0].body), 4096)
+
+
+class TestSyncNegativeCaching(unittest.TestCase):
+    def setUp(self):
+        self.cache = NegativeCache(ttl=60)
+        patcher = patch.object(JmNetwork, "negative_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_miss_served_locally(self):
+        session = FakeSession(404)
+        with patch("jm_networking._get_session", return_value=session):
+            for _ in range(3):
+                with self.assertRaises(NotFoundError) as raised:
+                    JmNetwork.get("http://example.com/users/7", params={"full": 1})
+
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(raised.exception.url, "http://example.com/users/7")
+        self.assertEqual(raised.exception.body, "missing")
+
+    def test_keyed_by_credentials(self):
+        session = AuthSession()
+        url = "http://example.com/private"
+        with patch("jm_networking._get_session", return_value=session):
+            with self.assertRaises(ForbiddenError):
+                JmNetwork.get(url)
+            with self.assertRaises(ForbiddenError):
+                JmNetwork.get(url, headers={"Authorization": "Bearer bad"})
+            self.assertEqual(JmNetwork.get(url, headers={"Authorization": "Bearer good"}), (200, "secret"))
+            with self.assertRaises(ForbiddenError):
+                JmNetwork.get(url, headers={"Authorization": "Bearer bad"})
+            with self.assertRaises(ForbiddenError):
+                JmNetwork.get(url, auth=object())  # not keyable: sent, not cached
+
+        self.assertEqual(session.calls, 4)
+
+    def test_server_errors_not_cached(self):
+        session = FakeSession(500)
+        with patch("jm_networking._get_session", return_value=session):
+            for _ in range(2):
+                with self.assertRaises(InternalServerError):
+                    JmNetwork.get("http://example.com/users/7")
+
+        self.assertEqual(session.calls, 2)
+
+
+class TestAsyncNegativeCaching(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    async def test_not_found_cached_per_url(self):
+        client = AsyncNetworking(negative_cache=NegativeCache(ttl=60))
+        try:
+            for _ in range(3):
+                with self.assertRaises(NotFoundError):
+                    await client.get(self.base + "/missing/1")
+                with self.assertRaises(InternalServerError):
+                    await client.get(self.base + "/broken")
+            with self.assertRaises(NotFoundError):
+                await client.get(self.base + "/missing/2")
+        finally:
+            await client.close()
+
+        self.assertEqual(self.server.hits, {"/missing/1": 1, "/broken": 3, "/missing/2": 1})
+
+    async def test_client_headers_are_part_of_the_key(self):
+        cache = NegativeCache(ttl=60)
+        anonymous = AsyncNetworking(negative_cache=cache)
+        authorized = AsyncNetworking(negative_cache=cache, headers={"Authorization": "Bearer good"})
+        try:
+            with self.assertRaises(ForbiddenError):
+                await anonymous.get(self.base + "/private")
+            status, text = await authorized.get(self.base + "/private")
+        finally:
+            await anonymous.close()
+            await authorized.close()
+
+        self.assertEqual((status, text), (200, "ok"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from jm_networking import ObjectCache, ObjectNetworking
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None, content=b""):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers = headers or {}
+        self.content = content
+        self.text = content.decode()
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, etag='"v1"', cache_control=None, payload=None):
+        self.etag = etag
+        self.cache_control = cache_control
+        self.payload = payload or [{"id": 1, "name": "one"}]
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        response_headers = {"ETag": self.etag} if self.etag else {}
+        if self.cache_control:
+            response_headers["Cache-Control"] = self.cache_control
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304, headers=response_headers)
+        return FakeResponse(200, self.payload, response_headers, content=b"x" * 100)
+
+
+class TestObjectCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ObjectCache(max_bytes=1000)
+        patcher = patch.object(ObjectNetworking, "object_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, session, url="http://example.com/items", **kwargs):
+        with patch("jm_networking._get_session", return_value=session):
+            return ObjectNetworking.get(url, Item, **kwargs)
+
+    def test_not_modified_skips_parse_and_load(self):
+        session = FakeSession()
+        _, first = self.get(session)
+        with patch("jm_networking._load_schema", side_effect=AssertionError("loaded again")):
+            status, second = self.get(session)
+
+        self.assertEqual(status, 200)
+        self.assertIs(second, first)
+        self.assertEqual(session.requests[1]["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.stats()["revalidated"], 1)
+
+    def test_changed_etag_reloads(self):
+        session = FakeSession()
+        self.get(session)
+        session.etag = '"v2"'
+        session.payload = [{"id": 1, "name": "renamed"}]
+        _, items = self.get(session)
+
+        self.assertEqual(items, [Item(1, "renamed")])
+
+    def test_fresh_entry_skips_request(self):
+        session = FakeSession(cache_control="max-age=60")
+        self.get(session)
+        self.get(session)
+
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_no_store_and_unvalidated_responses_not_cached(self):
+        self.get(FakeSession(cache_control="no-store"))
+        self.get(FakeSession(etag=None), url="http://example.com/other")
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_key_includes_params_and_options(self):
+        session = FakeSession(cache_control="max-age=60")
+        self.get(session, params={"page": 1})
+        self.get(session, params={"page": 2})
+        self.get(session, params={"page": 1}, compact="slots")
+
+        self.assertEqual(len(session.requests), 3)
+
+    def test_key_includes_credentials(self):
+        session = FakeSession(cache_control="max-age=60")
+        self.get(session, headers={"Authorization": "Bearer alice"})
+        self.get(session, headers={"Authorization": "Bearer bob"})
+        self.get(session, headers={"authorization": "Bearer alice"})
+        self.get(session, cache_vary="tenant-2")
+        self.get(session, auth=("carol", "secret"))
+
+        self.assertEqual(len(session.requests), 4)
+
+    def test_auth_object_bypasses_cache(self):
+        session = FakeSession(cache_control="max-age=60")
+        self.get(session, auth=object())
+        self.get(session, auth=object())
+
+        self.assertEqual(len(session.requests), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_byte_bound_evicts_least_recently_used(self):
+        cache = ObjectCache(max_bytes=250)
+        for name in ("a", "b", "c"):
+            cache.store(name, 200, [], {"ETag": name}, 100)
+
+        self.assertIsNone(cache.lookup("a"))
+        self.assertIsNotNone(cache.lookup("c"))
+        self.assertEqual(cache.current_bytes, 200)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_copy_on_read(self):
+        self.cache.copy_on_read = True
+        session = FakeSession(cache_control="max-age=60")
+        _, first = self.get(session)
+        first[0].name = "mutated"
+        _, second = self.get(session)
+
+        self.assertEqual(second[0].name, "one")
+        self.assertIsNot(second, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
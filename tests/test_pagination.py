@@ -0,0 +1,143 @@
+import json
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from jm_networking import (
+    AsyncNetworking,
+    CursorPagination,
+    NotFoundError,
+    ObjectNetworking,
+    OffsetPagination,
+)
+
+
+TOTAL = 25
+PAGE_SIZE = 10
+
+
+@dataclass
+class Item:
+    id: int
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        headers = {}
+        if parts.path == "/link":
+            page = int(query.get("page", 0))
+            payload = self._items(page * PAGE_SIZE, PAGE_SIZE)
+            if (page + 1) * PAGE_SIZE < TOTAL:
+                headers["Link"] = f'</link?page={page + 1}>; rel="next"'
+        elif parts.path == "/cursor":
+            start = int(query.get("cursor", 0))
+            payload = {"items": self._items(start, PAGE_SIZE), "meta": {"next": str(start + PAGE_SIZE) if start + PAGE_SIZE < TOTAL else None}}
+        elif parts.path == "/offset":
+            payload = self._items(int(query["offset"]), int(query["limit"]))
+        else:
+            self._send(404, b"missing", {})
+            return
+        self._send(200, json.dumps(payload).encode("utf-8"), headers)
+
+    def _items(self, start, count):
+        return [{"id": index} for index in range(start, min(start + count, TOTAL))]
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServerMixin:
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class TestSyncPagination(LocalServerMixin, unittest.TestCase):
+    def test_link_header(self):
+        items = list(ObjectNetworking.paginate(self.base + "/link", Item))
+
+        self.assertEqual([item.id for item in items], list(range(TOTAL)))
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_cursor(self):
+        strategy = CursorPagination(cursor_field="meta.next", items_field="items")
+
+        items = list(ObjectNetworking.paginate(self.base + "/cursor", Item, strategy=strategy))
+
+        self.assertEqual([item.id for item in items], list(range(TOTAL)))
+        self.assertEqual(self.server.requests[1], "/cursor?cursor=10")
+
+    def test_offset_fetches_concurrently_and_stops_on_short_page(self):
+        items = list(ObjectNetworking.paginate(self.base + "/offset", Item, strategy=OffsetPagination(limit=10), prefetch=4))
+
+        self.assertEqual([item.id for item in items], list(range(TOTAL)))
+        self.assertIn("/offset?offset=20&limit=10", self.server.requests)
+
+    def test_prefetches_ahead_of_consumer(self):
+        pages = ObjectNetworking.paginate(self.base + "/link", Item, prefetch=2)
+        next(pages)
+
+        deadline = time.monotonic() + 2
+        while len(self.server.requests) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pages.close()
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_max_pages(self):
+        items = list(ObjectNetworking.paginate(self.base + "/link", Item, max_pages=2))
+
+        self.assertEqual(len(items), 20)
+
+    def test_errors_are_raised_to_consumer(self):
+        with self.assertRaises(NotFoundError):
+            list(ObjectNetworking.paginate(self.base + "/missing", Item))
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            list(ObjectNetworking.paginate(self.base + "/link", Item, strategy="page-number"))
+
+
+class TestAsyncPagination(LocalServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_link_and_offset(self):
+        async with AsyncNetworking() as client:
+            linked = [item.id async for item in client.paginate(self.base + "/link", Item, prefetch=2)]
+            offset = [item.id async for item in client.paginate(self.base + "/offset", Item, strategy="offset", prefetch=3)]
+
+        self.assertEqual(linked, list(range(TOTAL)))
+        self.assertEqual(offset, list(range(TOTAL)))
+
+    async def test_errors_are_raised_to_consumer(self):
+        async with AsyncNetworking() as client:
+            with self.assertRaises(NotFoundError):
+                [item async for item in client.paginate(self.base + "/missing", Item)]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from dataclasses import dataclass
+from unittest.mock import patch
+
+import requests
+
+import jm_networking as jmn
+from jm_networking import ObjectNetworking, TransportError, UnprocessableEntityError
+
+
+@dataclass
+class Todo:
+    title: str
+    done: bool = False
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="ok"):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {}
+
+
+class FakeSession:
+    def __init__(self, reject=(), fail=()):
+        self.calls = []
+        self.reject = reject
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        with self.lock:
+            self.calls.append(kwargs["json"])
+        body = kwargs["json"]
+        titles = [item["title"] for item in body] if isinstance(body, list) else [body["title"]]
+        if any(title in self.fail for title in titles):
+            raise requests.ConnectionError("refused")
+        if any(title in self.reject for title in titles):
+            return FakeResponse(422, "invalid")
+        return FakeResponse(201 if not isinstance(body, list) else 207)
+
+    put = post
+
+
+class TestPostMany(unittest.TestCase):
+    def setUp(self):
+        self.todos = [Todo(f"t{index}") for index in range(5)]
+
+    def test_single_requests_in_order(self):
+        session = FakeSession(reject={"t2"})
+        with patch("jm_networking._get_session", return_value=session):
+            outcomes = ObjectNetworking.post_many(self.todos, "https://example.com/todos", concurrency=3)
+
+        self.assertEqual([outcome.obj for outcome in outcomes], self.todos)
+        self.assertEqual([outcome.ok for outcome in outcomes], [True, True, False, True, True])
+        self.assertIsInstance(outcomes[2].error, UnprocessableEntityError)
+        self.assertEqual(outcomes[0].response.status_code, 201)
+        self.assertEqual(len(session.calls), 5)
+
+    def test_batches_share_outcome(self):
+        session = FakeSession(fail={"t3"})
+        with patch("jm_networking._get_session", return_value=session):
+            outcomes = ObjectNetworking.post_many(self.todos, "https://example.com/todos", batch_size=2)
+
+        self.assertEqual(session.calls[0], [{"title": "t0", "done": False}, {"title": "t1", "done": False}])
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual([outcome.ok for outcome in outcomes], [True, True, False, False, True])
+        self.assertIsInstance(outcomes[3].error, TransportError)
+
+    def test_schema_built_once(self):
+        session = FakeSession()
+        with patch("jm_networking._get_session", return_value=session), \
+                patch("jm_networking._schema_class_for", wraps=jmn._schema_class_for) as schema_for:
+            ObjectNetworking.put_many(self.todos, "https://example.com/todos")
+
+        self.assertEqual(schema_for.call_count, 1)
+
+    def test_mixed_classes_rejected(self):
+        @dataclass
+        class Other:
+            name: str
+
+        with self.assertRaises(ValueError):
+            ObjectNetworking.post_many([Todo("a"), Other("b")], "https://example.com/todos")
+
+    def test_empty(self):
+        self.assertEqual(ObjectNetworking.post_many([], "https://example.com/todos"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import json
+import multiprocessing
+import os
+import pickle
+import threading
+import unittest
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from marshmallow import ValidationError
+
+import jm_networking as jmn
+from jm_networking import NotFoundError, ProcessFetcher, TooManyRequestsError
+from jm_networking.processes import _portable
+
+
+@dataclass
+class Item:
+    id: int
+    pid: int
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b"missing"
+            self.send_response(404)
+        elif self.path == "/bad":
+            body = json.dumps([{"id": "not a number", "pid": 0}]).encode("utf-8")
+            self.send_response(200)
+        else:
+            index = int(self.path.strip("/"))
+            body = json.dumps([{"id": index, "pid": 0}, {"id": index + 1, "pid": 0}]).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestExceptionPickling(unittest.TestCase):
+    def test_http_errors_round_trip(self):
+        error = TooManyRequestsError(429, "https://example.com", body="slow down", retries=3)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        self.assertIsInstance(restored, TooManyRequestsError)
+        self.assertEqual((restored.status_code, restored.url, restored.body, restored.retries), (429, "https://example.com", "slow down", 3))
+
+    def test_unpicklable_errors_keep_their_message(self):
+        error = _portable(ValueError(threading.Lock()))
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        self.assertIn("ValueError: <unlocked _thread.lock", str(restored))
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs the fork start method")
+class TestProcessFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def setUp(self):
+        self.urls = [f"{self.base}/{index}" for index in range(0, 40, 2)] + [self.base + "/missing"]
+
+    def test_ordered_results_with_errors(self):
+        with ProcessFetcher(processes=2, batch_size=3, start_method="fork") as fetcher:
+            results = list(fetcher.fetch(self.urls, Item))
+
+        self.assertEqual([result.url for result in results], self.urls)
+        self.assertEqual(results[1].data, [Item(2, 0), Item(3, 0)])
+        self.assertEqual(results[1].status_code, 200)
+        self.assertIsInstance(results[-1].error, NotFoundError)
+        self.assertIsNone(results[-1].error.response)
+
+    def test_bad_payload_fails_only_its_url(self):
+        urls = [self.base + "/0", self.base + "/bad", self.base + "/4"]
+        with ProcessFetcher(processes=2, batch_size=3, start_method="fork") as fetcher:
+            results = list(fetcher.fetch(urls, Item))
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, ValidationError)
+        self.assertIn("id", results[1].error.messages[0])
+        self.assertEqual(results[2].data, [Item(4, 0), Item(5, 0)])
+
+    def test_unordered_covers_every_url(self):
+        with ProcessFetcher(processes=3, batch_size=2, start_method="fork") as fetcher:
+            results = list(fetcher.fetch(self.urls, Item, ordered=False))
+
+        self.assertEqual(sorted(result.index for result in results), list(range(len(self.urls))))
+
+    def test_fork_drops_parent_session(self):
+        parent_session = jmn._get_session()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            same = jmn._SESSION is parent_session
+            os.write(write, b"1" if same else b"0")
+            os._exit(0)
+        os.close(write)
+        same = os.read(read, 1)
+        os.close(read)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(same, b"0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+from jm_networking import ObjectNetworking
+from tests.example_model import ExampleModel
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="ok", json_data=None, content=b""):
+        self.status_code = status_code
+        self.text = text
+        self.content = content
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, params=None, **kwargs):
+        return self.response
+
+
+class TestPipelineProfiling(unittest.TestCase):
+    def tearDown(self):
+        ObjectNetworking.disable_profiling()
+
+    @patch("jm_networking._get_session")
+    def test_records_stages_per_type(self, mock_get_session):
+        rows = [{"id": i, "userId": 1, "title": "t", "completed": False} for i in range(3)]
+        mock_get_session.return_value = FakeSession(FakeResponse(200, json_data=rows, content=b"x" * 42))
+        profiler = ObjectNetworking.enable_profiling()
+
+        ObjectNetworking.get("https://example.com", ExampleModel)
+        ObjectNetworking.get("https://example.com", ExampleModel)
+
+        stats = profiler.stats()
+        self.assertEqual(len(stats), 1)
+        totals = next(iter(stats.values()))
+        self.assertEqual(totals["calls"], 2)
+        self.assertEqual(totals["objects"], 6)
+        self.assertEqual(totals["payload_bytes"], 84)
+        self.assertEqual(set(totals["stages"]), {"network", "parse", "schema", "load"})
+
+    @patch("jm_networking._get_session")
+    def test_slow_calls_are_reported(self, mock_get_session):
+        mock_get_session.return_value = FakeSession(FakeResponse(200, json_data={"id": 1}))
+        slow = []
+        ObjectNetworking.enable_profiling(slow_threshold=0, on_slow=slow.append)
+
+        with self.assertLogs("jm_networking.profiling", level="WARNING"):
+            ObjectNetworking.get("https://example.com/1", ExampleModel)
+
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(slow[0]["url"], "https://example.com/1")
+        self.assertEqual(slow[0]["objects"], 1)
+
+    @patch("jm_networking._get_session")
+    def test_disabled_by_default(self, mock_get_session):
+        mock_get_session.return_value = FakeSession(FakeResponse(200, json_data={"id": 1}))
+
+        status, obj = ObjectNetworking.get("https://example.com", ExampleModel)
+
+        self.assertEqual(status, 200)
+        self.assertIsNone(ObjectNetworking.profiler)
+
+
+if __name__ == "__main__":
+    unittest.main()
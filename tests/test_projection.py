@@ -0,0 +1,145 @@
+import pickle
+import unittest
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+from jm_networking import ObjectNetworking, _schema_class_for
+from jm_networking import projection as projection_module
+from jm_networking.projection import project, projected_class
+
+try:
+    import marshmallow
+except ImportError:
+    marshmallow = None
+
+
+@dataclass
+class Repo:
+    id: int
+    name: str
+    owner: str
+    stars: int
+    description: Optional[str] = None
+    topics: list = field(default_factory=list)
+
+    def slug(self):
+        return f"{self.owner}/{self.name}"
+
+
+@dataclass
+class RepoSummary:
+    id: int
+    name: str
+
+
+ROWS = [
+    {"id": 1, "name": "one", "owner": "me", "stars": 5, "topics": ["a"], "license": "MIT"},
+    {"id": 2, "name": "two", "owner": "you", "stars": "not a number"},
+]
+
+
+class FakeResponse:
+    status_code = 200
+    text = "[]"
+    headers = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.params = []
+
+    def get(self, url, params=None, **kwargs):
+        self.params.append(params)
+        return FakeResponse(self.payload)
+
+
+class TestProject(unittest.TestCase):
+    def test_only_derives_smaller_class(self):
+        projection = project(Repo, ("name", "owner"))
+        repo = projection.target(name="one", owner="me")
+
+        self.assertEqual(projection.fields, ("name", "owner"))
+        self.assertEqual(repo.slug(), "me/one")
+        self.assertFalse(hasattr(repo, "stars"))
+        self.assertIs(project(Repo, ("name", "owner")), projection)
+
+    def test_exclude(self):
+        projection = project(Repo, exclude=("topics", "description"))
+        self.assertEqual(projection.fields, ("id", "name", "owner", "stars"))
+
+    def test_dataclass_projection(self):
+        projection = project(Repo, RepoSummary)
+        self.assertIs(projection.target, RepoSummary)
+        self.assertEqual(projection.query_value, "id,name")
+
+    def test_unknown_field_rejected(self):
+        with self.assertRaises(ValueError):
+            project(Repo, ("name", "forks"))
+
+    def test_projected_class_before_python_310(self):
+        with patch.object(projection_module, "sys", SimpleNamespace(version_info=(3, 9))):
+            target = projected_class(Repo, ("name", "description", "stars"))
+        repo = target(name="one", stars=5)
+
+        self.assertEqual((repo.name, repo.description, repo.stars), ("one", None, 5))
+        self.assertEqual([name for name in target.__dataclass_fields__], ["name", "stars", "description"])
+
+    def test_projected_instances_pickle(self):
+        repo = project(Repo, ("id", "name")).target(id=1, name="one")
+        self.assertEqual(pickle.loads(pickle.dumps(repo)), repo)
+
+
+@unittest.skipIf(marshmallow is None, "marshmallow is not installed")
+class TestProjectedGet(unittest.TestCase):
+    def test_full_load_validates_every_field(self):
+        with self.assertRaises(marshmallow.ValidationError):
+            _schema_class_for(Repo)(many=True).load(ROWS)
+
+    def test_only_skips_other_fields(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS)):
+            _, repos = ObjectNetworking.get("http://example.com/repos", Repo, only=["id", "name"])
+
+        self.assertEqual([(repo.id, repo.name) for repo in repos], [(1, "one"), (2, "two")])
+        self.assertFalse(hasattr(repos[0], "owner"))
+
+    def test_lighter_dataclass(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS[0])):
+            _, repo = ObjectNetworking.get("http://example.com/repos/1", Repo, only=RepoSummary)
+
+        self.assertEqual(repo, RepoSummary(1, "one"))
+
+    def test_projection_combines_with_compact(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS)):
+            _, repos = ObjectNetworking.get("http://example.com/repos", Repo, only="name", compact="tuple")
+
+        self.assertEqual([repo.name for repo in repos], ["one", "two"])
+        self.assertFalse(hasattr(repos[0], "__dict__"))
+
+    def test_projection_param_sent_to_server(self):
+        session = FakeSession(ROWS)
+        with patch("jm_networking._get_session", return_value=session), \
+                patch.object(ObjectNetworking, "projection_param", "fields"):
+            ObjectNetworking.get("http://example.com/repos", Repo, params={"page": 2}, only=["id", "name"])
+            ObjectNetworking.get("http://example.com/repos", Repo, exclude=["stars"])
+
+        self.assertEqual(session.params[0], {"page": 2, "fields": "id,name"})
+        self.assertEqual(session.params[1], {"fields": "id,name,owner,description,topics"})
+
+    def test_paginate_with_projection(self):
+        with patch("jm_networking._get_session", return_value=FakeSession(ROWS)):
+            names = [repo.name for repo in ObjectNetworking.paginate("http://example.com/repos", Repo, only=["name"])]
+
+        self.assertEqual(names, ["one", "two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
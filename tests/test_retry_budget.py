@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import patch
+
+from jm_networking import RateLimitedNetworking, RetryBudget, ServiceUnavailableError, TooManyRequestsError
+
+
+class FakeClock:
+    def __init__(self):
+        self.current = 1000.0
+
+    def monotonic(self):
+        return self.current
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = "payload"
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.statuses(url))
+
+
+class TestRetryBudget(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("jm_networking.retry_budget.time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ratio_of_recent_successes(self):
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0, window=10)
+        for _ in range(30):
+            budget.record_success("a")
+
+        granted = sum(budget.try_retry("a") for _ in range(5))
+
+        self.assertEqual(granted, 3)
+        self.assertEqual(budget.metrics()["a"]["rejected"], 2)
+        self.assertEqual(budget.metrics()["a"]["available"], 0)
+
+    def test_minimum_floor_and_per_host(self):
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0.2, window=10)
+
+        self.assertEqual(sum(budget.try_retry("a") for _ in range(5)), 2)
+        self.assertTrue(budget.try_retry("b"))
+
+    def test_window_slides(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window=10)
+        for _ in range(4):
+            budget.record_success("a")
+        self.assertTrue(budget.try_retry("a"))
+        self.assertTrue(budget.try_retry("a"))
+        self.assertFalse(budget.try_retry("a"))
+
+        self.clock.current += 11
+        self.assertFalse(budget.try_retry("a"))
+        budget.record_success("a")
+        budget.record_success("a")
+        self.assertTrue(budget.try_retry("a"))
+        self.assertEqual(budget.metrics()["a"]["successes"], 2)
+
+
+class TestRateLimitedRetryBudget(unittest.TestCase):
+    def test_fails_fast_when_budget_exhausted(self):
+        session = FakeSession(lambda url: 429)
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0.1, window=10)
+        client = RateLimitedNetworking(max_retries=3, max_requests_per_second=None, timeout=0, retry_budget=budget)
+
+        with patch("jm_networking._get_session", return_value=session), patch("jm_networking.time.sleep"):
+            with self.assertRaises(TooManyRequestsError) as first:
+                client.get("https://api.example.com/a")
+            with self.assertRaises(TooManyRequestsError) as second:
+                client.get("https://api.example.com/b")
+
+        self.assertEqual(first.exception.retries, 1)
+        self.assertEqual(second.exception.retries, 0)
+        self.assertEqual(session.calls, 3)
+        self.assertEqual(client.metrics()["api.example.com"]["rejected"], 2)
+
+    def test_successes_earn_retries_and_budget_is_shared(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window=10)
+        ok = RateLimitedNetworking(max_requests_per_second=None, retry_budget=budget)
+        limited = RateLimitedNetworking(max_retries=5, max_requests_per_second=None, timeout=0, retry_budget=budget)
+        session = FakeSession(lambda url: 429 if url.endswith("/limited") else 200)
+
+        with patch("jm_networking._get_session", return_value=session), patch("jm_networking.time.sleep"):
+            for _ in range(4):
+                ok.get("https://api.example.com/ok")
+            with self.assertRaises(TooManyRequestsError) as raised:
+                limited.get("https://api.example.com/limited")
+
+        self.assertEqual(raised.exception.retries, 2)
+        self.assertEqual(limited.metrics()["api.example.com"]["retried"], 2)
+
+    def test_server_errors_do_not_earn_retries(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window=10)
+        client = RateLimitedNetworking(max_requests_per_second=None, retry_budget=budget)
+        session = FakeSession(lambda url: 503)
+
+        with patch("jm_networking._get_session", return_value=session):
+            for _ in range(4):
+                with self.assertRaises(ServiceUnavailableError):
+                    client.get("https://api.example.com/down")
+
+        self.assertEqual(client.metrics(), {})
+
+    def test_no_budget_means_no_metrics(self):
+        self.assertEqual(RateLimitedNetworking().metrics(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+
+from jm_networking import AsyncNetworking, LoadShedError, NetworkError, PriorityClass, RequestScheduler
+
+
+class FakeResponse:
+    status = 200
+    headers = {}
+
+    async def text(self):
+        return "ok"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class GatedSession:
+    """Requests block until ``release`` is called; the order they started in is recorded."""
+
+    closed = False
+
+    def __init__(self):
+        self.started = []
+        self.gate = asyncio.Event()
+
+    def request(self, method, url, **kwargs):
+        session = self
+
+        class Call:
+            async def __aenter__(self):
+                session.started.append(url)
+                await session.gate.wait()
+                return FakeResponse()
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return False
+
+        return Call()
+
+
+def classes(**overrides):
+    user = PriorityClass("user", priority=0, **overrides.get("user", {}))
+    bulk = PriorityClass("bulk", priority=10, **overrides.get("bulk", {}))
+    return [user, bulk]
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_higher_priority_served_first(self):
+        scheduler = RequestScheduler(max_concurrency=1, classes=classes(), default="bulk")
+        session = GatedSession()
+        client = AsyncNetworking(session=session, scheduler=scheduler)
+
+        first = asyncio.create_task(client.get("/bulk-0"))
+        await asyncio.sleep(0)
+        queued = [asyncio.create_task(client.get(f"/bulk-{i}")) for i in (1, 2)]
+        queued.append(asyncio.create_task(client.get("/user", priority="user")))
+        await asyncio.sleep(0.01)
+        self.assertEqual(scheduler.stats()["classes"]["bulk"]["queued"], 2)
+
+        session.gate.set()
+        await asyncio.gather(first, *queued)
+
+        self.assertEqual(session.started, ["/bulk-0", "/user", "/bulk-1", "/bulk-2"])
+        self.assertEqual(scheduler.active, 0)
+
+    async def test_per_class_cap_leaves_room_for_others(self):
+        scheduler = RequestScheduler(max_concurrency=4, classes=classes(bulk={"max_concurrency": 1}), default="bulk")
+        session = GatedSession()
+        client = AsyncNetworking(session=session, scheduler=scheduler)
+
+        tasks = [asyncio.create_task(client.get(f"/bulk-{i}")) for i in range(3)]
+        tasks.append(asyncio.create_task(client.get("/user", priority="user")))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(session.started, ["/bulk-0", "/user"])
+        session.gate.set()
+        await asyncio.gather(*tasks)
+
+    async def test_full_queue_sheds_immediately(self):
+        scheduler = RequestScheduler(max_concurrency=1, classes=classes(bulk={"max_queue": 1}), default="bulk")
+        session = GatedSession()
+        client = AsyncNetworking(session=session, scheduler=scheduler)
+
+        running = [asyncio.create_task(client.get(f"/bulk-{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+        with self.assertRaises(LoadShedError) as raised:
+            await client.get("/bulk-2")
+
+        self.assertIsInstance(raised.exception, NetworkError)
+        self.assertEqual((raised.exception.priority, raised.exception.reason), ("bulk", "queue_full"))
+        session.gate.set()
+        await asyncio.gather(*running)
+        self.assertEqual(scheduler.stats()["classes"]["bulk"]["shed"], 1)
+
+    async def test_queue_wait_deadline(self):
+        scheduler = RequestScheduler(max_concurrency=1, classes=classes(user={"max_wait": 0.02}), default="bulk")
+        session = GatedSession()
+        client = AsyncNetworking(session=session, scheduler=scheduler)
+
+        running = asyncio.create_task(client.get("/bulk"))
+        await asyncio.sleep(0)
+        with self.assertRaises(LoadShedError) as raised:
+            await client.get("/user", priority="user")
+
+        self.assertEqual(raised.exception.reason, "deadline")
+        stats = scheduler.stats()["classes"]["user"]
+        self.assertEqual((stats["expired"], stats["queued"]), (1, 0))
+        session.gate.set()
+        await running
+        self.assertEqual(scheduler.active, 0)
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        session = GatedSession()
+        client = AsyncNetworking(session=session, scheduler=scheduler)
+
+        running = asyncio.create_task(client.get("/a"))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(client.get("/b", priority="low"))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+
+        self.assertEqual(scheduler.stats()["classes"]["low"]["queued"], 0)
+        session.gate.set()
+        await running
+        self.assertEqual(session.started, ["/a"])
+
+    async def test_unknown_priority(self):
+        with self.assertRaises(ValueError):
+            await RequestScheduler().acquire("urgent")
+
+
+if __name__ == "__main__":
+    unittest.main()
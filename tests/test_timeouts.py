@@ -0,0 +1,169 @@
+import asyncio
+import gzip
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import jm_networking as jmn
+from jm_networking import (
+    AsyncNetworking,
+    JmNetwork,
+    NetworkTimeoutError,
+    RateLimitedNetworking,
+    Timeout,
+    TimeoutPolicy,
+    set_timeout_policy,
+)
+from jm_networking.transport import RequestsTransport
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/stall":
+            time.sleep(0.5)
+        body = b"ok"
+        self.send_response(200)
+        if self.path == "/stall-body-gzip":
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.path.startswith("/stall-body"):
+            self.wfile.flush()
+            time.sleep(0.5)
+        if self.path == "/trickle":
+            for _ in range(2):
+                time.sleep(0.15)
+                self.wfile.write(b"o")
+                self.wfile.flush()
+            return
+        self.wfile.write(body)
+
+
+class FakeSession:
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        response = type("Response", (), {"status_code": 200, "text": "ok", "headers": {}})()
+        return response
+
+
+class TestTimeoutPolicy(unittest.TestCase):
+    def test_defaults_are_bounded(self):
+        policy = TimeoutPolicy()
+        self.assertEqual(policy.default, Timeout(connect=10.0, read=60.0, total=None))
+
+    def test_host_overrides_inherit_unset_phases(self):
+        policy = TimeoutPolicy(connect=2, read=5, hosts={"slow.example.com": {"read": 30}, "api.example.com:8443": 1})
+
+        self.assertEqual(policy.for_url("https://slow.example.com/x"), Timeout(2, 30, None))
+        self.assertEqual(policy.for_url("https://api.example.com:8443/x"), Timeout(2, 5, 1))
+        self.assertEqual(policy.for_url("https://api.example.com/x"), Timeout(2, 5, None))
+
+    def test_transport_conversions(self):
+        timeout = Timeout(connect=1, read=2, total=3)
+        urllib3_timeout = RequestsTransport().request_timeout(timeout)
+        self.assertEqual((urllib3_timeout.connect_timeout, urllib3_timeout.total), (1, 3))
+
+        client_timeout = timeout.for_aiohttp()
+        self.assertEqual((client_timeout.total, client_timeout.sock_connect, client_timeout.sock_read), (3, 1, 2))
+
+    def test_sync_requests_get_policy_unless_caller_sets_timeout(self):
+        session = FakeSession()
+        with patch("jm_networking._get_session", return_value=session), \
+                patch("jm_networking._TIMEOUT_POLICY", TimeoutPolicy(connect=1, read=2)):
+            JmNetwork.get("http://example.com/")
+            JmNetwork.get("http://example.com/", timeout=7)
+            RateLimitedNetworking(max_requests_per_second=None, timeout_policy=Timeout(read=9)).get("http://example.com/")
+
+        self.assertEqual((session.timeouts[0].connect_timeout, session.timeouts[0].read_timeout), (1, 2))
+        self.assertEqual(session.timeouts[1], 7)
+        self.assertEqual((session.timeouts[2].connect_timeout, session.timeouts[2].read_timeout), (1, 9))
+
+    def test_set_timeout_policy(self):
+        previous = jmn._TIMEOUT_POLICY
+        try:
+            policy = set_timeout_policy(Timeout(read=3))
+            self.assertEqual(policy.default, Timeout(10.0, 3, None))
+            self.assertIs(jmn._TIMEOUT_POLICY, policy)
+            self.assertEqual(set_timeout_policy(None).default, TimeoutPolicy().default)
+        finally:
+            jmn._TIMEOUT_POLICY = previous
+
+
+class LiveServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class TestTimeoutsAgainstServer(LiveServerTestCase):
+    def test_sync_read_timeout(self):
+        with patch("jm_networking._TIMEOUT_POLICY", TimeoutPolicy(read=0.1)):
+            with self.assertRaises(NetworkTimeoutError):
+                JmNetwork.get(self.base + "/stall")
+            self.assertEqual(JmNetwork.get(self.base + "/fast"), (200, "ok"))
+
+    def test_sync_read_timeout_in_body(self):
+        with patch("jm_networking._TIMEOUT_POLICY", TimeoutPolicy(read=0.2)):
+            for path in ("/stall-body", "/stall-body-gzip"):
+                with self.assertRaises(NetworkTimeoutError, msg=path):
+                    JmNetwork.get(self.base + path)
+
+    def test_sync_per_host_override(self):
+        host = self.base.split("//", 1)[1]
+        policy = TimeoutPolicy(read=0.1, hosts={host: {"read": 2}})
+        with patch("jm_networking._TIMEOUT_POLICY", policy):
+            self.assertEqual(JmNetwork.get(self.base + "/stall"), (200, "ok"))
+
+    def test_async_read_and_total_timeouts(self):
+        async def run():
+            client = AsyncNetworking(timeout=TimeoutPolicy(read=0.1))
+            totals = AsyncNetworking(timeout=Timeout(total=0.2))
+            errors = []
+            try:
+                for current, path in ((client, "/stall"), (totals, "/trickle")):
+                    try:
+                        await current.get(self.base + path)
+                    except NetworkTimeoutError:
+                        errors.append(path)
+                ok = await client.get(self.base + "/fast")
+            finally:
+                await client.close()
+                await totals.close()
+            return errors, ok
+
+        errors, ok = asyncio.run(run())
+        self.assertEqual(errors, ["/stall", "/trickle"])
+        self.assertEqual(ok, (200, "ok"))
+
+    def test_async_per_host_override(self):
+        host = self.base.split("//", 1)[1]
+
+        async def run():
+            async with AsyncNetworking(timeout=TimeoutPolicy(read=2, hosts={host: {"read": 0.1}})) as client:
+                await client.get(self.base + "/stall")
+
+        with self.assertRaises(NetworkTimeoutError):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import json
+import threading
+import unittest
+
+import jm_networking as jmn
+from jm_networking import (
+    AsyncNetworking,
+    Http2Transport,
+    JmNetwork,
+    NetworkTimeoutError,
+    NotFoundError,
+    RequestsTransport,
+    TransportError,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+SENT = []
+
+
+async def chunks():
+    for chunk in (b"ab", b"cd", b"ef"):
+        SENT.append(chunk)
+        yield chunk
+
+
+def handler(request):
+    if request.url.path == "/chunks":
+        return httpx.Response(200, content=chunks())
+    if request.url.path == "/missing":
+        return httpx.Response(404, text="not found")
+    if request.url.path == "/slow":
+        raise httpx.ReadTimeout("timed out", request=request)
+    if request.url.path == "/down":
+        raise httpx.ConnectError("refused", request=request)
+    if request.method == "POST":
+        return httpx.Response(201, json={"echo": json.loads(request.content)})
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+class TestTransportSelection(unittest.TestCase):
+    def tearDown(self):
+        jmn.set_transport("requests")
+
+    def test_default_transport_is_requests(self):
+        self.assertIsInstance(jmn._TRANSPORT, RequestsTransport)
+
+    def test_unknown_transport_rejected(self):
+        with self.assertRaises(ValueError):
+            jmn.set_transport("carrier-pigeon")
+
+    def test_set_transport_replaces_session(self):
+        old = jmn._get_session()
+        jmn.set_transport("requests")
+
+        self.assertIsNot(jmn._get_session(), old)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2TransportSync(unittest.TestCase):
+    def setUp(self):
+        jmn.set_transport(Http2Transport(transport=httpx.MockTransport(handler)))
+
+    def tearDown(self):
+        jmn.set_transport("requests")
+
+    def test_get_and_post(self):
+        status, payload = JmNetwork.get("https://example.com/todos", is_json=True)
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"path": "/todos"})
+
+        status, text = JmNetwork.post("https://example.com/todos", json={"a": 1})
+        self.assertEqual(status, 201)
+        self.assertEqual(json.loads(text), {"echo": {"a": 1}})
+
+    def test_threads_share_one_client(self):
+        session = jmn._get_session()
+        clients = []
+
+        def fetch():
+            JmNetwork.get("https://example.com/todos")
+            clients.append(session.client)
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(client) for client in clients}), 1)
+        session.close()
+        self.assertTrue(clients[0].is_closed)
+
+    def test_stream_reads_body_lazily(self):
+        SENT.clear()
+        response = jmn._get_session().get("https://example.com/chunks", stream=True)
+
+        self.assertEqual(SENT, [])
+        self.assertEqual(list(response.iter_content(2)), [b"ab", b"cd", b"ef"])
+        response.close()
+
+    def test_errors_map_to_library_exceptions(self):
+        with self.assertRaises(NotFoundError):
+            JmNetwork.get("https://example.com/missing")
+        with self.assertRaises(NetworkTimeoutError):
+            JmNetwork.get("https://example.com/slow")
+        with self.assertRaises(TransportError):
+            JmNetwork.get("https://example.com/down")
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2TransportAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_get_and_errors(self):
+        transport = Http2Transport(transport=httpx.MockTransport(handler))
+        async with AsyncNetworking(transport=transport) as client:
+            status, payload = await client.get("https://example.com/todos", is_json=True)
+            self.assertEqual(status, 200)
+            self.assertEqual(payload, {"path": "/todos"})
+
+            with self.assertRaises(NotFoundError):
+                await client.get("https://example.com/missing")
+            with self.assertRaises(NetworkTimeoutError):
+                await client.get("https://example.com/slow")
+            with self.assertRaises(TransportError):
+                await client.get("https://example.com/down")
+
+    async def test_stream_reads_body_lazily(self):
+        SENT.clear()
+        transport = Http2Transport(transport=httpx.MockTransport(handler))
+        async with AsyncNetworking(transport=transport) as client:
+            async with client._stream("GET", "https://example.com/chunks") as response:
+                self.assertEqual(SENT, [])
+                body = [chunk async for chunk in response.content.iter_chunked(2)]
+
+        self.assertEqual(body, [b"ab", b"cd", b"ef"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+import jm_networking as jmn
+from jm_networking import AsyncNetworking, JmNetwork, NotFoundError
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def address_string(self):
+        return "unix"
+
+    def do_GET(self):
+        if self.path == "/missing":
+            self._send(404, b"not found")
+            return
+        body = json.dumps({"path": self.path, "host": self.headers.get("Host")}).encode("utf-8")
+        self._send(200, body)
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+class UnixServerMixin:
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.tmpdir.name, "sidecar.sock")
+        cls.server = UnixHTTPServer(cls.socket_path, Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+        cls.tmpdir.cleanup()
+
+
+class TestSyncUnixSocket(UnixServerMixin, unittest.TestCase):
+    def setUp(self):
+        jmn.set_transport("requests")
+        jmn.mount_unix_socket("sidecar", self.socket_path)
+
+    def tearDown(self):
+        jmn.set_transport("requests")
+
+    def test_get_over_unix_socket(self):
+        status, payload = JmNetwork.get("http://sidecar/todos/1", is_json=True)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"path": "/todos/1", "host": "sidecar"})
+
+    def test_connections_are_reused(self):
+        JmNetwork.get("http://sidecar/a")
+        JmNetwork.get("http://sidecar/b")
+
+        adapter = jmn._get_session().get_adapter("http://sidecar/")
+        pool = adapter._pools["sidecar"]
+        self.assertEqual(pool.num_connections, 1)
+
+    def test_errors_still_raised(self):
+        with self.assertRaises(NotFoundError):
+            JmNetwork.get("http://sidecar/missing")
+
+
+class TestAsyncUnixSocket(UnixServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_get_over_unix_socket(self):
+        async with AsyncNetworking(unix_sockets={"sidecar": self.socket_path}) as client:
+            status, payload = await client.get("http://sidecar/todos/2", is_json=True)
+            with self.assertRaises(NotFoundError):
+                await client.get("http://sidecar/missing")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"path": "/todos/2", "host": "sidecar"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jm_networking import AsyncNetworking, JmNetwork, ObjectNetworking, UploadBody
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        chunked = self.headers.get("Transfer-Encoding") == "chunked"
+        body = self._read_chunked() if chunked else self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = json.dumps({
+            "method": self.command,
+            "length": len(body),
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "chunked": chunked,
+            "content_length": self.headers.get("Content-Length"),
+            "content_type": self.headers.get("Content-Type"),
+            "trace": self.headers.get("X-Trace"),
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_PUT = do_POST
+
+    def _read_chunked(self):
+        body = bytearray()
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return bytes(body)
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+
+@dataclass
+class Todo:
+    title: str
+
+
+class LocalServerMixin:
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/upload"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.data = os.urandom(300_000)
+        cls.path = os.path.join(cls.tmpdir.name, "blob.bin")
+        with open(cls.path, "wb") as file:
+            file.write(cls.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+        cls.tmpdir.cleanup()
+
+    def assertReceived(self, received, chunked=False):
+        self.assertEqual(received["length"], len(self.data))
+        self.assertEqual(received["sha256"], hashlib.sha256(self.data).hexdigest())
+        self.assertEqual(received["chunked"], chunked)
+
+
+class TestUploadBody(unittest.TestCase):
+    def test_buffer_chunks_are_views(self):
+        data = bytearray(b"x" * 10)
+        chunks = list(UploadBody(data, chunk_size=4))
+
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_length_known_only_for_sized_sources(self):
+        self.assertEqual(UploadBody(b"abc").headers, {"Content-Length": "3"})
+        self.assertEqual(UploadBody(iter([b"abc"])).headers, {})
+
+    def test_rejects_non_positive_chunk_size(self):
+        with self.assertRaises(ValueError):
+            UploadBody(b"abc", chunk_size=0)
+
+
+class TestSyncUpload(LocalServerMixin, unittest.TestCase):
+    def test_file_path_with_progress(self):
+        progress = []
+
+        status, text = JmNetwork.upload(self.url, self.path, chunk_size=65536, progress=lambda sent, total: progress.append((sent, total)))
+
+        received = json.loads(text)
+        self.assertEqual(status, 200)
+        self.assertReceived(received)
+        self.assertEqual(received["content_length"], str(len(self.data)))
+        self.assertEqual(received["content_type"], "application/octet-stream")
+        self.assertEqual(len(progress), 5)
+        self.assertEqual(progress[-1], (len(self.data), len(self.data)))
+
+    def test_mmap_and_memoryview(self):
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            _, text = JmNetwork.upload(self.url, mapped, method="put")
+        self.assertReceived(json.loads(text))
+        self.assertEqual(json.loads(text)["method"], "PUT")
+
+        _, text = JmNetwork.upload(self.url, memoryview(self.data))
+        self.assertReceived(json.loads(text))
+
+    def test_generator_is_sent_chunked(self):
+        def chunks():
+            for start in range(0, len(self.data), 100_000):
+                yield self.data[start:start + 100_000]
+
+        _, text = JmNetwork.upload(self.url, chunks())
+
+        self.assertReceived(json.loads(text), chunked=True)
+
+    def test_object_networking_passes_kwargs(self):
+        response = ObjectNetworking.post(Todo("a"), self.url, None, headers={"X-Trace": "abc"})
+
+        self.assertEqual(response.json()["trace"], "abc")
+
+
+class TestAsyncUpload(LocalServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_file_path(self):
+        progress = []
+        async with AsyncNetworking() as client:
+            status, received = await client.upload(
+                self.url, self.path, is_json=True, progress=lambda sent, total: progress.append(sent)
+            )
+
+        self.assertEqual(status, 200)
+        self.assertReceived(received)
+        self.assertEqual(progress[-1], len(self.data))
+
+    async def test_async_iterator_is_sent_chunked(self):
+        async def chunks():
+            for start in range(0, len(self.data), 100_000):
+                yield self.data[start:start + 100_000]
+
+        async with AsyncNetworking() as client:
+            _, received = await client.upload(self.url, chunks(), is_json=True)
+
+        self.assertReceived(received, chunked=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
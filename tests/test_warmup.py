@@ -0,0 +1,138 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jm_networking as jmn
+from jm_networking import AsyncNetworking, JmNetwork
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_HEAD(self):
+        with self.server.lock:
+            self.server.heads += 1
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.heads = 0
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class LocalServerMixin:
+    def setUp(self):
+        self.server = CountingServer(("127.0.0.1", 0), Handler)
+        self.host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class TestSyncWarmup(LocalServerMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        jmn.set_transport("requests")
+
+    def tearDown(self):
+        JmNetwork.stop_keepalive()
+        jmn.set_transport("requests")
+        super().tearDown()
+
+    def test_warmup_parks_connections_for_reuse(self):
+        warmed = JmNetwork.warmup([self.host], connections=3)
+
+        self.assertEqual(warmed, {self.host + "/": 3})
+        self.assertTrue(wait_for(lambda: self.server.connections == 3))
+        for _ in range(3):
+            JmNetwork.get(self.host + "/")
+        self.assertEqual(self.server.connections, 3)
+
+    def test_warmup_is_idempotent(self):
+        JmNetwork.warmup([self.host], connections=2)
+        warmed = JmNetwork.warmup([self.host], connections=2)
+
+        self.assertEqual(warmed, {self.host + "/": 2})
+        self.assertTrue(wait_for(lambda: self.server.connections == 2))
+        time.sleep(0.05)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_unreachable_host_is_logged_not_raised(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = CountingServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        with self.assertLogs("jm_networking.warmup", level="WARNING"):
+            warmed = JmNetwork.warmup([self.host], connections=1)
+
+        self.assertEqual(warmed, {self.host + "/": 0})
+
+    def test_refresher_pings_idle_connections(self):
+        JmNetwork.warmup([self.host], connections=2, keepalive_interval=0.02)
+
+        self.assertTrue(wait_for(lambda: self.server.heads >= 4))
+        JmNetwork.stop_keepalive()
+        self.assertEqual(self.server.connections, 2)
+
+
+class TestAsyncWarmup(LocalServerMixin, unittest.IsolatedAsyncioTestCase):
+    async def test_warmup_parks_connections_for_reuse(self):
+        async with AsyncNetworking() as client:
+            warmed = await client.warmup([self.host], connections=2)
+            for _ in range(2):
+                await client.get(self.host + "/")
+
+        self.assertEqual(warmed, {self.host + "/": 2})
+        self.assertEqual(self.server.connections, 2)
+
+    async def test_keepalive_task_stops_on_close(self):
+        import asyncio
+
+        async with AsyncNetworking() as client:
+            await client.warmup([self.host], connections=1, keepalive_interval=0.02)
+            task = client._keepalive_task
+            while self.server.heads < 3:
+                await asyncio.sleep(0.01)
+
+        self.assertIsNone(client._keepalive_task)
+        self.assertTrue(task.cancelled() or task.done())
+
+
+if __name__ == "__main__":
+    unittest.main()